@@ -1,5 +1,6 @@
 from analytics.dashboard import (
     DashboardInstrument,
+    DashboardPortfolio,
     aggregate_portfolio,
     compare_scenarios,
     filter_instruments,
@@ -13,6 +14,7 @@ from analytics.dashboard_ui import build_portfolio_tree, ladder_rows, scenario_m
 
 __all__ = [
     "DashboardInstrument",
+    "DashboardPortfolio",
     "aggregate_portfolio",
     "compare_scenarios",
     "filter_instruments",
@@ -8,20 +8,17 @@ from pathlib import Path
 
 import numpy as np
 
+from engine.scenario import curve_cache
 from io_layer.loaders import _parse_product_row
 from models.curve import DeterministicZeroCurve
 from models.market import DeterministicForwardCurve
+from products.amortization import level_payment
 from products.base import Product
+from products.conventions import REPAYMENT_TYPE_CODES, RepaymentType
 from products.corporate_bond import CorporateBond
 
 
 _MORTGAGE_FREQ_TO_MONTHS = {"monthly": 1, "quarterly": 3, "annual": 12}
-_BOND_FREQ_TO_YEARS = {
-    "monthly": 1.0 / 12.0,
-    "quarterly": 0.25,
-    "semi_annual": 0.5,
-    "annual": 1.0,
-}
 
 
 @dataclass(frozen=True)
@@ -35,7 +32,21 @@ class DashboardInstrument:
     metadata: dict[str, str] = field(default_factory=dict)
 
 
-def load_dashboard_portfolio_csv(path: str | Path) -> list[DashboardInstrument]:
+class DashboardPortfolio(list[DashboardInstrument]):
+    """Instrument list with an ``instrument_id`` index built once at load time.
+
+    ``by_id`` maps each id to its first instrument; it is not updated if the list is mutated.
+    """
+
+    def __init__(self, instruments: list[DashboardInstrument]) -> None:
+        super().__init__(instruments)
+        by_id: dict[str, DashboardInstrument] = {}
+        for item in self:
+            by_id.setdefault(item.instrument_id, item)
+        self.by_id = by_id
+
+
+def load_dashboard_portfolio_csv(path: str | Path) -> DashboardPortfolio:
     items: list[DashboardInstrument] = []
     with Path(path).open("r", encoding="utf-8", newline="") as f:
         reader = csv.DictReader(f)
@@ -63,7 +74,7 @@ def load_dashboard_portfolio_csv(path: str | Path) -> list[DashboardInstrument]:
                     metadata=metadata,
                 )
             )
-    return items
+    return DashboardPortfolio(items)
 
 
 def make_parallel_shift_scenario(
@@ -212,6 +223,22 @@ def instrument_metadata(item: DashboardInstrument, scenario: dict) -> dict[str,
 
 
 def aggregate_portfolio(instruments: list[DashboardInstrument], scenario: dict) -> dict:
+    return _aggregate_portfolio(instruments, scenario)[0]
+
+
+def _aggregate_portfolio(
+    instruments: list[DashboardInstrument],
+    scenario: dict,
+) -> tuple[dict, list[float], list[float]]:
+    """Portfolio aggregate plus per-instrument PV and prepayment, in instrument order."""
+    with curve_cache(scenario) as cached:
+        return _aggregate_portfolio_uncached(instruments, cached)
+
+
+def _aggregate_portfolio_uncached(
+    instruments: list[DashboardInstrument],
+    scenario: dict,
+) -> tuple[dict, list[float], list[float]]:
     total_exposure = 0.0
     w_coupon = 0.0
     w_maturity = 0.0
@@ -223,6 +250,8 @@ def aggregate_portfolio(instruments: list[DashboardInstrument], scenario: dict)
     cashflow_by_time: dict[float, dict[str, float]] = {}
     prepayment_distribution: list[dict[str, float | str]] = []
     maturity_ladder: dict[str, float] = {}
+    instrument_pvs: list[float] = []
+    instrument_prepayments: list[float] = []
 
     for item in instruments:
         notional = instrument_notional(item)
@@ -271,6 +300,8 @@ def aggregate_portfolio(instruments: list[DashboardInstrument], scenario: dict)
             slot["total"] += total
 
         prepayment_total += prepay_item
+        instrument_pvs.append(pv)
+        instrument_prepayments.append(prepay_item)
         prepayment_distribution.append({"instrument_id": item.instrument_id, "prepayment_amount": prepay_item})
         if abs(pv_item) > 1e-12:
             duration_num += d_item
@@ -280,7 +311,7 @@ def aggregate_portfolio(instruments: list[DashboardInstrument], scenario: dict)
     convexity = convexity_num / total_pv if abs(total_pv) > 1e-12 else 0.0
     prepay_rate = prepayment_total / total_exposure if total_exposure > 1e-12 else 0.0
 
-    return {
+    aggregate = {
         "metrics": {
             "total_exposure": total_exposure,
             "weighted_average_coupon": (w_coupon / total_exposure if total_exposure > 1e-12 else 0.0),
@@ -294,6 +325,7 @@ def aggregate_portfolio(instruments: list[DashboardInstrument], scenario: dict)
         "maturity_ladder": maturity_ladder,
         "prepayment_distribution": sorted(prepayment_distribution, key=lambda x: float(x["prepayment_amount"]), reverse=True),
     }
+    return aggregate, instrument_pvs, instrument_prepayments
 
 
 def compare_scenarios(
@@ -301,14 +333,13 @@ def compare_scenarios(
     base_scenario: dict,
     shocked_scenario: dict,
 ) -> dict:
-    base = aggregate_portfolio(instruments, base_scenario)
-    shocked = aggregate_portfolio(instruments, shocked_scenario)
+    # Per-instrument PVs and prepayments come from the aggregation pass; nothing is revalued twice.
+    base, base_pvs, base_prepays = _aggregate_portfolio(instruments, base_scenario)
+    shocked, shocked_pvs, shocked_prepays = _aggregate_portfolio(instruments, shocked_scenario)
     instrument_deltas: list[dict[str, float | str]] = []
-    for item in instruments:
-        base_pv = float(item.product.present_value(base_scenario))
-        shocked_pv = float(item.product.present_value(shocked_scenario))
-        base_prepay = sum(float(r["prepayment"]) for r in instrument_cashflow_rows(item, base_scenario))
-        shocked_prepay = sum(float(r["prepayment"]) for r in instrument_cashflow_rows(item, shocked_scenario))
+    for item, base_pv, shocked_pv, base_prepay, shocked_prepay in zip(
+        instruments, base_pvs, shocked_pvs, base_prepays, shocked_prepays
+    ):
         instrument_deltas.append(
             {
                 "instrument_id": item.instrument_id,
@@ -360,40 +391,50 @@ def _is_mortgage_like(product: Product) -> bool:
     return all(hasattr(product, attr) for attr in required)
 
 
-def _resolve_annual_cpr(
+def _resolve_annual_cprs(
     prepayment_model: object | None,
     *,
     fixed_rate: float,
-    refinance_rate: float,
-    age_years: float,
+    refinance_rates: np.ndarray,
+    age_years: np.ndarray,
     maturity_years: float,
-    month_index: int,
-) -> float:
+    month_indices: np.ndarray,
+) -> np.ndarray:
+    """Annual CPR per period, using the model's array path when it has one."""
     if prepayment_model is None:
-        return 0.0
-    annual_cpr_fn = getattr(prepayment_model, "annual_cpr", None)
-    if callable(annual_cpr_fn):
-        return float(
-            annual_cpr_fn(
+        return np.zeros(len(age_years))
+    batch_fn = getattr(prepayment_model, "batch_annual_cpr", None)
+    if callable(batch_fn):
+        return np.asarray(
+            batch_fn(
                 fixed_rate=fixed_rate,
-                refinance_rate=refinance_rate,
+                refinance_rates=refinance_rates,
                 age_years=age_years,
                 maturity_years=maturity_years,
-                month_index=month_index,
-            )
+                month_indices=month_indices,
+            ),
+            dtype=float,
         )
-    cpr_fn = getattr(prepayment_model, "cpr", None)
-    if callable(cpr_fn):
-        return float(
-            cpr_fn(
-                fixed_rate=fixed_rate,
-                refinance_rate=refinance_rate,
-                age_years=age_years,
-                maturity_years=maturity_years,
-                month_index=month_index,
+    cpr_vec_fn = getattr(prepayment_model, "cpr_vec", None)
+    if callable(cpr_vec_fn):
+        return np.asarray(cpr_vec_fn(fixed_rate, refinance_rates, age_years, maturity_years, month_indices), dtype=float)
+    for name in ("annual_cpr", "cpr"):
+        cpr_fn = getattr(prepayment_model, name, None)
+        if callable(cpr_fn):
+            return np.array(
+                [
+                    cpr_fn(
+                        fixed_rate=fixed_rate,
+                        refinance_rate=refinance,
+                        age_years=age,
+                        maturity_years=maturity_years,
+                        month_index=month,
+                    )
+                    for refinance, age, month in zip(refinance_rates.tolist(), age_years.tolist(), month_indices.tolist())
+                ],
+                dtype=float,
             )
-        )
-    return 0.0
+    return np.zeros(len(age_years))
 
 
 def _mortgage_like_rows(loan: Product, scenario: dict) -> list[dict[str, float]]:
@@ -403,7 +444,8 @@ def _mortgage_like_rows(loan: Product, scenario: dict) -> list[dict[str, float]]
     maturity_years = float(getattr(loan, "maturity_years"))
     fixed_rate = float(getattr(loan, "fixed_rate"))
     notional = float(getattr(loan, "notional"))
-    repayment_type = str(getattr(loan, "repayment_type"))
+    # Unknown repayment types fall through to the remaining-term branch below.
+    repayment_code = REPAYMENT_TYPE_CODES.get(str(getattr(loan, "repayment_type")), -1)
     interest_only_years = float(getattr(loan, "interest_only_years", 0.0))
     start_month = int(getattr(loan, "start_month", 1))
     day_count = str(getattr(loan, "day_count", "30/360")).upper()
@@ -416,50 +458,50 @@ def _mortgage_like_rows(loan: Product, scenario: dict) -> list[dict[str, float]]
     rate_per_period = fixed_rate * dt
     interest_only_periods = int(round(interest_only_years * 12 / months_per_period))
     amort_periods = periods - interest_only_periods
-    if amort_periods <= 0:
-        annuity_payment = 0.0
-    elif rate_per_period == 0.0:
-        annuity_payment = notional / amort_periods
-    else:
-        annuity_payment = notional * rate_per_period / (1.0 - (1.0 + rate_per_period) ** (-amort_periods))
+    annuity_payment = level_payment(notional, rate_per_period, amort_periods)
     const_principal = 0.0
-    if repayment_type == "constant_repayment":
+    if repayment_code == RepaymentType.CONSTANT_REPAYMENT:
         amort_periods = max(1, periods - interest_only_periods)
         const_principal = notional / amort_periods
 
+    # Behavioural inputs do not depend on the balance, so CPR and SMM are evaluated for all
+    # periods up front and only the balance recursion stays sequential.
+    age_years = np.arange(periods) * dt
+    month_indices = (start_month - 1 + np.arange(periods)) % 12 + 1
+    refinance_rates = np.zeros(periods)
+    if prepayment_model is not None and periods > 0:
+        # Refinancing is priced over the remaining term; every period starts before maturity.
+        refinance_rates = model.forward_rates(age_years, np.full(periods, maturity_years))
+    annual_cprs = _resolve_annual_cprs(
+        prepayment_model,
+        fixed_rate=fixed_rate,
+        refinance_rates=refinance_rates,
+        age_years=age_years,
+        maturity_years=maturity_years,
+        month_indices=month_indices,
+    )
+    smms = (1.0 - (1.0 - np.maximum(0.0, annual_cprs)) ** max(1e-8, dt)).tolist()
+
     rows: list[dict[str, float]] = []
     balance = notional
     for i in range(1, periods + 1):
         if balance <= 1e-8:
             break
-        t0 = (i - 1) * dt
         t1 = i * dt
         interest = balance * rate_per_period
 
         if i <= interest_only_periods:
             scheduled = 0.0
-        elif repayment_type == "annuity":
+        elif repayment_code == RepaymentType.ANNUITY:
             scheduled = max(0.0, annuity_payment - interest)
-        elif repayment_type == "constant_repayment":
+        elif repayment_code == RepaymentType.CONSTANT_REPAYMENT:
             scheduled = const_principal
         else:
             remaining_periods = max(1, periods - i + 1)
             scheduled = balance / remaining_periods
         scheduled = min(balance, scheduled)
         post_sched = balance - scheduled
-        remaining = max(1e-6, maturity_years - t0)
-        refinance = model.forward_rate(t0, min(maturity_years, t0 + remaining))
-        month = ((start_month - 1) + i - 1) % 12 + 1
-        annual_cpr = _resolve_annual_cpr(
-            prepayment_model,
-            fixed_rate=fixed_rate,
-            refinance_rate=refinance,
-            age_years=t0,
-            maturity_years=maturity_years,
-            month_index=month,
-        )
-        smm = 1.0 - (1.0 - max(0.0, annual_cpr)) ** max(1e-8, dt)
-        prepay = post_sched * smm
+        prepay = post_sched * smms[i - 1]
         prepay = min(post_sched, prepay)
         end_balance = post_sched - prepay
 
@@ -480,8 +522,8 @@ def _mortgage_like_rows(loan: Product, scenario: dict) -> list[dict[str, float]]
 def _corporate_bond_rows(bond: CorporateBond, scenario: dict) -> list[dict[str, float]]:
     discount_model = scenario["model"]
     forward_model = scenario.get("forward_model")
-    dt = _BOND_FREQ_TO_YEARS[bond.frequency]
-    periods = int(round(bond.maturity_years / dt))
+    dt = bond._dt
+    periods = bond._periods
     schedule = bond._scheduled_principal(periods)
 
     rows: list[dict[str, float]] = []
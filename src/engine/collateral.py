@@ -4,9 +4,9 @@ from dataclasses import dataclass
 
 import numpy as np
 
-from engine.scenario import Scenario
+from engine.scenario import Scenario, curve_cache
 from models.base import InterestRateModel
-from products.base import Product
+from products.base import Product, portfolio_pv
 
 
 @dataclass(frozen=True)
@@ -40,33 +40,34 @@ class CSADiscountingEngine:
     ) -> dict[str, CSAScenarioResult]:
         results: dict[str, CSAScenarioResult] = {}
 
+        # Netting-set membership does not depend on the scenario; resolve it once.
+        ns_members: dict[str, list[int]] = {}
+        for idx in range(len(self.products)):
+            ns_id = product_to_netting_set.get(idx)
+            if ns_id is not None and ns_id in csa_configs:
+                ns_members.setdefault(ns_id, []).append(idx)
+        ns_products = {ns_id: [self.products[idx] for idx in members] for ns_id, members in ns_members.items()}
+
         for scenario in scenarios:
             base_data = {"model": scenario.model, "name": scenario.name}
             base_data.update(scenario.data)
 
-            unsecured_total = 0.0
-            secured_total = 0.0
+            with curve_cache(base_data) as cached_data:
+                unsecured = portfolio_pv(self.products, cached_data, as_of_date)
+            secured = unsecured.copy()
             per_ns: dict[str, float] = {k: 0.0 for k in csa_configs}
 
-            for idx, product in enumerate(self.products):
-                unsecured_pv = float(product.present_value(base_data, as_of_date))
-                unsecured_total += unsecured_pv
-
-                ns_id = product_to_netting_set.get(idx)
-                if ns_id is None or ns_id not in csa_configs:
-                    secured_pv = unsecured_pv
-                else:
-                    cfg = csa_configs[ns_id]
-                    secured_data = dict(base_data)
-                    secured_data["model"] = cfg.discount_model
-                    secured_pv = float(product.present_value(secured_data, as_of_date))
-                    per_ns[ns_id] += secured_pv
-
-                secured_total += secured_pv
+            for ns_id, members in ns_members.items():
+                secured_data = dict(base_data)
+                secured_data["model"] = csa_configs[ns_id].discount_model
+                with curve_cache(secured_data) as cached_data:
+                    ns_secured = portfolio_pv(ns_products[ns_id], cached_data, as_of_date)
+                secured[members] = ns_secured
+                per_ns[ns_id] = float(ns_secured.sum())
 
             results[scenario.name] = CSAScenarioResult(
-                unsecured_pv=float(unsecured_total),
-                secured_pv=float(secured_total),
+                unsecured_pv=float(unsecured.sum()),
+                secured_pv=float(secured.sum()),
                 netting_set_secured_pv=per_ns,
             )
 
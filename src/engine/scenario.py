@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 
 import numpy as np
@@ -8,6 +10,7 @@ import numpy as np
 from models.base import InterestRateModel
 from models.curve import DeterministicZeroCurve
 from models.hullwhite import HullWhiteModel
+from products.base import CachedModel
 
 
 @dataclass(frozen=True)
@@ -17,6 +20,20 @@ class Scenario:
     data: dict = field(default_factory=dict)
 
 
+@contextmanager
+def curve_cache(data: dict) -> Iterator[dict]:
+    """Yield scenario data whose ``model`` memoizes discount factors until the block exits."""
+    model = data.get("model")
+    if not isinstance(model, InterestRateModel):
+        yield data
+        return
+    cached = CachedModel(model)
+    try:
+        yield {**data, "model": cached}
+    finally:
+        cached.clear()
+
+
 class ScenarioGenerator(ABC):
     """Produces valuation scenarios for the engine."""
 
@@ -31,15 +48,13 @@ class DeterministicScenarioGenerator(ScenarioGenerator):
     shifts_bps: list[float]
 
     def generate(self) -> list[Scenario]:
-        scenarios: list[Scenario] = []
-        for shift in self.shifts_bps:
-            shift_rate = shift / 10_000.0
-            shifted = DeterministicZeroCurve(
-                tenors=np.array(self.base_curve.tenors, dtype=float),
-                zero_rates=np.array(self.base_curve.zero_rates, dtype=float) + shift_rate,
-            )
-            scenarios.append(Scenario(name=f"parallel_shift_{shift:+.0f}bps", model=shifted))
-        return scenarios
+        # One broadcast add builds every shifted rate row.
+        shifted_rates = self.base_curve.zero_rates + (np.asarray(self.shifts_bps, dtype=float) / 10_000.0)[:, None]
+        tenors = self.base_curve.tenors
+        return [
+            Scenario(name=f"parallel_shift_{shift:+.0f}bps", model=DeterministicZeroCurve(tenors=tenors, zero_rates=rates))
+            for shift, rates in zip(self.shifts_bps, shifted_rates)
+        ]
 
 
 @dataclass(frozen=True)
@@ -60,20 +75,18 @@ class DeterministicStressScenarioGenerator(ScenarioGenerator):
         return scenarios
 
     def _twist_scenarios(self) -> list[Scenario]:
-        tenors = np.array(self.base_curve.tenors, dtype=float)
-        zero_rates = np.array(self.base_curve.zero_rates, dtype=float)
+        tenors = self.base_curve.tenors
         max_span = max(np.max(np.abs(tenors - self.twist_pivot_year)), 1e-8)
         slope_profile = np.clip((tenors - self.twist_pivot_year) / max_span, -1.0, 1.0)
-
-        scenarios: list[Scenario] = []
-        for twist in self.twist_shifts_bps:
-            twist_rate = twist / 10_000.0
-            shifted = DeterministicZeroCurve(
-                tenors=tenors,
-                zero_rates=zero_rates + twist_rate * slope_profile,
+        # Rows are twists, columns tenors: rate shifts for all twist scenarios in one outer product.
+        twisted_rates = self.base_curve.zero_rates + np.outer(np.asarray(self.twist_shifts_bps, dtype=float) / 10_000.0, slope_profile)
+        return [
+            Scenario(
+                name=f"twist_{twist:+.0f}bps_pivot_{self.twist_pivot_year:g}y",
+                model=DeterministicZeroCurve(tenors=tenors, zero_rates=rates),
             )
-            scenarios.append(Scenario(name=f"twist_{twist:+.0f}bps_pivot_{self.twist_pivot_year:g}y", model=shifted))
-        return scenarios
+            for twist, rates in zip(self.twist_shifts_bps, twisted_rates)
+        ]
 
 
 @dataclass(frozen=True)
@@ -86,6 +99,7 @@ class HullWhiteMonteCarloScenarioGenerator(ScenarioGenerator):
     n_steps: int
     n_paths: int
     seed: int | None = None
+    antithetic: bool = False
 
     def generate(self) -> list[Scenario]:
         paths = self.model.simulate_short_rate_paths(
@@ -93,16 +107,14 @@ class HullWhiteMonteCarloScenarioGenerator(ScenarioGenerator):
             n_steps=self.n_steps,
             n_paths=self.n_paths,
             seed=self.seed,
+            antithetic=self.antithetic,
         )
         r0 = self.model.short_rate(0.0)
-        terminal = paths[:, -1]
-
-        scenarios: list[Scenario] = []
-        for idx, terminal_rate in enumerate(terminal):
-            shift = terminal_rate - r0
-            shifted_curve = DeterministicZeroCurve(
-                tenors=np.array(self.base_curve.tenors, dtype=float),
-                zero_rates=np.array(self.base_curve.zero_rates, dtype=float) + shift,
-            )
-            scenarios.append(Scenario(name=f"hw_mc_path_{idx:04d}", model=shifted_curve))
-        return scenarios
+        # Every path shifts the whole base curve by its terminal short-rate move; one broadcast
+        # builds all shifted rate rows.
+        shifted_rates = self.base_curve.zero_rates + (paths[:, -1] - r0)[:, None]
+        tenors = self.base_curve.tenors
+        return [
+            Scenario(name=f"hw_mc_path_{idx:04d}", model=DeterministicZeroCurve(tenors=tenors, zero_rates=rates))
+            for idx, rates in enumerate(shifted_rates)
+        ]
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
+from models.base import InterestRateModel
 from models.curve import DeterministicZeroCurve
 from models.market import DeterministicFXCurve, DeterministicForwardCurve, DeterministicHazardCurve
-from products.base import Product
+from products.base import CashflowTimeGrid, Product, portfolio_pv
 
 
 @dataclass
@@ -27,7 +30,10 @@ class DeterministicSensitivityEngine:
         hazard_bump_bps: float = 1.0,
         fx_bump_pct: float = 0.01,
     ) -> SensitivityResult:
-        base_pvs = self._product_pvs(base_scenario, as_of_date)
+        labels = [f"{idx:03d}_{product.__class__.__name__}" for idx, product in enumerate(self.products)]
+        # Bumps keep payment dates, so every reprice reuses the base run's unique-time table.
+        time_grid = CashflowTimeGrid()
+        base_pvs = self._product_pvs(base_scenario, as_of_date, time_grid)
 
         metrics: list[tuple[str, str, float, dict]] = []
         if isinstance(base_scenario.get("model"), DeterministicZeroCurve):
@@ -55,29 +61,22 @@ class DeterministicSensitivityEngine:
         if isinstance(base_scenario.get("fx_curve"), DeterministicFXCurve):
             metrics.append(("FX_DELTA_1PCT", "fx_curve", fx_bump_pct, self._bump_fx_curve(base_scenario, fx_bump_pct)))
 
-        by_product: dict[str, dict[str, float]] = {
-            label: {} for label in base_pvs
-        }
+        by_product: dict[str, dict[str, float]] = {label: {} for label in labels}
         portfolio: dict[str, float] = {}
 
         for metric_name, _source, bump_size, shocked_scenario in metrics:
-            shocked_pvs = self._product_pvs(shocked_scenario, as_of_date)
-            total = 0.0
-            for label, base_pv in base_pvs.items():
-                raw = shocked_pvs[label] - base_pv
-                normalized = raw / bump_size if bump_size != 0.0 else 0.0
-                by_product[label][metric_name] = float(normalized)
-                total += normalized
-            portfolio[metric_name] = float(total)
+            raw = self._product_pvs(shocked_scenario, as_of_date, time_grid) - base_pvs
+            normalized = raw / bump_size if bump_size != 0.0 else np.zeros_like(raw)
+            for label, value in zip(labels, normalized.tolist()):
+                by_product[label][metric_name] = value
+            portfolio[metric_name] = float(np.sum(normalized))
 
         return SensitivityResult(product_sensitivities=by_product, portfolio_sensitivities=portfolio)
 
-    def _product_pvs(self, scenario: dict, as_of_date: str | None) -> dict[str, float]:
-        out: dict[str, float] = {}
-        for idx, product in enumerate(self.products):
-            label = f"{idx:03d}_{product.__class__.__name__}"
-            out[label] = float(product.present_value(scenario, as_of_date))
-        return out
+    def _product_pvs(self, scenario: dict, as_of_date: str | None, time_grid: CashflowTimeGrid) -> np.ndarray:
+        if not isinstance(scenario.get("model"), InterestRateModel):
+            return np.array([float(p.present_value(scenario, as_of_date)) for p in self.products], dtype=float)
+        return portfolio_pv(self.products, scenario, as_of_date, time_grid)
 
     @staticmethod
     def _bump_rate_curve(scenario: dict, key: str, bump_bps: float) -> dict:
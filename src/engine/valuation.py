@@ -3,12 +3,13 @@ from __future__ import annotations
 import csv
 import json
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 import numpy as np
 
-from engine.scenario import Scenario
-from products.base import Product
+from engine.scenario import Scenario, curve_cache
+from products.base import CashflowTimeGrid, Product, portfolio_pv
 
 
 @dataclass
@@ -16,24 +17,29 @@ class ValuationResult:
     scenario_pv: dict[str, float]
     portfolio_pv_distribution: np.ndarray
 
+    @cached_property
+    def _sorted_pvs(self) -> np.ndarray:
+        # Sorted once; quantiles on sorted input skip most of the selection work.
+        return np.sort(self.portfolio_pv_distribution)
+
+    def _base_pv(self) -> float:
+        base_pv = self.scenario_pv.get("parallel_shift_+0bps")
+        if base_pv is None:
+            return float(self._sorted_pvs[-1])
+        return base_pv
+
     def pvat_risk(self, confidence: float = 0.99) -> float:
         if not (0.0 < confidence < 1.0):
             raise ValueError("confidence must be between 0 and 1")
-        base_pv = self.scenario_pv.get("parallel_shift_+0bps")
-        if base_pv is None:
-            base_pv = float(np.max(self.portfolio_pv_distribution))
-        q = np.quantile(self.portfolio_pv_distribution, 1.0 - confidence)
-        return float(base_pv - q)
+        q = np.quantile(self._sorted_pvs, 1.0 - confidence)
+        return float(self._base_pv() - q)
 
     def expected_shortfall(self, confidence: float = 0.99) -> float:
         if not (0.0 < confidence < 1.0):
             raise ValueError("confidence must be between 0 and 1")
-        base_pv = self.scenario_pv.get("parallel_shift_+0bps")
-        if base_pv is None:
-            base_pv = float(np.max(self.portfolio_pv_distribution))
-        losses = base_pv - self.portfolio_pv_distribution
+        losses = self._base_pv() - self._sorted_pvs[::-1]
         var = np.quantile(losses, confidence)
-        tail = losses[losses >= var]
+        tail = losses[np.searchsorted(losses, var, side="left") :]
         if tail.size == 0:
             return 0.0
         return float(np.mean(tail))
@@ -81,47 +87,42 @@ class ValuationEngine:
         self.products = products
 
     def value(self, scenarios: list[Scenario], as_of_date: str | None = None) -> ValuationResult:
-        scenario_pv: dict[str, float] = {}
-        pv_values: list[float] = []
+        pv_values = np.empty(len(scenarios), dtype=float)
+        time_grid = CashflowTimeGrid()
 
-        for scenario in scenarios:
+        for i, scenario in enumerate(scenarios):
             data = {"model": scenario.model, "name": scenario.name}
             data.update(scenario.data)
-            total = sum(product.present_value(data, as_of_date) for product in self.products)
-            scenario_pv[scenario.name] = float(total)
-            pv_values.append(float(total))
+            with curve_cache(data) as cached_data:
+                pv_values[i] = sum(portfolio_pv(self.products, cached_data, as_of_date, time_grid).tolist())
 
-        return ValuationResult(
-            scenario_pv=scenario_pv,
-            portfolio_pv_distribution=np.array(pv_values, dtype=float),
-        )
+        return self._result(scenarios, pv_values)
 
     def value_with_contributions(
         self, scenarios: list[Scenario], as_of_date: str | None = None
     ) -> tuple[ValuationResult, dict[str, dict[str, float]]]:
-        scenario_pv: dict[str, float] = {}
-        pv_values: list[float] = []
+        pv_values = np.empty(len(scenarios), dtype=float)
         contributions: dict[str, dict[str, float]] = {}
+        labels = [f"{idx:03d}_{product.__class__.__name__}" for idx, product in enumerate(self.products)]
+        time_grid = CashflowTimeGrid()
 
-        for scenario in scenarios:
+        for i, scenario in enumerate(scenarios):
             data = {"model": scenario.model, "name": scenario.name}
             data.update(scenario.data)
-            per_product: dict[str, float] = {}
-            total = 0.0
-            for idx, product in enumerate(self.products):
-                label = f"{idx:03d}_{product.__class__.__name__}"
-                pv = float(product.present_value(data, as_of_date))
-                per_product[label] = pv
-                total += pv
-            scenario_pv[scenario.name] = total
-            pv_values.append(total)
-            contributions[scenario.name] = per_product
-
-        result = ValuationResult(
-            scenario_pv=scenario_pv,
-            portfolio_pv_distribution=np.array(pv_values, dtype=float),
+            with curve_cache(data) as cached_data:
+                pvs = portfolio_pv(self.products, cached_data, as_of_date, time_grid).tolist()
+            pv_values[i] = sum(pvs)
+            contributions[scenario.name] = dict(zip(labels, pvs))
+
+        return self._result(scenarios, pv_values), contributions
+
+    @staticmethod
+    def _result(scenarios: list[Scenario], pv_values: np.ndarray) -> ValuationResult:
+        # The distribution is the preallocated array; the dict is a keyed view for reporting.
+        return ValuationResult(
+            scenario_pv=dict(zip((scenario.name for scenario in scenarios), pv_values.tolist())),
+            portfolio_pv_distribution=pv_values,
         )
-        return result, contributions
 
     def value_with_grouped_contributions(
         self,
@@ -3,6 +3,19 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 import math
 
+import numpy as np
+
+
+def frozen_nodes(values) -> np.ndarray:
+    """Private C-contiguous float64 copy of curve nodes, marked read-only.
+
+    Curves own their node arrays: later edits to the caller's array cannot leak in, and
+    ``np.interp`` gets a layout it can use without converting on every query.
+    """
+    nodes = np.array(values, dtype=np.float64, order="C")
+    nodes.setflags(write=False)
+    return nodes
+
 
 class InterestRateModel(ABC):
     """Abstract rate model used by product pricers."""
@@ -11,6 +24,10 @@ class InterestRateModel(ABC):
     def discount_factor(self, t: float) -> float:
         """Return the discount factor from valuation time 0 to time t in years."""
 
+    def discount_factors(self, times: np.ndarray) -> np.ndarray:
+        """Vectorized ``discount_factor``; models override this with an array evaluation."""
+        return np.array([self.discount_factor(t) for t in np.asarray(times, dtype=float).tolist()], dtype=float)
+
     @abstractmethod
     def short_rate(self, t: float) -> float:
         """Return the instantaneous short rate at time t."""
@@ -25,6 +42,18 @@ class InterestRateModel(ABC):
             raise ValueError("discount factors must be positive")
         return (df0 / df1 - 1.0) / (t1 - t0)
 
+    def forward_rates(self, t0: np.ndarray, t1: np.ndarray) -> np.ndarray:
+        """Vectorized ``forward_rate`` over matching arrays of period starts and ends."""
+        t0 = np.asarray(t0, dtype=float)
+        t1 = np.asarray(t1, dtype=float)
+        if np.any(t0 < 0.0) or np.any(t1 <= t0):
+            raise ValueError("require t0 >= 0 and t1 > t0")
+        df0 = self.discount_factors(t0)
+        df1 = self.discount_factors(t1)
+        if np.any(df1 <= 0.0) or np.any(df0 <= 0.0):
+            raise ValueError("discount factors must be positive")
+        return (df0 / df1 - 1.0) / (t1 - t0)
+
     def continuous_forward_rate(self, t: float, dt: float = 1e-4) -> float:
         """Approximate instantaneous forward rate at t."""
         if t < 0.0 or dt <= 0.0:
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import csv
 from pathlib import Path
 
 import numpy as np
 
 from models.curve import DeterministicZeroCurve
+from utils.tables import float_column, int_column, read_csv_columns, text_column
 
 
 @dataclass(frozen=True)
@@ -38,22 +38,23 @@ def load_curve_quotes_csv(path: str | Path) -> tuple[list[DepositQuote], list[Sw
     - rate
     - fixed_frequency (optional for swaps, default=1)
     """
-    deposits: list[DepositQuote] = []
-    swaps: list[SwapQuote] = []
-    with Path(path).open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            typ = str(row.get("instrument_type", "")).strip().lower()
-            tenor = float(row["tenor_years"])
-            rate = float(row["rate"])
-            if typ == "deposit":
-                deposits.append(DepositQuote(tenor_years=tenor, simple_rate=rate))
-            elif typ == "swap":
-                freq_raw = row.get("fixed_frequency", "")
-                freq = int(freq_raw) if str(freq_raw).strip() else 1
-                swaps.append(SwapQuote(maturity_years=tenor, par_rate=rate, fixed_frequency=freq))
-            else:
-                raise ValueError(f"unsupported instrument_type: {typ}")
+    columns, n_rows = read_csv_columns(path)
+    types = np.char.lower(np.array(text_column(columns, n_rows, "instrument_type"), dtype=str))
+    unsupported = types[(types != "deposit") & (types != "swap")]
+    if unsupported.size:
+        raise ValueError(f"unsupported instrument_type: {unsupported[0]}")
+    tenors = float_column(columns, n_rows, "tenor_years")
+    rates = float_column(columns, n_rows, "rate")
+    freqs = int_column(columns, n_rows, "fixed_frequency", 1)
+    is_deposit = types == "deposit"
+    deposits = [
+        DepositQuote(tenor_years=tenor, simple_rate=rate)
+        for tenor, rate in zip(tenors[is_deposit].tolist(), rates[is_deposit].tolist())
+    ]
+    swaps = [
+        SwapQuote(maturity_years=tenor, par_rate=rate, fixed_frequency=freq)
+        for tenor, rate, freq in zip(tenors[~is_deposit].tolist(), rates[~is_deposit].tolist(), freqs[~is_deposit].tolist())
+    ]
     return deposits, swaps
 
 
@@ -131,27 +132,23 @@ def _diagnostics(
     deposits: list[DepositQuote],
     swaps: list[SwapQuote],
 ) -> CalibrationDiagnostics:
-    df_nodes = np.array([curve.discount_factor(float(t)) for t in curve.tenors], dtype=float)
+    tenors = np.asarray(curve.tenors, dtype=float)
+    df_nodes = curve.discount_factors(tenors)
     monotonic_df = bool(np.all(np.diff(df_nodes) <= 1e-12))
 
-    forwards = []
-    for i in range(1, len(curve.tenors)):
-        t0 = float(curve.tenors[i - 1])
-        t1 = float(curve.tenors[i])
-        forwards.append(curve.forward_rate(t0, t1))
-    non_negative_forwards = bool(np.all(np.array(forwards, dtype=float) >= -1e-10)) if forwards else True
+    forwards = curve.forward_rates(tenors[:-1], tenors[1:])
+    non_negative_forwards = bool(np.all(forwards >= -1e-10)) if forwards.size else True
 
     errors: list[float] = []
-    for d in deposits:
-        model_df = curve.discount_factor(d.tenor_years)
-        mkt_df = 1.0 / (1.0 + d.simple_rate * d.tenor_years)
-        errors.append(model_df - mkt_df)
+    if deposits:
+        dep_tenors = np.array([d.tenor_years for d in deposits], dtype=float)
+        dep_rates = np.array([d.simple_rate for d in deposits], dtype=float)
+        errors.extend((curve.discount_factors(dep_tenors) - 1.0 / (1.0 + dep_rates * dep_tenors)).tolist())
 
     for s in swaps:
         dt = 1.0 / s.fixed_frequency
         n = int(round(s.maturity_years * s.fixed_frequency))
-        pay_times = [i * dt for i in range(1, n + 1)]
-        annuity = sum(dt * curve.discount_factor(t) for t in pay_times)
+        annuity = float(dt * curve.discount_factors(np.arange(1, n + 1) * dt).sum())
         if annuity <= 0.0:
             continue
         model_par = (1.0 - curve.discount_factor(s.maturity_years)) / annuity
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
+import math
 
 import numpy as np
 
-from models.base import InterestRateModel
+from models.base import InterestRateModel, frozen_nodes
 
 
 @dataclass(frozen=True)
 class DeterministicZeroCurve(InterestRateModel):
-    """Piecewise-linear zero curve with continuous compounding."""
+    """Piecewise-linear zero curve with continuous compounding.
+
+    Node arrays are stored via ``frozen_nodes``, so curves are immutable and can be hashed,
+    compared and used as cache keys.
+    """
 
     tenors: np.ndarray
     zero_rates: np.ndarray
 
     def __post_init__(self) -> None:
+        object.__setattr__(self, "tenors", frozen_nodes(self.tenors))
+        object.__setattr__(self, "zero_rates", frozen_nodes(self.zero_rates))
         if self.tenors.ndim != 1 or self.zero_rates.ndim != 1:
             raise ValueError("tenors and zero_rates must be one-dimensional arrays")
         if len(self.tenors) != len(self.zero_rates):
@@ -23,23 +31,57 @@ class DeterministicZeroCurve(InterestRateModel):
             raise ValueError("curve must contain at least two tenor points")
         if np.any(np.diff(self.tenors) <= 0):
             raise ValueError("tenors must be strictly increasing")
+        # Segment table for scalar queries: Python floats, so lookups avoid numpy dispatch.
+        tenors = self.tenors.astype(float).tolist()
+        rates = self.zero_rates.astype(float).tolist()
+        slopes = [(rates[j + 1] - rates[j]) / (tenors[j + 1] - tenors[j]) for j in range(len(tenors) - 1)]
+        object.__setattr__(self, "_tenor_nodes", tenors)
+        object.__setattr__(self, "_rate_nodes", rates)
+        object.__setattr__(self, "_rate_slopes", slopes)
+        # Adding 0.0 folds -0.0 into 0.0 so equal curves hash equally.
+        object.__setattr__(self, "_hash", hash(((self.tenors + 0.0).tobytes(), (self.zero_rates + 0.0).tobytes())))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DeterministicZeroCurve):
+            return NotImplemented
+        return np.array_equal(self.tenors, other.tenors) and np.array_equal(self.zero_rates, other.zero_rates)
+
+    def __hash__(self) -> int:
+        return self._hash
 
     def _interp_zero_rate(self, t: float) -> float:
-        if t <= 0.0:
-            return float(self.zero_rates[0])
-        if t <= float(self.tenors[0]):
-            return float(self.zero_rates[0])
-        if t >= float(self.tenors[-1]):
-            return float(self.zero_rates[-1])
-        return float(np.interp(t, self.tenors, self.zero_rates))
-
-    def discount_factor(self, t: float) -> float:
+        tenors = self._tenor_nodes
+        if t <= tenors[0]:
+            return self._rate_nodes[0]
+        if t >= tenors[-1]:
+            return self._rate_nodes[-1]
+        # Same affine form as np.interp on the segment containing t.
+        j = bisect_right(tenors, t) - 1
+        return self._rate_slopes[j] * (t - tenors[j]) + self._rate_nodes[j]
+
+    def discount_factor(self, t: float | np.ndarray) -> float | np.ndarray:
+        """Discount factor at ``t``; array arguments go through ``discount_factors``."""
+        if np.ndim(t):
+            return self.discount_factors(t)
         if t < 0.0:
             raise ValueError("t must be non-negative")
-        r = self._interp_zero_rate(t)
-        return float(np.exp(-r * t))
+        return math.exp(-self._interp_zero_rate(t) * t)
+
+    def discount_factors(self, times: np.ndarray) -> np.ndarray:
+        t = np.asarray(times, dtype=float)
+        if np.any(t < 0.0):
+            raise ValueError("t must be non-negative")
+        # np.interp clamps to the end rates, matching the flat extrapolation of _interp_zero_rate.
+        r = np.interp(t, self.tenors, self.zero_rates)
+        return np.exp(-r * t)
 
-    def short_rate(self, t: float) -> float:
+    def short_rate(self, t: float | np.ndarray) -> float | np.ndarray:
+        """Interpolated zero rate at ``t``; arrays are interpolated in one ``np.interp`` pass."""
+        if np.ndim(t):
+            t = np.asarray(t, dtype=float)
+            if np.any(t < 0.0):
+                raise ValueError("t must be non-negative")
+            return np.interp(t, self.tenors, self.zero_rates)
         if t < 0.0:
             raise ValueError("t must be non-negative")
         return self._interp_zero_rate(t)
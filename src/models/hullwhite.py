@@ -26,6 +26,9 @@ class HullWhiteModel(InterestRateModel):
         # Deterministic discounting anchored to the initial market curve.
         return self.initial_curve.discount_factor(t)
 
+    def discount_factors(self, times: np.ndarray) -> np.ndarray:
+        return self.initial_curve.discount_factors(times)
+
     def short_rate(self, t: float) -> float:
         return self.initial_curve.short_rate(t)
 
@@ -54,25 +57,36 @@ class HullWhiteModel(InterestRateModel):
         n_steps: int,
         n_paths: int,
         seed: int | None = None,
+        antithetic: bool = False,
     ) -> np.ndarray:
-        """Euler simulation of short-rate paths r(t)."""
+        """Euler simulation of short-rate paths r(t).
+
+        With ``antithetic`` the second half of the paths reuses the first half's shocks negated.
+        """
         if horizon_years <= 0.0 or n_steps <= 0 or n_paths <= 0:
             raise ValueError("horizon_years, n_steps, and n_paths must be positive")
 
         dt = horizon_years / n_steps
         times = np.linspace(0.0, horizon_years, n_steps + 1)
-        rng = np.random.default_rng(seed)
-        rates = np.zeros((n_paths, n_steps + 1), dtype=float)
-        rates[:, 0] = self.short_rate(0.0)
-
-        for i in range(n_steps):
-            t = times[i]
-            theta = self._theta(t)
-            z = rng.standard_normal(n_paths)
-            dr = (theta - self.a * rates[:, i]) * dt + self.sigma * np.sqrt(dt) * z
-            rates[:, i + 1] = rates[:, i] + dr
-
-        return rates
+        thetas = [self._theta(t) for t in times[:-1].tolist()]
+        # PCG64DXSM is numpy's recommended generator for large and parallel draws; pinning the
+        # bit generator keeps seeded paths stable across numpy default_rng changes.
+        rng = np.random.Generator(np.random.PCG64DXSM(seed))
+        # One draw for all steps into a preallocated buffer, scaled in place.
+        n_draws = (n_paths + 1) // 2 if antithetic else n_paths
+        shocks = np.empty((n_steps, n_draws), dtype=float)
+        rng.standard_normal(out=shocks)
+        shocks *= self.sigma * np.sqrt(dt)
+        if antithetic:
+            shocks = np.concatenate([shocks, -shocks], axis=1)[:, :n_paths]
+        # Step-major layout keeps each Euler update on a contiguous row.
+        rates = np.empty((n_steps + 1, n_paths), dtype=float)
+        rates[0] = self.short_rate(0.0)
+        a = self.a
+        for i, theta in enumerate(thetas):
+            rates[i + 1] = rates[i] + ((theta - a * rates[i]) * dt + shocks[i])
+
+        return np.ascontiguousarray(rates.T)
 
     def _theta(self, t: float) -> float:
         # Drift term that matches initial term structure.
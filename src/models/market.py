@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import numpy as np
 
+from models.base import frozen_nodes
+
 
 @dataclass(frozen=True)
 class DeterministicForwardCurve:
@@ -13,6 +15,8 @@ class DeterministicForwardCurve:
     forward_rates: np.ndarray
 
     def __post_init__(self) -> None:
+        object.__setattr__(self, "tenors", frozen_nodes(self.tenors))
+        object.__setattr__(self, "forward_rates", frozen_nodes(self.forward_rates))
         if self.tenors.ndim != 1 or self.forward_rates.ndim != 1:
             raise ValueError("tenors and forward_rates must be one-dimensional arrays")
         if len(self.tenors) != len(self.forward_rates):
@@ -22,7 +26,15 @@ class DeterministicForwardCurve:
         if np.any(np.diff(self.tenors) <= 0):
             raise ValueError("tenors must be strictly increasing")
 
-    def forward_rate(self, t0: float, t1: float | None = None) -> float:
+    def forward_rate(self, t0: float | np.ndarray, t1: float | np.ndarray | None = None) -> float | np.ndarray:
+        """Forward rate at ``t0`` (flat beyond the nodes); arrays use one ``np.interp`` pass."""
+        if np.ndim(t0) or np.ndim(t1):
+            t0 = np.asarray(t0, dtype=float)
+            if np.any(t0 < 0.0):
+                raise ValueError("t0 must be non-negative")
+            if t1 is not None and np.any(np.asarray(t1, dtype=float) <= t0):
+                raise ValueError("if provided, t1 must be greater than t0")
+            return np.interp(t0, self.tenors, self.forward_rates)
         if t0 < 0.0:
             raise ValueError("t0 must be non-negative")
         if t1 is not None and t1 <= t0:
@@ -37,14 +49,20 @@ class DeterministicForwardCurve:
         return float(np.interp(t, self.tenors, self.forward_rates))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeterministicFXCurve:
     """Deterministic FX forward curve, quoted as domestic per unit foreign."""
 
     tenors: np.ndarray
     fx_forwards: np.ndarray
+    _t0: float = field(init=False, repr=False, compare=False)
+    _tN: float = field(init=False, repr=False, compare=False)
+    _f0: float = field(init=False, repr=False, compare=False)
+    _fN: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        object.__setattr__(self, "tenors", frozen_nodes(self.tenors))
+        object.__setattr__(self, "fx_forwards", frozen_nodes(self.fx_forwards))
         if self.tenors.ndim != 1 or self.fx_forwards.ndim != 1:
             raise ValueError("tenors and fx_forwards must be one-dimensional arrays")
         if len(self.tenors) != len(self.fx_forwards):
@@ -53,18 +71,33 @@ class DeterministicFXCurve:
             raise ValueError("curve must contain at least two tenor points")
         if np.any(np.diff(self.tenors) <= 0):
             raise ValueError("tenors must be strictly increasing")
-
-    def fx_forward(self, t: float) -> float:
-        if t <= 0.0:
-            return float(self.fx_forwards[0])
-        if t <= float(self.tenors[0]):
-            return float(self.fx_forwards[0])
-        if t >= float(self.tenors[-1]):
-            return float(self.fx_forwards[-1])
-        return float(np.interp(t, self.tenors, self.fx_forwards))
-
-
-@dataclass(frozen=True)
+        # Flat-extrapolation bounds cached as Python floats for the scalar path.
+        object.__setattr__(self, "_t0", float(self.tenors[0]))
+        object.__setattr__(self, "_tN", float(self.tenors[-1]))
+        object.__setattr__(self, "_f0", float(self.fx_forwards[0]))
+        object.__setattr__(self, "_fN", float(self.fx_forwards[-1]))
+
+    def fx_forward(self, t: float | np.ndarray) -> float | np.ndarray:
+        """FX forward at ``t``; array arguments go through ``fx_forwards_vec``."""
+        if np.ndim(t):
+            return self.fx_forwards_vec(t)
+        if t <= self._t0:
+            return self._f0
+        if t >= self._tN:
+            return self._fN
+        i = int(np.searchsorted(self.tenors, t, side="right"))
+        x0 = float(self.tenors[i - 1])
+        x1 = float(self.tenors[i])
+        y0 = float(self.fx_forwards[i - 1])
+        y1 = float(self.fx_forwards[i])
+        return y0 + (y1 - y0) * (t - x0) / (x1 - x0)
+
+    def fx_forwards_vec(self, ts: np.ndarray) -> np.ndarray:
+        """Vectorized ``fx_forward`` over an array of times (flat extrapolation)."""
+        return np.interp(np.asarray(ts, dtype=float), self.tenors, self.fx_forwards)
+
+
+@dataclass(frozen=True, slots=True)
 class DeterministicHazardCurve:
     """Piecewise-constant default intensity curve."""
 
@@ -72,6 +105,8 @@ class DeterministicHazardCurve:
     hazard_rates: np.ndarray
 
     def __post_init__(self) -> None:
+        object.__setattr__(self, "tenors", frozen_nodes(self.tenors))
+        object.__setattr__(self, "hazard_rates", frozen_nodes(self.hazard_rates))
         if self.tenors.ndim != 1 or self.hazard_rates.ndim != 1:
             raise ValueError("tenors and hazard_rates must be one-dimensional arrays")
         if len(self.tenors) != len(self.hazard_rates):
@@ -81,7 +116,10 @@ class DeterministicHazardCurve:
         if np.any(np.diff(self.tenors) <= 0):
             raise ValueError("tenors must be strictly increasing")
 
-    def hazard_rate(self, t: float) -> float:
+    def hazard_rate(self, t: float | np.ndarray) -> float | np.ndarray:
+        """Hazard rate at ``t`` (flat beyond the nodes); arrays use one ``np.interp`` pass."""
+        if np.ndim(t):
+            return np.interp(np.asarray(t, dtype=float), self.tenors, self.hazard_rates)
         if t <= 0.0:
             return float(self.hazard_rates[0])
         if t <= float(self.tenors[0]):
@@ -90,7 +128,12 @@ class DeterministicHazardCurve:
             return float(self.hazard_rates[-1])
         return float(np.interp(t, self.tenors, self.hazard_rates))
 
-    def survival_probability(self, t: float) -> float:
+    def survival_probability(self, t: float | np.ndarray) -> float | np.ndarray:
+        if np.ndim(t):
+            t = np.asarray(t, dtype=float)
+            if np.any(t < 0.0):
+                raise ValueError("t must be non-negative")
+            return np.exp(-self.hazard_rate(t) * t)
         if t < 0.0:
             raise ValueError("t must be non-negative")
         if t == 0.0:
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+
+def level_payment(notional: float, rate_per_period: float, periods: int) -> float:
+    """Level payment amortizing ``notional`` over ``periods`` at ``rate_per_period``.
+
+    Returns 0.0 when there is no amortizing period and straight-line repayment at a zero rate.
+    """
+    if periods <= 0:
+        return 0.0
+    if rate_per_period == 0.0:
+        return notional / periods
+    return notional * rate_per_period / (1.0 - (1.0 + rate_per_period) ** (-periods))
@@ -2,17 +2,55 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import NamedTuple
 
+import numpy as np
 
-@dataclass(frozen=True)
+from models.base import InterestRateModel
+
+
+@dataclass(frozen=True, slots=True)
 class Cashflow:
     time: float
     amount: float
 
 
+class CashflowArray(NamedTuple):
+    """Column-oriented cashflows: parallel ``times`` and ``amounts`` arrays."""
+
+    times: np.ndarray
+    amounts: np.ndarray
+
+    @classmethod
+    def from_cashflows(cls, cashflows: list[Cashflow]) -> CashflowArray:
+        n = len(cashflows)
+        return cls(
+            np.fromiter((cf.time for cf in cashflows), dtype=np.float64, count=n),
+            np.fromiter((cf.amount for cf in cashflows), dtype=np.float64, count=n),
+        )
+
+    def as_cashflows(self) -> list[Cashflow]:
+        # Positional construction through map skips per-row keyword binding.
+        return list(map(Cashflow, self.times.tolist(), self.amounts.tolist()))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CashflowArray):
+            return NotImplemented
+        return bool(np.array_equal(self.times, other.times) and np.array_equal(self.amounts, other.amounts))
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+
 class Product(ABC):
     """Common interface for all balance-sheet products."""
 
+    # Empty slots so slotted product dataclasses do not regain a __dict__.
+    __slots__ = ()
+
     @abstractmethod
     def get_cashflows(self, scenario: dict, as_of_date: str | None = None) -> list[Cashflow]:
         """Return future cashflows under a scenario."""
@@ -21,6 +59,28 @@ class Product(ABC):
     def present_value(self, scenario: dict, as_of_date: str | None = None) -> float:
         """Return product PV under a scenario."""
 
+    def get_cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        """Return ``get_cashflows`` as columns; products with columnar builders skip the list."""
+        return CashflowArray.from_cashflows(self.get_cashflows(scenario, as_of_date))
+
+    def _cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray | None:
+        """Return cashflows whose DF-weighted sum under ``scenario['model']`` is the PV.
+
+        Opt-in: the default None makes ``portfolio_pv`` call ``present_value``. Products
+        whose PV is a discounted sum of their cashflows override this.
+        """
+        return None
+
+    @classmethod
+    def _batch_cashflow_arrays(
+        cls,
+        products: list[Product],
+        scenario: dict,
+        as_of_date: str | None = None,
+    ) -> list[CashflowArray | None]:
+        """``_cashflow_arrays`` for several products of this type; override to share work across them."""
+        return [product._cashflow_arrays(scenario, as_of_date) for product in products]
+
     def valuation_breakdown(
         self,
         scenario: dict,
@@ -35,3 +95,109 @@ class Product(ABC):
             "clean_pv": clean_pv,
             "accrued_interest": float(accrued_interest),
         }
+
+
+class CachedModel(InterestRateModel):
+    """Memoizes discount factors of a wrapped model for the duration of one valuation batch.
+
+    Array results are keyed on the query times and returned read-only, so products that
+    share payment grids within a batch reuse one evaluation.
+    """
+
+    def __init__(self, model: InterestRateModel) -> None:
+        self.model = model
+        self._dfs: dict[float, float] = {}
+        self._df_arrays: dict[tuple[tuple[int, ...], bytes], np.ndarray] = {}
+
+    def discount_factor(self, t: float) -> float:
+        df = self._dfs.get(t)
+        if df is None:
+            df = self._dfs[t] = self.model.discount_factor(t)
+        return df
+
+    def discount_factors(self, times: np.ndarray) -> np.ndarray:
+        t = np.asarray(times, dtype=float)
+        key = (t.shape, t.tobytes())
+        dfs = self._df_arrays.get(key)
+        if dfs is None:
+            dfs = self.model.discount_factors(t)
+            dfs.flags.writeable = False
+            self._df_arrays[key] = dfs
+        return dfs
+
+    def short_rate(self, t: float) -> float:
+        return self.model.short_rate(t)
+
+    def clear(self) -> None:
+        self._dfs.clear()
+        self._df_arrays.clear()
+
+
+class CashflowTimeGrid:
+    """Unique-time lookup table for a stacked cashflow time vector, reused across scenarios.
+
+    Portfolios usually keep the same payment dates from one scenario to the next and share
+    many of them between products. Once the same stacked times are seen twice, discount
+    factors are evaluated on the distinct times only and gathered back per cashflow.
+    """
+
+    def __init__(self) -> None:
+        self._times: np.ndarray | None = None
+        self._nodes: np.ndarray | None = None
+        self._index: np.ndarray | None = None
+
+    def discount_factors(self, model: InterestRateModel, times: np.ndarray) -> np.ndarray:
+        if self._times is None or not np.array_equal(times, self._times):
+            # New grid: price directly and remember it; the table is only built on reuse.
+            self._times = np.array(times, dtype=float)
+            self._nodes = self._index = None
+            return model.discount_factors(times)
+        if self._nodes is None:
+            self._nodes, self._index = np.unique(self._times, return_inverse=True)
+        return model.discount_factors(self._nodes)[self._index]
+
+
+def portfolio_pv(
+    products: list[Product],
+    scenario: dict,
+    as_of_date: str | None = None,
+    time_grid: CashflowTimeGrid | None = None,
+) -> np.ndarray:
+    """Per-product PVs with a single ``discount_factors`` call over all cashflow times.
+
+    Pass the same ``time_grid`` for every scenario of a run to reuse its unique-time table.
+    """
+    pvs = np.zeros(len(products), dtype=float)
+    batched: list[int] = []
+    times_parts: list[np.ndarray] = []
+    amounts_parts: list[np.ndarray] = []
+    # Products are grouped by type so types with a batched builder price all their trades at once.
+    groups: dict[type[Product], list[int]] = {}
+    for idx, product in enumerate(products):
+        groups.setdefault(type(product), []).append(idx)
+    for product_type, indices in groups.items():
+        group = [products[idx] for idx in indices]
+        for idx, arrays in zip(indices, product_type._batch_cashflow_arrays(group, scenario, as_of_date)):
+            if arrays is None:
+                pvs[idx] = float(products[idx].present_value(scenario, as_of_date))
+                continue
+            times, amounts = arrays
+            batched.append(idx)
+            times_parts.append(times)
+            amounts_parts.append(amounts)
+
+    if batched:
+        model = scenario.get("model")
+        if not isinstance(model, InterestRateModel):
+            raise TypeError("scenario['model'] must implement InterestRateModel")
+        times = np.concatenate(times_parts)
+        dfs = model.discount_factors(times) if time_grid is None else time_grid.discount_factors(model, times)
+        # One segmented reduction over the stacked products instead of a dot per product;
+        # products without cashflows keep their zero PV.
+        lengths = np.fromiter((len(part) for part in amounts_parts), dtype=np.intp, count=len(amounts_parts))
+        starts = np.cumsum(lengths) - lengths
+        nonempty = lengths > 0
+        if nonempty.any():
+            weighted = np.concatenate(amounts_parts) * dfs
+            pvs[np.asarray(batched)[nonempty]] = np.add.reduceat(weighted, starts[nonempty])
+    return pvs
@@ -1,35 +1,46 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import numpy as np
 
 from models.base import InterestRateModel
-from products.base import Cashflow, Product
+from products.base import Cashflow, CashflowArray, Product
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FixedRateBond(Product):
     notional: float
     coupon_rate: float
     maturity_years: float
     coupon_frequency: int = 1
+    _periods: int = field(init=False, repr=False, compare=False)
+    _dt: float = field(init=False, repr=False, compare=False)
 
-    def get_cashflows(self, scenario: dict, as_of_date: str | None = None) -> list[Cashflow]:
+    def __post_init__(self) -> None:
         periods = int(round(self.maturity_years * self.coupon_frequency))
         if periods <= 0:
             raise ValueError("maturity_years and coupon_frequency imply zero periods")
-        dt = 1.0 / self.coupon_frequency
+        object.__setattr__(self, "_periods", periods)
+        object.__setattr__(self, "_dt", 1.0 / self.coupon_frequency)
+
+    def get_cashflows(self, scenario: dict, as_of_date: str | None = None) -> list[Cashflow]:
+        return self.get_cashflow_arrays(scenario, as_of_date).as_cashflows()
+
+    def get_cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        periods = self._periods
+        dt = self._dt
         coupon = self.notional * self.coupon_rate * dt
-        cashflows: list[Cashflow] = []
-        for i in range(1, periods + 1):
-            t = i * dt
-            amount = coupon
-            if i == periods:
-                amount += self.notional
-            cashflows.append(Cashflow(time=t, amount=amount))
-        return cashflows
+        amounts = np.full(periods, coupon)
+        amounts[-1] = coupon + self.notional
+        return CashflowArray(np.arange(1, periods + 1) * dt, amounts)
+
+    def _cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        return self.get_cashflow_arrays(scenario, as_of_date)
 
     def present_value(self, scenario: dict, as_of_date: str | None = None) -> float:
         model = scenario.get("model")
         if not isinstance(model, InterestRateModel):
             raise TypeError("scenario['model'] must implement InterestRateModel")
-        return sum(cf.amount * model.discount_factor(cf.time) for cf in self.get_cashflows(scenario, as_of_date))
+        times, amounts = self.get_cashflow_arrays(scenario, as_of_date)
+        return float(np.dot(amounts, model.discount_factors(times)))
@@ -3,8 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 import math
 
+import numpy as np
+
 from models.base import InterestRateModel
-from products.base import Product
+from products.base import CashflowArray, Product
 
 
 @dataclass(frozen=True)
@@ -31,14 +33,9 @@ class CallableFixedRateBond(Product):
         if n <= 0:
             raise ValueError("invalid maturity/frequency")
         coupon = self.notional * self.coupon_rate * dt
-        from products.base import Cashflow
-
-        cfs = []
-        for i in range(1, n + 1):
-            t = i * dt
-            amt = coupon + (self.notional if i == n else 0.0)
-            cfs.append(Cashflow(time=t, amount=amt))
-        return cfs
+        amounts = np.full(n, coupon)
+        amounts[-1] += self.notional
+        return CashflowArray(np.arange(1, n + 1) * dt, amounts).as_cashflows()
 
     def valuation_breakdown(
         self,
@@ -46,15 +43,10 @@ class CallableFixedRateBond(Product):
         as_of_date: str | None = None,
         accrued_interest: float = 0.0,
     ) -> dict[str, float]:
-        dirty = self.present_value(scenario, as_of_date)
-        clean = dirty - accrued_interest
-        return {
-            "dirty_pv": dirty,
-            "clean_pv": clean,
-            "accrued_interest": accrued_interest,
-            "dirty_price_pct": 100.0 * dirty / self.notional,
-            "clean_price_pct": 100.0 * clean / self.notional,
-        }
+        out = super().valuation_breakdown(scenario, as_of_date, accrued_interest)
+        out["dirty_price_pct"] = 100.0 * out["dirty_pv"] / self.notional
+        out["clean_price_pct"] = 100.0 * out["clean_pv"] / self.notional
+        return out
 
     def price_with_oas(self, oas: float, scenario: dict, as_of_date: str | None = None) -> float:
         model = scenario.get("model")
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from enum import IntEnum
+from functools import lru_cache
+
+import numpy as np
+
+
+class Frequency(IntEnum):
+    """Payment frequency; the value is the number of months per period."""
+
+    MONTHLY = 1
+    QUARTERLY = 3
+    SEMI_ANNUAL = 6
+    ANNUAL = 12
+
+
+class DayCount(IntEnum):
+    THIRTY_360 = 0
+    ACT_365 = 1
+    ACT_360 = 2
+
+
+class CouponType(IntEnum):
+    FIXED = 0
+    FLOATING = 1
+
+
+class AmortizationMode(IntEnum):
+    BULLET = 0
+    LINEAR = 1
+    CUSTOM = 2
+
+
+class RepaymentType(IntEnum):
+    ANNUITY = 0
+    CONSTANT_REPAYMENT = 1
+    INTEREST_ONLY_THEN_AMORTIZING = 2
+
+
+FREQUENCY_CODES = {
+    "monthly": Frequency.MONTHLY,
+    "quarterly": Frequency.QUARTERLY,
+    "semi_annual": Frequency.SEMI_ANNUAL,
+    "annual": Frequency.ANNUAL,
+}
+
+# Keys are upper-case; look up with ``day_count.upper()``.
+DAY_COUNT_CODES = {
+    "30/360": DayCount.THIRTY_360,
+    "ACT/365": DayCount.ACT_365,
+    "ACT/360": DayCount.ACT_360,
+}
+
+# Accrual per period relative to the nominal period fraction; schedules are regular,
+# so every supported day count accrues the full fraction.
+ACCRUAL_SCALE = {
+    DayCount.THIRTY_360: 1.0,
+    DayCount.ACT_365: 1.0,
+    DayCount.ACT_360: 1.0,
+}
+
+COUPON_TYPE_CODES = {
+    "fixed": CouponType.FIXED,
+    "floating": CouponType.FLOATING,
+}
+
+AMORTIZATION_MODE_CODES = {
+    "bullet": AmortizationMode.BULLET,
+    "linear": AmortizationMode.LINEAR,
+    "custom": AmortizationMode.CUSTOM,
+}
+
+REPAYMENT_TYPE_CODES = {
+    "annuity": RepaymentType.ANNUITY,
+    "constant_repayment": RepaymentType.CONSTANT_REPAYMENT,
+    "interest_only_then_amortizing": RepaymentType.INTEREST_ONLY_THEN_AMORTIZING,
+}
+
+# Calendar-month prepayment multipliers, January first, of the behavioural CPR models.
+DEFAULT_SEASONALITY_FACTORS = (1.10, 1.10, 1.00, 0.98, 0.98, 1.00, 1.02, 1.02, 1.00, 1.00, 1.08, 1.12)
+
+
+def seasonality_excess(factors: tuple[float, ...]) -> np.ndarray:
+    """Read-only per-month uplift ``max(0, factor - 1)``; equal factors share one array."""
+    return _seasonality_excess(tuple(float(f) for f in factors))
+
+
+@lru_cache(maxsize=128)
+def _seasonality_excess(factors: tuple[float, ...]) -> np.ndarray:
+    excess = np.maximum(0.0, np.asarray(factors, dtype=np.float64) - 1.0)
+    excess.flags.writeable = False
+    return excess
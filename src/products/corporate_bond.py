@@ -1,22 +1,24 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-import math
+from dataclasses import dataclass, field
+
+import numpy as np
 
 from models.base import InterestRateModel
 from models.market import DeterministicForwardCurve
-from products.base import Cashflow, Product
-
+from products.base import Cashflow, CashflowArray, Product
+from products.conventions import (
+    ACCRUAL_SCALE,
+    AMORTIZATION_MODE_CODES,
+    COUPON_TYPE_CODES,
+    DAY_COUNT_CODES,
+    FREQUENCY_CODES,
+    AmortizationMode,
+    CouponType,
+)
 
-_FREQ_TO_YEARS = {
-    "monthly": 1.0 / 12.0,
-    "quarterly": 0.25,
-    "semi_annual": 0.5,
-    "annual": 1.0,
-}
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CorporateBond(Product):
     """Corporate bond with fixed/float coupons, amortization, and constant prepayment."""
 
@@ -32,6 +34,49 @@ class CorporateBond(Product):
     interest_only_periods: int = 0
     annual_cpr: float = 0.0
     periodic_prepayment_rate: float | None = None
+    _freq_code: int = field(init=False, repr=False, compare=False)
+    _dt: float = field(init=False, repr=False, compare=False)
+    _day_count_code: int = field(init=False, repr=False, compare=False)
+    _accrual_scale: float = field(init=False, repr=False, compare=False)
+    _coupon_code: int = field(init=False, repr=False, compare=False)
+    _amortization_code: int = field(init=False, repr=False, compare=False)
+    _prepay_rate: float = field(init=False, repr=False, compare=False)
+    _periods: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Resolve string conventions once so the per-period loop only compares ints.
+        freq_code = FREQUENCY_CODES.get(self.frequency)
+        if freq_code is None:
+            raise ValueError("unsupported frequency")
+        day_count_code = DAY_COUNT_CODES.get(self.day_count.upper())
+        if day_count_code is None:
+            raise ValueError("unsupported day_count")
+        coupon_code = COUPON_TYPE_CODES.get(self.coupon_type)
+        if coupon_code is None:
+            raise ValueError("coupon_type must be fixed or floating")
+        amortization_code = AMORTIZATION_MODE_CODES.get(self.amortization_mode)
+        if amortization_code is None:
+            raise ValueError("amortization_mode must be bullet, linear, or custom")
+        if self.notional <= 0.0 or self.maturity_years <= 0.0:
+            raise ValueError("notional and maturity_years must be positive")
+        dt = freq_code / 12.0
+        periods = int(round(self.maturity_years / dt))
+        if periods <= 0:
+            raise ValueError("invalid maturity/frequency combination")
+        if self.interest_only_periods < 0 or self.interest_only_periods >= periods:
+            raise ValueError("interest_only_periods must be in [0, periods)")
+        object.__setattr__(self, "_freq_code", freq_code)
+        object.__setattr__(self, "_dt", dt)
+        object.__setattr__(self, "_periods", periods)
+        object.__setattr__(self, "_day_count_code", day_count_code)
+        object.__setattr__(self, "_accrual_scale", ACCRUAL_SCALE[day_count_code])
+        object.__setattr__(self, "_coupon_code", coupon_code)
+        object.__setattr__(self, "_amortization_code", amortization_code)
+        if self.periodic_prepayment_rate is not None:
+            prepay_rate = max(0.0, self.periodic_prepayment_rate)
+        else:
+            prepay_rate = 1.0 - (1.0 - max(0.0, self.annual_cpr)) ** self._dt
+        object.__setattr__(self, "_prepay_rate", prepay_rate)
 
     def get_cashflows(self, scenario: dict, as_of_date: str | None = None) -> list[Cashflow]:
         discount_model = scenario.get("model")
@@ -42,6 +87,18 @@ class CorporateBond(Product):
             raise TypeError("scenario['forward_model'] must implement InterestRateModel or be DeterministicForwardCurve")
         return self._cashflows(discount_model, forward_model)
 
+    def get_cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        discount_model = scenario.get("model")
+        forward_model = scenario.get("forward_model")
+        if not isinstance(discount_model, InterestRateModel):
+            raise TypeError("scenario['model'] must implement InterestRateModel")
+        if forward_model is not None and not isinstance(forward_model, (InterestRateModel, DeterministicForwardCurve)):
+            raise TypeError("scenario['forward_model'] must implement InterestRateModel or be DeterministicForwardCurve")
+        return self._cashflow_columns(discount_model, forward_model)
+
+    def _cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        return self.get_cashflow_arrays(scenario, as_of_date)
+
     def present_value(self, scenario: dict, as_of_date: str | None = None) -> float:
         discount_model = scenario.get("model")
         forward_model = scenario.get("forward_model")
@@ -49,7 +106,8 @@ class CorporateBond(Product):
             raise TypeError("scenario['model'] must implement InterestRateModel")
         if forward_model is not None and not isinstance(forward_model, (InterestRateModel, DeterministicForwardCurve)):
             raise TypeError("scenario['forward_model'] must implement InterestRateModel or be DeterministicForwardCurve")
-        return sum(cf.amount * discount_model.discount_factor(cf.time) for cf in self._cashflows(discount_model, forward_model))
+        times, amounts = self._cashflow_columns(discount_model, forward_model)
+        return float(np.dot(amounts, discount_model.discount_factors(times)))
 
     def valuation_breakdown(
         self,
@@ -58,15 +116,10 @@ class CorporateBond(Product):
         accrued_interest: float = 0.0,
     ) -> dict[str, float]:
         """Return dirty/clean PV and price diagnostics."""
-        dirty_pv = self.present_value(scenario, as_of_date)
-        clean_pv = dirty_pv - accrued_interest
-        return {
-            "dirty_pv": dirty_pv,
-            "clean_pv": clean_pv,
-            "accrued_interest": accrued_interest,
-            "dirty_price_pct": 100.0 * dirty_pv / self.notional,
-            "clean_price_pct": 100.0 * clean_pv / self.notional,
-        }
+        out = Product.valuation_breakdown(self, scenario, as_of_date, accrued_interest)
+        out["dirty_price_pct"] = 100.0 * out["dirty_pv"] / self.notional
+        out["clean_price_pct"] = 100.0 * out["clean_pv"] / self.notional
+        return out
 
     def price_from_yield(
         self,
@@ -78,12 +131,8 @@ class CorporateBond(Product):
         model = scenario.get("model")
         if not isinstance(model, InterestRateModel):
             raise TypeError("scenario['model'] must implement InterestRateModel")
-        cashflows = self._cashflows(model)
-        if compounding == "continuous":
-            return sum(cf.amount * math.exp(-annual_yield * cf.time) for cf in cashflows)
-        if compounding == "annual":
-            return sum(cf.amount / ((1.0 + annual_yield) ** cf.time) for cf in cashflows)
-        raise ValueError("compounding must be one of: continuous, annual")
+        times, amounts = self._cashflow_columns(model)
+        return self._price_and_slope(annual_yield, times, amounts, compounding)[0]
 
     def yield_to_maturity(
         self,
@@ -98,18 +147,71 @@ class CorporateBond(Product):
     ) -> float:
         if target_dirty_pv <= 0.0:
             raise ValueError("target_dirty_pv must be positive")
+        model = scenario.get("model")
+        if not isinstance(model, InterestRateModel):
+            raise TypeError("scenario['model'] must implement InterestRateModel")
+        times, amounts = self._cashflow_columns(model)
+
+        # Price is decreasing and convex in the yield, so Newton from the lower bound
+        # approaches the root monotonically; bisection remains the fallback.
+        y = lower
+        for _ in range(max_iter):
+            price, slope = self._price_and_slope(y, times, amounts, compounding)
+            f = price - target_dirty_pv
+            if abs(f) < tol:
+                return y
+            if not slope < 0.0:
+                break
+            step = f / slope
+            y -= step
+            if not lower <= y < 5.0:
+                break
+            if abs(step) <= 1e-15 * max(1.0, abs(y)):
+                return y
+        return self._bisect_yield(target_dirty_pv, times, amounts, compounding, lower, upper, tol, max_iter)
+
+    def _price_and_slope(
+        self,
+        annual_yield: float,
+        times: np.ndarray,
+        amounts: np.ndarray,
+        compounding: str,
+    ) -> tuple[float, float]:
+        """Yield-discounted price and its derivative with respect to the yield."""
+        if compounding == "continuous":
+            discounted = amounts * np.exp(-annual_yield * times)
+            return float(discounted.sum()), float(-np.dot(discounted, times))
+        if compounding == "annual":
+            discounted = amounts / (1.0 + annual_yield) ** times
+            return float(discounted.sum()), float(-np.dot(discounted, times) / (1.0 + annual_yield))
+        raise ValueError("compounding must be one of: continuous, annual")
+
+    def _bisect_yield(
+        self,
+        target_dirty_pv: float,
+        times: np.ndarray,
+        amounts: np.ndarray,
+        compounding: str,
+        lower: float,
+        upper: float,
+        tol: float,
+        max_iter: int,
+    ) -> float:
+        def f(y: float) -> float:
+            return self._price_and_slope(y, times, amounts, compounding)[0] - target_dirty_pv
+
         lo = lower
         hi = upper
-        f_lo = self.price_from_yield(lo, scenario, as_of_date, compounding) - target_dirty_pv
-        f_hi = self.price_from_yield(hi, scenario, as_of_date, compounding) - target_dirty_pv
+        f_lo = f(lo)
+        f_hi = f(hi)
         while f_lo * f_hi > 0 and hi < 5.0:
             hi *= 1.5
-            f_hi = self.price_from_yield(hi, scenario, as_of_date, compounding) - target_dirty_pv
+            f_hi = f(hi)
         if f_lo * f_hi > 0:
             raise ValueError("Unable to bracket yield root for target_dirty_pv")
         for _ in range(max_iter):
             mid = 0.5 * (lo + hi)
-            f_mid = self.price_from_yield(mid, scenario, as_of_date, compounding) - target_dirty_pv
+            f_mid = f(mid)
             if abs(f_mid) < tol:
                 return mid
             if f_lo * f_mid <= 0:
@@ -125,43 +227,47 @@ class CorporateBond(Product):
         discount_model: InterestRateModel,
         forward_model: InterestRateModel | DeterministicForwardCurve | None = None,
     ) -> list[Cashflow]:
-        if self.notional <= 0.0 or self.maturity_years <= 0.0:
-            raise ValueError("notional and maturity_years must be positive")
-        dt = _FREQ_TO_YEARS.get(self.frequency)
-        if dt is None:
-            raise ValueError("unsupported frequency")
-        periods = int(round(self.maturity_years / dt))
-        if periods <= 0:
-            raise ValueError("invalid maturity/frequency combination")
-        if self.interest_only_periods < 0 or self.interest_only_periods >= periods:
-            raise ValueError("interest_only_periods must be in [0, periods)")
+        times, amounts = self._cashflow_columns(discount_model, forward_model)
+        return CashflowArray(times, amounts).as_cashflows()
 
+    def _cashflow_columns(
+        self,
+        discount_model: InterestRateModel,
+        forward_model: InterestRateModel | DeterministicForwardCurve | None = None,
+    ) -> CashflowArray:
+        dt = self._dt
+        periods = self._periods
         schedule = self._scheduled_principal(periods)
-        cashflows: list[Cashflow] = []
+        accrual = dt * self._accrual_scale
+        prepay_rate = self._prepay_rate
+        # One spare slot for the residual-balance flow at maturity.
+        times = np.empty(periods + 1, dtype=np.float64)
+        times[:periods] = np.arange(1, periods + 1) * dt
+        times[periods] = periods * dt
+        amounts = np.empty(periods + 1, dtype=np.float64)
         outstanding = self.notional
 
         for i in range(1, periods + 1):
             t0 = (i - 1) * dt
             t1 = i * dt
 
-            prepay = self._prepayment_amount(outstanding, dt)
+            prepay = outstanding * prepay_rate
             outstanding_after_prepay = max(0.0, outstanding - prepay)
 
             coupon_rate = self._coupon_rate(discount_model, t0, t1, forward_model=forward_model)
-            accrual = self._accrual_factor(dt)
             interest_cf = outstanding_after_prepay * coupon_rate * accrual
 
             scheduled = 0.0
             if i > self.interest_only_periods:
                 scheduled = min(outstanding_after_prepay, schedule[i - 1])
 
-            total = interest_cf + prepay + scheduled
-            cashflows.append(Cashflow(time=t1, amount=total))
+            amounts[i - 1] = interest_cf + prepay + scheduled
             outstanding = max(0.0, outstanding_after_prepay - scheduled)
 
         if outstanding > 1e-8:
-            cashflows.append(Cashflow(time=periods * dt, amount=outstanding))
-        return cashflows
+            amounts[periods] = outstanding
+            return CashflowArray(times, amounts)
+        return CashflowArray(times[:periods], amounts[:periods])
 
     def _coupon_rate(
         self,
@@ -170,39 +276,25 @@ class CorporateBond(Product):
         t1: float,
         forward_model: InterestRateModel | DeterministicForwardCurve | None = None,
     ) -> float:
-        if self.coupon_type == "fixed":
+        if self._coupon_code == CouponType.FIXED:
             return self.fixed_rate
-        if self.coupon_type == "floating":
-            source = forward_model if forward_model is not None else model
-            if isinstance(source, DeterministicForwardCurve):
-                return source.forward_rate(t0, t1) + self.spread
-            return source.forward_rate(t0, t1) + self.spread
-        raise ValueError("coupon_type must be fixed or floating")
-
-    def _scheduled_principal(self, periods: int) -> list[float]:
-        if self.amortization_mode == "bullet":
-            principal = [0.0] * periods
+        source = forward_model if forward_model is not None else model
+        return source.forward_rate(t0, t1) + self.spread
+
+    def _scheduled_principal(self, periods: int) -> np.ndarray:
+        if self._amortization_code == AmortizationMode.BULLET:
+            principal = np.zeros(periods, dtype=np.float64)
             principal[-1] = self.notional
             return principal
-        if self.amortization_mode == "linear":
-            equal = self.notional / periods
-            return [equal] * periods
-        if self.amortization_mode == "custom":
-            if len(self.custom_amortization) != periods:
-                raise ValueError("custom_amortization length must equal number of periods")
-            return [float(x) for x in self.custom_amortization]
-        raise ValueError("amortization_mode must be bullet, linear, or custom")
+        if self._amortization_code == AmortizationMode.LINEAR:
+            return np.full(periods, self.notional / periods, dtype=np.float64)
+        if len(self.custom_amortization) != periods:
+            raise ValueError("custom_amortization length must equal number of periods")
+        return np.asarray(self.custom_amortization, dtype=np.float64)
 
     def _prepayment_amount(self, outstanding: float, dt: float) -> float:
-        if self.periodic_prepayment_rate is not None:
-            rate = max(0.0, self.periodic_prepayment_rate)
-        else:
-            annual = max(0.0, self.annual_cpr)
-            rate = 1.0 - (1.0 - annual) ** dt
-        return outstanding * rate
+        # dt is always the bond's own period length, already folded into _prepay_rate.
+        return outstanding * self._prepay_rate
 
     def _accrual_factor(self, dt: float) -> float:
-        dc = self.day_count.upper()
-        if dc in {"30/360", "ACT/365", "ACT/360"}:
-            return dt
-        raise ValueError("unsupported day_count")
+        return dt * self._accrual_scale
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import math
 
+import numpy as np
+
 from models.base import InterestRateModel
 from models.market import DeterministicFXCurve, DeterministicHazardCurve
-from products.base import Cashflow, Product
+from products.base import CachedModel, Cashflow, CashflowArray, Product
 
 
 def _norm_cdf(x: float) -> float:
@@ -26,22 +28,31 @@ class FXForward(Product):
         return {"net_cashflows": self.get_cashflows(scenario, as_of_date)}
 
     def get_cashflows(self, scenario: dict, as_of_date: str | None = None) -> list[Cashflow]:
-        model = scenario.get("model")
-        fx_curve = scenario.get("fx_curve")
-        if not isinstance(model, InterestRateModel):
-            raise TypeError("scenario['model'] must implement InterestRateModel")
-        if not isinstance(fx_curve, DeterministicFXCurve):
-            raise TypeError("scenario['fx_curve'] must be DeterministicFXCurve")
-        sign = 1.0 if self.pay_foreign_receive_domestic else -1.0
-        payoff = sign * self.notional_foreign * (fx_curve.fx_forward(self.maturity_years) - self.strike)
+        _model, fx_curve = self._curves(scenario)
+        payoff = self._pv_given_fwd_df(fx_curve.fx_forward(self.maturity_years), 1.0)
         return [Cashflow(time=self.maturity_years, amount=payoff)]
 
     def present_value(self, scenario: dict, as_of_date: str | None = None) -> float:
+        # Single payment: two scalar curve lookups, no cashflow list.
+        model, fx_curve = self._curves(scenario)
+        return self._pv_given_fwd_df(fx_curve.fx_forward(self.maturity_years), model.discount_factor(self.maturity_years))
+
+    def _cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        return self.get_cashflow_arrays(scenario, as_of_date)
+
+    def _pv_given_fwd_df(self, fwd: float, df_dom: float) -> float:
+        sign = 1.0 if self.pay_foreign_receive_domestic else -1.0
+        return float(sign * self.notional_foreign * (fwd - self.strike) * df_dom)
+
+    @staticmethod
+    def _curves(scenario: dict) -> tuple[InterestRateModel, DeterministicFXCurve]:
         model = scenario.get("model")
+        fx_curve = scenario.get("fx_curve")
         if not isinstance(model, InterestRateModel):
             raise TypeError("scenario['model'] must implement InterestRateModel")
-        cfs = self.get_cashflows(scenario, as_of_date)
-        return sum(cf.amount * model.discount_factor(cf.time) for cf in cfs)
+        if not isinstance(fx_curve, DeterministicFXCurve):
+            raise TypeError("scenario['fx_curve'] must be DeterministicFXCurve")
+        return model, fx_curve
 
 
 @dataclass(frozen=True)
@@ -57,12 +68,9 @@ class FXSwap(Product):
 
     def leg_cashflows(self, scenario: dict, as_of_date: str | None = None) -> dict[str, list[Cashflow]]:
         """Return near/far leg decomposition for exposure analytics."""
-        if self.far_maturity_years <= self.near_maturity_years:
-            raise ValueError("far_maturity_years must be greater than near_maturity_years")
-        sign = 1.0 if self.pay_foreign_receive_domestic else -1.0
-        implied_far_rate = self.far_rate if self.far_rate is not None else self._implied_far_rate_from_curves(scenario)
-        near_leg = [Cashflow(time=self.near_maturity_years, amount=sign * self.notional_foreign * self.near_rate)]
-        far_leg = [Cashflow(time=self.far_maturity_years, amount=-sign * self.notional_foreign * implied_far_rate)]
+        near_amount, far_amount = self._leg_amounts(scenario)
+        near_leg = [Cashflow(time=self.near_maturity_years, amount=near_amount)]
+        far_leg = [Cashflow(time=self.far_maturity_years, amount=far_amount)]
         return {
             "near_leg_cashflows": near_leg,
             "far_leg_cashflows": far_leg,
@@ -76,7 +84,42 @@ class FXSwap(Product):
         model = scenario.get("model")
         if not isinstance(model, InterestRateModel):
             raise TypeError("scenario['model'] must implement InterestRateModel")
-        return sum(cf.amount * model.discount_factor(cf.time) for cf in self.get_cashflows(scenario, as_of_date))
+        # Two payments: scalar curve lookups beat building arrays for a single trade.
+        near_amount, far_amount = self._leg_amounts(scenario)
+        df_near = model.discount_factor(self.near_maturity_years)
+        df_far = model.discount_factor(self.far_maturity_years)
+        return near_amount * df_near + far_amount * df_far
+
+    def get_cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        return CashflowArray(
+            np.array([self.near_maturity_years, self.far_maturity_years]),
+            np.array(self._leg_amounts(scenario)),
+        )
+
+    def _cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        return self.get_cashflow_arrays(scenario, as_of_date)
+
+    @classmethod
+    def _batch_cashflow_arrays(
+        cls,
+        products: list[Product],
+        scenario: dict,
+        as_of_date: str | None = None,
+    ) -> list[CashflowArray | None]:
+        # One FXSwapBatch prices the curve-implied far rates of every swap in the portfolio.
+        batch = FXSwapBatch(tuple(products))
+        near_amounts, far_amounts = batch.leg_amounts(scenario)
+        times = np.column_stack((batch._near_times, batch._far_times))
+        amounts = np.column_stack((near_amounts, far_amounts))
+        return [CashflowArray(t, a) for t, a in zip(times, amounts)]
+
+    def _leg_amounts(self, scenario: dict) -> tuple[float, float]:
+        """Domestic near-leg and far-leg amounts."""
+        if self.far_maturity_years <= self.near_maturity_years:
+            raise ValueError("far_maturity_years must be greater than near_maturity_years")
+        sign = 1.0 if self.pay_foreign_receive_domestic else -1.0
+        far_rate = self.far_rate if self.far_rate is not None else self._implied_far_rate_from_curves(scenario)
+        return sign * self.notional_foreign * self.near_rate, -sign * self.notional_foreign * far_rate
 
     def _implied_far_rate_from_curves(self, scenario: dict) -> float:
         domestic_model = scenario.get("model")
@@ -87,8 +130,6 @@ class FXSwap(Product):
             raise TypeError("scenario['foreign_model'] must implement InterestRateModel when far_rate is None")
         t_near = self.near_maturity_years
         t_far = self.far_maturity_years
-        if t_far <= t_near:
-            raise ValueError("far_maturity_years must be greater than near_maturity_years")
         if t_far <= 0.0:
             return self.near_rate
         # Broken-date covered interest parity from near date to far date.
@@ -99,6 +140,76 @@ class FXSwap(Product):
         return self.near_rate * (df_f_far / max(df_f_near, 1e-12)) / max(df_d_far / max(df_d_near, 1e-12), 1e-12)
 
 
+@dataclass(frozen=True)
+class FXSwapBatch:
+    """Column view over many FX swaps so curve lookups run once per batch, not per trade."""
+
+    swaps: tuple[FXSwap, ...]
+    _near_times: np.ndarray = field(init=False, repr=False, compare=False)
+    _far_times: np.ndarray = field(init=False, repr=False, compare=False)
+    _near_rates: np.ndarray = field(init=False, repr=False, compare=False)
+    _notionals: np.ndarray = field(init=False, repr=False, compare=False)
+    _signs: np.ndarray = field(init=False, repr=False, compare=False)
+    _quoted: np.ndarray = field(init=False, repr=False, compare=False)
+    _far_quotes: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        swaps = tuple(self.swaps)
+        object.__setattr__(self, "swaps", swaps)
+        near = np.array([s.near_maturity_years for s in swaps], dtype=float)
+        far = np.array([s.far_maturity_years for s in swaps], dtype=float)
+        if np.any(far <= near):
+            raise ValueError("far_maturity_years must be greater than near_maturity_years")
+        object.__setattr__(self, "_near_times", near)
+        object.__setattr__(self, "_far_times", far)
+        object.__setattr__(self, "_near_rates", np.array([s.near_rate for s in swaps], dtype=float))
+        object.__setattr__(self, "_notionals", np.array([s.notional_foreign for s in swaps], dtype=float))
+        object.__setattr__(self, "_signs", np.array([1.0 if s.pay_foreign_receive_domestic else -1.0 for s in swaps]))
+        object.__setattr__(self, "_quoted", np.array([s.far_rate is not None for s in swaps], dtype=bool))
+        object.__setattr__(self, "_far_quotes", np.array([s.far_rate if s.far_rate is not None else np.nan for s in swaps]))
+
+    def far_rates(self, scenario: dict) -> np.ndarray:
+        """Far rates per swap: the quoted rate where given, else covered interest parity."""
+        implied = ~self._quoted
+        rates = self._far_quotes.copy()
+        if not implied.any():
+            return rates
+        domestic_model = scenario.get("model")
+        foreign_model = scenario.get("foreign_model")
+        if not isinstance(domestic_model, InterestRateModel):
+            raise TypeError("scenario['model'] must implement InterestRateModel")
+        if not isinstance(foreign_model, InterestRateModel):
+            raise TypeError("scenario['foreign_model'] must implement InterestRateModel when far_rate is None")
+        t_near = self._near_times[implied]
+        t_far = self._far_times[implied]
+        near_rate = self._near_rates[implied]
+        # Broken-date covered interest parity from near date to far date.
+        df_d_near = domestic_model.discount_factors(t_near)
+        df_d_far = domestic_model.discount_factors(t_far)
+        df_f_near = foreign_model.discount_factors(t_near)
+        df_f_far = foreign_model.discount_factors(t_far)
+        parity = near_rate * (df_f_far / np.maximum(df_f_near, 1e-12)) / np.maximum(df_d_far / np.maximum(df_d_near, 1e-12), 1e-12)
+        rates[implied] = np.where(t_far <= 0.0, near_rate, parity)
+        return rates
+
+    def leg_amounts(self, scenario: dict) -> tuple[np.ndarray, np.ndarray]:
+        """Domestic near-leg and far-leg amounts per swap."""
+        scaled = self._signs * self._notionals
+        return scaled * self._near_rates, -scaled * self.far_rates(scenario)
+
+    def present_values(self, scenario: dict) -> np.ndarray:
+        """PV per swap under ``scenario['model']``."""
+        model = scenario.get("model")
+        if not isinstance(model, InterestRateModel):
+            raise TypeError("scenario['model'] must implement InterestRateModel")
+        near_amounts, far_amounts = self.leg_amounts(scenario)
+        return near_amounts * model.discount_factors(self._near_times) + far_amounts * model.discount_factors(self._far_times)
+
+    def present_value(self, scenario: dict) -> float:
+        """Total PV of the batch."""
+        return float(np.sum(self.present_values(scenario)))
+
+
 @dataclass(frozen=True)
 class EuropeanSwaption(Product):
     """Black-76 European swaption on a fixed-float swap approximation."""
@@ -126,8 +237,8 @@ class EuropeanSwaption(Product):
         n = int(round(tenor * self.fixed_leg_frequency))
         if n <= 0:
             raise ValueError("invalid swap tenor/frequency")
-        payment_times = [expiry + (i + 1) * dt for i in range(n)]
-        annuity = sum(dt * model.discount_factor(t) for t in payment_times)
+        payment_times = expiry + np.arange(1, n + 1) * dt
+        annuity = dt * float(np.sum(model.discount_factors(payment_times)))
         if annuity <= 0.0:
             raise ValueError("annuity must be positive")
 
@@ -179,6 +290,9 @@ class CreditDefaultSwap(Product):
         legs = self.leg_present_values(scenario, as_of_date, as_cashflows=False)
         return float(legs["protection_leg_pv"] - legs["premium_leg_pv"])
 
+    def _cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        return self.get_cashflow_arrays(scenario, as_of_date)
+
     def leg_present_values(
         self,
         scenario: dict,
@@ -197,32 +311,21 @@ class CreditDefaultSwap(Product):
         sign = 1.0 if self.protection_buyer else -1.0
         spread = self.spread_bps / 10_000.0
 
-        premium_cfs: list[Cashflow] = []
-        protection_cfs: list[Cashflow] = []
-        net_cfs: list[Cashflow] = []
-        premium_pv = 0.0
-        protection_pv = 0.0
-
-        for i in range(1, n + 1):
-            t = i * dt
-            survival = hazard_curve.survival_probability(t)
-            default_prob = max(0.0, hazard_curve.survival_probability(t - dt) - survival)
-            premium_amount = sign * self.notional * spread * dt * survival
-            protection_amount = sign * self.notional * (1.0 - self.recovery_rate) * default_prob
-            df = model.discount_factor(t)
-            premium_pv += premium_amount * df
-            protection_pv += protection_amount * df
-
-            premium_cfs.append(Cashflow(time=t, amount=premium_amount))
-            protection_cfs.append(Cashflow(time=t, amount=protection_amount))
-            net_cfs.append(Cashflow(time=t, amount=protection_amount - premium_amount))
+        times = np.arange(1, n + 1) * dt
+        survival = hazard_curve.survival_probability(times)
+        default_prob = np.maximum(0.0, hazard_curve.survival_probability(times - dt) - survival)
+        premium_amounts = sign * self.notional * spread * dt * survival
+        protection_amounts = sign * self.notional * (1.0 - self.recovery_rate) * default_prob
 
         if as_cashflows:
             return {
-                "premium_cashflows": premium_cfs,
-                "protection_cashflows": protection_cfs,
-                "net_cashflows": net_cfs,
+                "premium_cashflows": CashflowArray(times, premium_amounts).as_cashflows(),
+                "protection_cashflows": CashflowArray(times, protection_amounts).as_cashflows(),
+                "net_cashflows": CashflowArray(times, protection_amounts - premium_amounts).as_cashflows(),
             }
+        dfs = model.discount_factors(times)
+        premium_pv = float(np.dot(premium_amounts, dfs))
+        protection_pv = float(np.dot(protection_amounts, dfs))
         return {
             "premium_leg_pv": premium_pv,
             "protection_leg_pv": protection_pv,
@@ -328,7 +431,11 @@ class CrossCurrencySwap(Product):
         domestic_model = scenario.get("model")
         if not isinstance(domestic_model, InterestRateModel):
             raise TypeError("scenario['model'] must implement InterestRateModel")
-        return sum(cf.amount * domestic_model.discount_factor(cf.time) for cf in self.get_cashflows(scenario, as_of_date))
+        times, amounts = self.get_cashflow_arrays(scenario, as_of_date)
+        return float(np.dot(amounts, domestic_model.discount_factors(times)))
+
+    def _cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        return self.get_cashflow_arrays(scenario, as_of_date)
 
     def _leg_cashflows(
         self,
@@ -394,6 +501,8 @@ class InterestRateCapFloor(Product):
             raise TypeError("scenario['model'] must implement InterestRateModel")
         dt = 1.0 / self.payment_frequency
         n = int(round(self.maturity_years * self.payment_frequency))
+        # Each optionlet end date is the next optionlet's start date.
+        model = CachedModel(model)
         return sum(self._optionlet_value(model, (i - 1) * dt, i * dt) for i in range(1, n + 1))
 
     def _optionlet_value(self, model: InterestRateModel, t0: float, t1: float) -> float:
@@ -3,14 +3,29 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 import math
 
+import numpy as np
+
 from models.base import InterestRateModel
-from products.base import Cashflow, Product
+from products.amortization import level_payment
+from products.base import Cashflow, CashflowArray, Product
+from products.conventions import (
+    ACCRUAL_SCALE,
+    DAY_COUNT_CODES,
+    DEFAULT_SEASONALITY_FACTORS,
+    FREQUENCY_CODES,
+    REPAYMENT_TYPE_CODES,
+    DayCount,
+    Frequency,
+    RepaymentType,
+    seasonality_excess,
+)
 
 
-_FREQ_TO_MONTHS = {"monthly": 1, "quarterly": 3, "annual": 12}
+_MORTGAGE_FREQUENCIES = (Frequency.MONTHLY, Frequency.QUARTERLY, Frequency.ANNUAL)
+_MORTGAGE_DAY_COUNTS = (DayCount.THIRTY_360, DayCount.ACT_365)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BehaviouralPrepaymentModel:
     """Deterministic prepayment model combining incentive, age, and seasonality."""
 
@@ -20,37 +35,33 @@ class BehaviouralPrepaymentModel:
     seasonality_weight: float = 0.15
     incentive_slope: float = 12.0
     age_slope: float = 1.0
-    seasonality_factors: tuple[float, ...] = (
-        1.10,
-        1.10,
-        1.00,
-        0.98,
-        0.98,
-        1.00,
-        1.02,
-        1.02,
-        1.00,
-        1.00,
-        1.08,
-        1.12,
-    )
+    seasonality_factors: tuple[float, ...] = DEFAULT_SEASONALITY_FACTORS
     min_cpr: float = 0.0
     max_cpr: float = 0.30
+    _season_offsets: np.ndarray = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if len(self.seasonality_factors) != 12:
             raise ValueError("seasonality_factors must contain 12 monthly values")
         if self.min_cpr < 0.0 or self.max_cpr <= self.min_cpr:
             raise ValueError("invalid CPR bounds")
+        # Seasonality only ever contributes its excess over 1.0; precompute it per month.
+        object.__setattr__(self, "_season_offsets", seasonality_excess(self.seasonality_factors))
 
     def cpr(
         self,
         fixed_rate: float,
-        refinance_rate: float,
-        age_years: float,
+        refinance_rate: float | np.ndarray,
+        age_years: float | np.ndarray,
         maturity_years: float,
-        month_index: int,
-    ) -> float:
+        month_index: int | np.ndarray,
+    ) -> float | np.ndarray:
+        """Annual CPR; ``month_index`` is a calendar month in [1, 12].
+
+        Scalars take a pure-Python path; array arguments are evaluated in one pass by ``cpr_vec``.
+        """
+        if np.ndim(refinance_rate) or np.ndim(age_years) or np.ndim(month_index):
+            return self.cpr_vec(fixed_rate, refinance_rate, age_years, maturity_years, month_index)
         if maturity_years <= 0.0:
             raise ValueError("maturity_years must be positive")
         if not (1 <= month_index <= 12):
@@ -59,8 +70,7 @@ class BehaviouralPrepaymentModel:
         incentive = max(0.0, fixed_rate - refinance_rate)
         incentive_component = 1.0 - math.exp(-self.incentive_slope * incentive)
         age_component = min(1.0, max(0.0, self.age_slope * age_years / maturity_years))
-        seasonality_raw = self.seasonality_factors[month_index - 1]
-        seasonality_component = max(0.0, seasonality_raw - 1.0)
+        seasonality_component = self._season_offsets.item(month_index - 1)
 
         combined = (
             self.base_cpr
@@ -70,8 +80,36 @@ class BehaviouralPrepaymentModel:
         )
         return min(self.max_cpr, max(self.min_cpr, combined))
 
+    def cpr_vec(
+        self,
+        fixed_rate: float,
+        refinance_rates: np.ndarray,
+        age_years: np.ndarray,
+        maturity_years: float,
+        month_indices: np.ndarray,
+    ) -> np.ndarray:
+        """Vectorized ``cpr`` over aligned per-period arrays."""
+        if maturity_years <= 0.0:
+            raise ValueError("maturity_years must be positive")
+        months = np.asarray(month_indices, dtype=np.intp)
+        if np.any((months < 1) | (months > 12)):
+            raise ValueError("month_index must be in [1, 12]")
+
+        incentive = np.maximum(0.0, fixed_rate - np.asarray(refinance_rates, dtype=np.float64))
+        incentive_component = 1.0 - np.exp(-self.incentive_slope * incentive)
+        age_component = np.clip(self.age_slope * np.asarray(age_years, dtype=np.float64) / maturity_years, 0.0, 1.0)
+        seasonality_component = self._season_offsets[months - 1]
 
-@dataclass(frozen=True)
+        combined = (
+            self.base_cpr
+            + self.incentive_weight * incentive_component
+            + self.age_weight * age_component
+            + self.seasonality_weight * seasonality_component
+        )
+        return np.clip(combined, self.min_cpr, self.max_cpr)
+
+
+@dataclass(frozen=True, slots=True)
 class GermanFixedRateMortgageLoan(Product):
     """German-style fixed-rate mortgage with optional behavioural prepayments."""
 
@@ -84,6 +122,44 @@ class GermanFixedRateMortgageLoan(Product):
     day_count: str = "30/360"
     prepayment_model: BehaviouralPrepaymentModel | None = field(default=None)
     start_month: int = 1
+    _months_per_period: int = field(init=False, repr=False, compare=False)
+    _day_count_code: int = field(init=False, repr=False, compare=False)
+    _accrual_scale: float = field(init=False, repr=False, compare=False)
+    _repayment_code: int = field(init=False, repr=False, compare=False)
+    _periods: int = field(init=False, repr=False, compare=False)
+    _dt: float = field(init=False, repr=False, compare=False)
+    _io_periods: int = field(init=False, repr=False, compare=False)
+    _amort_periods: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Resolve string conventions once so the per-period loop only compares ints.
+        months_per_period = FREQUENCY_CODES.get(self.payment_frequency)
+        if months_per_period not in _MORTGAGE_FREQUENCIES:
+            raise ValueError("payment_frequency must be one of: monthly, quarterly, annual")
+        if self.maturity_years <= 0.0:
+            raise ValueError("maturity_years must be positive")
+        if self.notional <= 0.0:
+            raise ValueError("notional must be positive")
+        if self.start_month < 1 or self.start_month > 12:
+            raise ValueError("start_month must be in [1, 12]")
+        day_count_code = DAY_COUNT_CODES.get(self.day_count.upper())
+        if day_count_code not in _MORTGAGE_DAY_COUNTS:
+            raise ValueError("day_count must be one of: 30/360, ACT/365")
+        repayment_code = REPAYMENT_TYPE_CODES.get(self.repayment_type)
+        if repayment_code is None:
+            raise ValueError(
+                "repayment_type must be one of: annuity, constant_repayment, interest_only_then_amortizing"
+            )
+        object.__setattr__(self, "_months_per_period", int(months_per_period))
+        object.__setattr__(self, "_day_count_code", int(day_count_code))
+        object.__setattr__(self, "_accrual_scale", ACCRUAL_SCALE[day_count_code])
+        object.__setattr__(self, "_repayment_code", int(repayment_code))
+        periods = int(round(self.maturity_years * 12 / months_per_period))
+        io_periods = int(round(self.interest_only_years * 12 / months_per_period))
+        object.__setattr__(self, "_periods", periods)
+        object.__setattr__(self, "_dt", months_per_period / 12.0)
+        object.__setattr__(self, "_io_periods", io_periods)
+        object.__setattr__(self, "_amort_periods", periods - io_periods)
 
     def get_cashflows(self, scenario: dict, as_of_date: str | None = None) -> list[Cashflow]:
         model = scenario.get("model")
@@ -91,108 +167,101 @@ class GermanFixedRateMortgageLoan(Product):
             raise TypeError("scenario['model'] must implement InterestRateModel")
         return self._expected_cashflows(model)
 
+    def get_cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        model = scenario.get("model")
+        if not isinstance(model, InterestRateModel):
+            raise TypeError("scenario['model'] must implement InterestRateModel")
+        return self._expected_cashflow_columns(model)
+
+    def _cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        return self.get_cashflow_arrays(scenario, as_of_date)
+
     def present_value(self, scenario: dict, as_of_date: str | None = None) -> float:
         model = scenario.get("model")
         if not isinstance(model, InterestRateModel):
             raise TypeError("scenario['model'] must implement InterestRateModel")
-        return sum(cf.amount * model.discount_factor(cf.time) for cf in self._expected_cashflows(model))
+        times, amounts = self._expected_cashflow_columns(model)
+        return float(np.dot(amounts, model.discount_factors(times)))
 
     def _expected_cashflows(self, model: InterestRateModel) -> list[Cashflow]:
-        months_per_period = _FREQ_TO_MONTHS.get(self.payment_frequency)
-        if months_per_period is None:
-            raise ValueError("payment_frequency must be one of: monthly, quarterly, annual")
-        if self.maturity_years <= 0.0:
-            raise ValueError("maturity_years must be positive")
-        if self.notional <= 0.0:
-            raise ValueError("notional must be positive")
-        if self.start_month < 1 or self.start_month > 12:
-            raise ValueError("start_month must be in [1, 12]")
+        times, amounts = self._expected_cashflow_columns(model)
+        return CashflowArray(times, amounts).as_cashflows()
 
-        periods = int(round(self.maturity_years * 12 / months_per_period))
-        dt = months_per_period / 12.0
+    def _expected_cashflow_columns(self, model: InterestRateModel) -> CashflowArray:
+        periods = self._periods
+        dt = self._dt
         rate_per_period = self.fixed_rate * self._day_count_factor(dt)
-        interest_only_periods = int(round(self.interest_only_years * 12 / months_per_period))
+        interest_only_periods = self._io_periods
 
         balance = self.notional
-        cashflows: list[Cashflow] = []
-        annuity_payment = self._annuity_payment(rate_per_period, periods, interest_only_periods)
+        # One spare slot for the residual-balance flow at maturity.
+        times = np.empty(periods + 1, dtype=np.float64)
+        amounts = np.empty(periods + 1, dtype=np.float64)
+        n = 0
+        annuity_payment = self._annuity_payment(rate_per_period)
         const_principal = 0.0
-        if self.repayment_type == "constant_repayment":
-            amort_periods = max(1, periods - interest_only_periods)
-            const_principal = self.notional / amort_periods
+        repayment_code = self._repayment_code
+        if repayment_code == RepaymentType.CONSTANT_REPAYMENT:
+            const_principal = self.notional / max(1, self._amort_periods)
+        smms = self._single_monthly_mortalities(model, periods, dt)
 
         for i in range(1, periods + 1):
             if balance <= 1e-8:
                 break
-            t0 = (i - 1) * dt
             t1 = i * dt
             interest_cf = balance * rate_per_period
 
             if i <= interest_only_periods:
                 scheduled_principal = 0.0
-            elif self.repayment_type == "annuity":
+            elif repayment_code == RepaymentType.ANNUITY:
                 scheduled_principal = max(0.0, annuity_payment - interest_cf)
-            elif self.repayment_type == "constant_repayment":
+            elif repayment_code == RepaymentType.CONSTANT_REPAYMENT:
                 scheduled_principal = const_principal
-            elif self.repayment_type == "interest_only_then_amortizing":
+            else:
                 remaining_periods = max(1, periods - i + 1)
                 scheduled_principal = balance / remaining_periods
-            else:
-                raise ValueError(
-                    "repayment_type must be one of: annuity, constant_repayment, interest_only_then_amortizing"
-                )
 
             scheduled_principal = min(balance, scheduled_principal)
             post_sched_balance = balance - scheduled_principal
-            prepay = self._prepayment_amount(model, t0, t1, i, post_sched_balance)
-            prepay = min(post_sched_balance, prepay)
+            prepay = 0.0
+            if smms is not None and post_sched_balance > 0.0:
+                prepay = min(post_sched_balance, post_sched_balance * smms[i - 1])
 
-            total_cf = interest_cf + scheduled_principal + prepay
-            cashflows.append(Cashflow(time=t1, amount=total_cf))
+            times[n] = t1
+            amounts[n] = interest_cf + scheduled_principal + prepay
+            n += 1
             balance = post_sched_balance - prepay
 
         if balance > 1e-8:
-            cashflows.append(Cashflow(time=periods * dt, amount=balance))
-        return cashflows
-
-    def _annuity_payment(self, rate_per_period: float, periods: int, interest_only_periods: int) -> float:
-        amort_periods = periods - interest_only_periods
-        if amort_periods <= 0:
-            return 0.0
-        if rate_per_period == 0.0:
-            return self.notional / amort_periods
+            times[n] = periods * dt
+            amounts[n] = balance
+            n += 1
+        return CashflowArray(times[:n], amounts[:n])
+
+    def _annuity_payment(self, rate_per_period: float) -> float:
         # Payment level applies from first amortizing period onward.
-        return self.notional * rate_per_period / (1.0 - (1.0 + rate_per_period) ** (-amort_periods))
+        return level_payment(self.notional, rate_per_period, self._amort_periods)
 
-    def _prepayment_amount(
-        self,
-        model: InterestRateModel,
-        t0: float,
-        t1: float,
-        period_idx: int,
-        outstanding_after_sched: float,
-    ) -> float:
-        if self.prepayment_model is None or outstanding_after_sched <= 0.0:
-            return 0.0
-
-        remaining = max(1e-6, self.maturity_years - t0)
-        refinance_rate = model.forward_rate(t0, min(self.maturity_years, t0 + remaining))
-        age_years = t0
-        month = ((self.start_month - 1) + period_idx - 1) % 12 + 1
-        annual_cpr = self.prepayment_model.cpr(
+    def _single_monthly_mortalities(self, model: InterestRateModel, periods: int, dt: float) -> np.ndarray | None:
+        """Per-period prepayment fractions for the whole horizon, or None without a prepayment model."""
+        if self.prepayment_model is None:
+            return None
+
+        t0 = np.arange(periods) * dt
+        t1 = np.arange(1, periods + 1) * dt
+        # Refinancing is priced over the remaining term; every period starts before maturity.
+        refinance_rates = model.forward_rates(t0, np.full(periods, self.maturity_years))
+        months = (self.start_month - 1 + np.arange(periods)) % 12 + 1
+        annual_cprs = self.prepayment_model.cpr_vec(
             fixed_rate=self.fixed_rate,
-            refinance_rate=refinance_rate,
-            age_years=age_years,
+            refinance_rates=refinance_rates,
+            age_years=t0,
             maturity_years=self.maturity_years,
-            month_index=month,
+            month_indices=months,
         )
-        dt = max(1e-8, t1 - t0)
-        smm = 1.0 - (1.0 - annual_cpr) ** dt
-        return outstanding_after_sched * smm
+        with np.errstate(divide="ignore"):
+            # log1p(-1) = -inf maps a 100% CPR to a full prepayment.
+            return -np.expm1(np.maximum(1e-8, t1 - t0) * np.log1p(-annual_cprs))
 
     def _day_count_factor(self, dt: float) -> float:
-        if self.day_count.upper() == "30/360":
-            return dt
-        if self.day_count.upper() == "ACT/365":
-            return dt
-        raise ValueError("day_count must be one of: 30/360, ACT/365")
+        return dt * self._accrual_scale
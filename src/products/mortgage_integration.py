@@ -1,13 +1,41 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import math
 
-from models.base import InterestRateModel
-from products.base import Cashflow, Product
-
+import numpy as np
 
-_FREQ_TO_MONTHS = {"monthly": 1, "quarterly": 3, "annual": 12}
+from models.base import InterestRateModel
+from products.amortization import level_payment
+from products.base import Cashflow, CashflowArray, Product
+from products.conventions import (
+    ACCRUAL_SCALE,
+    DAY_COUNT_CODES,
+    DEFAULT_SEASONALITY_FACTORS,
+    FREQUENCY_CODES,
+    REPAYMENT_TYPE_CODES,
+    DayCount,
+    Frequency,
+    RepaymentType,
+    seasonality_excess,
+)
+
+
+_MORTGAGE_FREQUENCIES = (Frequency.MONTHLY, Frequency.QUARTERLY, Frequency.ANNUAL)
+_MORTGAGE_DAY_COUNTS = (DayCount.THIRTY_360, DayCount.ACT_365)
+# Order of the arrays returned by the schedule routines.
+_SCHEDULE_COLUMN_NAMES = (
+    "t0",
+    "t1",
+    "begin_balance",
+    "interest_cashflow",
+    "scheduled_principal",
+    "prepayment",
+    "total_cashflow",
+    "end_balance",
+    "annual_cpr",
+    "smm",
+)
 
 
 @dataclass(frozen=True)
@@ -20,18 +48,38 @@ class MortgageConfig:
     interest_only_years: float = 0.0
     day_count: str = "30/360"
     start_month: int = 1
+    _day_count_key: str = field(init=False, repr=False, compare=False)
+    _accrual_scale: float = field(init=False, repr=False, compare=False)
+    _months_per_period: int = field(init=False, repr=False, compare=False)
+    _repayment_code: int = field(init=False, repr=False, compare=False)
 
-    def validate(self) -> None:
+    def __post_init__(self) -> None:
+        # Resolve string conventions once; generators and schedule loops only see ints.
         if self.notional <= 0.0:
             raise ValueError("notional must be positive")
         if self.maturity_years <= 0.0:
             raise ValueError("maturity_years must be positive")
-        if self.payment_frequency not in _FREQ_TO_MONTHS:
+        months_per_period = FREQUENCY_CODES.get(self.payment_frequency)
+        if months_per_period not in _MORTGAGE_FREQUENCIES:
             raise ValueError("payment_frequency must be one of: monthly, quarterly, annual")
         if self.start_month < 1 or self.start_month > 12:
             raise ValueError("start_month must be in [1, 12]")
-        if self.day_count.upper() not in {"30/360", "ACT/365"}:
+        day_count_key = self.day_count.upper()
+        day_count_code = DAY_COUNT_CODES.get(day_count_key)
+        if day_count_code not in _MORTGAGE_DAY_COUNTS:
             raise ValueError("day_count must be one of: 30/360, ACT/365")
+        repayment_code = REPAYMENT_TYPE_CODES.get(self.repayment_type)
+        if repayment_code is None:
+            raise ValueError(
+                "repayment_type must be one of: annuity, constant_repayment, interest_only_then_amortizing"
+            )
+        object.__setattr__(self, "_day_count_key", day_count_key)
+        object.__setattr__(self, "_accrual_scale", ACCRUAL_SCALE[day_count_code])
+        object.__setattr__(self, "_months_per_period", int(months_per_period))
+        object.__setattr__(self, "_repayment_code", int(repayment_code))
+
+    def validate(self) -> None:
+        """Kept for compatibility; the config is validated at construction."""
 
 
 class PrepaymentModel:
@@ -46,6 +94,34 @@ class PrepaymentModel:
     ) -> float:
         raise NotImplementedError
 
+    def batch_annual_cpr(
+        self,
+        *,
+        fixed_rate: float,
+        refinance_rates: np.ndarray,
+        age_years: np.ndarray,
+        maturity_years: float,
+        month_indices: np.ndarray,
+    ) -> np.ndarray:
+        """Annual CPR for every period at once; models override this with array math."""
+        return np.array(
+            [
+                self.annual_cpr(
+                    fixed_rate=fixed_rate,
+                    refinance_rate=refinance,
+                    age_years=age,
+                    maturity_years=maturity_years,
+                    month_index=month,
+                )
+                for refinance, age, month in zip(
+                    np.asarray(refinance_rates, dtype=float).tolist(),
+                    np.asarray(age_years, dtype=float).tolist(),
+                    np.asarray(month_indices).tolist(),
+                )
+            ],
+            dtype=float,
+        )
+
 
 @dataclass(frozen=True)
 class ConstantCPRPrepayment(PrepaymentModel):
@@ -62,6 +138,17 @@ class ConstantCPRPrepayment(PrepaymentModel):
         ) -> float:
         return max(0.0, float(self.cpr))
 
+    def batch_annual_cpr(
+        self,
+        *,
+        fixed_rate: float,
+        refinance_rates: np.ndarray,
+        age_years: np.ndarray,
+        maturity_years: float,
+        month_indices: np.ndarray,
+    ) -> np.ndarray:
+        return np.full(len(refinance_rates), max(0.0, float(self.cpr)))
+
 
 @dataclass(frozen=True)
 class CleanRoomBehaviouralPrepayment(PrepaymentModel):
@@ -73,20 +160,7 @@ class CleanRoomBehaviouralPrepayment(PrepaymentModel):
     seasonality_weight: float = 0.15
     incentive_slope: float = 12.0
     age_slope: float = 1.0
-    seasonality_factors: tuple[float, ...] = (
-        1.10,
-        1.10,
-        1.00,
-        0.98,
-        0.98,
-        1.00,
-        1.02,
-        1.02,
-        1.00,
-        1.00,
-        1.08,
-        1.12,
-    )
+    seasonality_factors: tuple[float, ...] = DEFAULT_SEASONALITY_FACTORS
     min_cpr: float = 0.0
     max_cpr: float = 0.30
 
@@ -95,6 +169,8 @@ class CleanRoomBehaviouralPrepayment(PrepaymentModel):
             raise ValueError("seasonality_factors must contain 12 monthly values")
         if self.min_cpr < 0.0 or self.max_cpr <= self.min_cpr:
             raise ValueError("invalid CPR bounds")
+        # Month-indexed seasonality uplift shared by the scalar and batched CPR paths.
+        object.__setattr__(self, "_seasonality_excess", seasonality_excess(self.seasonality_factors))
 
     def annual_cpr(
         self,
@@ -113,7 +189,7 @@ class CleanRoomBehaviouralPrepayment(PrepaymentModel):
         incentive = max(0.0, fixed_rate - refinance_rate)
         incentive_component = 1.0 - math.exp(-self.incentive_slope * incentive)
         age_component = min(1.0, max(0.0, self.age_slope * age_years / maturity_years))
-        seasonality_component = max(0.0, self.seasonality_factors[month_index - 1] - 1.0)
+        seasonality_component = self._seasonality_excess.item(month_index - 1)
 
         combined = (
             self.base_cpr
@@ -123,8 +199,36 @@ class CleanRoomBehaviouralPrepayment(PrepaymentModel):
         )
         return min(self.max_cpr, max(self.min_cpr, combined))
 
+    def batch_annual_cpr(
+        self,
+        *,
+        fixed_rate: float,
+        refinance_rates: np.ndarray,
+        age_years: np.ndarray,
+        maturity_years: float,
+        month_indices: np.ndarray,
+    ) -> np.ndarray:
+        if maturity_years <= 0.0:
+            raise ValueError("maturity_years must be positive")
+        months = np.asarray(month_indices)
+        if np.any((months < 1) | (months > 12)):
+            raise ValueError("month_index must be in [1, 12]")
 
-@dataclass(frozen=True)
+        incentive = np.maximum(0.0, fixed_rate - np.asarray(refinance_rates, dtype=float))
+        incentive_component = 1.0 - np.exp(-self.incentive_slope * incentive)
+        age_component = np.clip(self.age_slope * np.asarray(age_years, dtype=float) / maturity_years, 0.0, 1.0)
+        seasonality_component = self._seasonality_excess[months - 1]
+
+        combined = (
+            self.base_cpr
+            + self.incentive_weight * incentive_component
+            + self.age_weight * age_component
+            + self.seasonality_weight * seasonality_component
+        )
+        return np.clip(combined, self.min_cpr, self.max_cpr)
+
+
+@dataclass(frozen=True, slots=True)
 class MortgagePeriodBreakdown:
     period_index: int
     t0: float
@@ -139,143 +243,276 @@ class MortgagePeriodBreakdown:
     smm: float
 
 
+def _scheduled_principal_terms(
+    rate_per_period: float,
+    periods: int,
+    io_periods: int,
+    repayment_code: int,
+    const_principal: float,
+    annuity_payment: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-period ``(fixed, slope)`` with scheduled principal ``max(0, fixed + slope * balance)``.
+
+    Resolves the repayment type once, outside the recursion.
+    """
+    i = np.arange(1, periods + 1)
+    if repayment_code == RepaymentType.ANNUITY:
+        fixed = np.full(periods, annuity_payment)
+        slope = np.full(periods, -rate_per_period)
+    elif repayment_code == RepaymentType.CONSTANT_REPAYMENT:
+        fixed = np.full(periods, const_principal)
+        slope = np.zeros(periods)
+    else:
+        fixed = np.zeros(periods)
+        slope = 1.0 / np.maximum(1, periods - i + 1)
+    interest_only = i <= io_periods
+    fixed[interest_only] = 0.0
+    slope[interest_only] = 0.0
+    return fixed, slope
+
+
+def _period_smms(annual_cprs: np.ndarray, dt: float) -> np.ndarray:
+    """Per-period prepayment fractions ``1 - (1 - cpr) ** dt`` for a CPR vector."""
+    cprs = np.clip(annual_cprs, 0.0, 1.0)
+    with np.errstate(divide="ignore"):
+        # log1p(-1) = -inf maps a 100% CPR to a full prepayment.
+        return -np.expm1(max(1e-8, dt) * np.log1p(-cprs))
+
+
+def _schedule_kernel(
+    notional: float,
+    rate_per_period: float,
+    dt: float,
+    periods: int,
+    scheduled_fixed: np.ndarray,
+    scheduled_slope: np.ndarray,
+    cprs: np.ndarray,
+    period_smms: np.ndarray,
+) -> tuple[np.ndarray, ...]:
+    """Amortization recursion with prepayment on plain scalars.
+
+    Only the balance-dependent quantities are computed in the loop; the
+    remaining columns are derived afterwards, with the early exit on an
+    exhausted balance applied as a truncation. Returns the schedule columns
+    (t0, t1, begin, interest, scheduled, prepayment, total, end, annual_cpr,
+    smm), including the residual-balance row if any.
+    """
+    # A full prepayment (SMM of one) clears the balance, so the recursion cannot run past it.
+    full_prepayments = np.flatnonzero(period_smms >= 1.0)
+    limit = int(full_prepayments[0]) + 1 if full_prepayments.size else periods
+    begins = np.empty(limit, dtype=np.float64)
+    scheduleds = np.empty(limit, dtype=np.float64)
+    prepays = np.empty(limit, dtype=np.float64)
+    # Python floats keep the scalar recursion off numpy scalar arithmetic.
+    fixed_terms = scheduled_fixed.tolist()
+    slope_terms = scheduled_slope.tolist()
+    smm_terms = period_smms.tolist()
+
+    balance = notional
+    n = 0
+    # The balance check remains for amortization that exhausts the loan ahead of schedule.
+    while n < limit and balance > 1e-8:
+        scheduled = fixed_terms[n] + slope_terms[n] * balance
+        if scheduled < 0.0:
+            scheduled = 0.0
+        if scheduled > balance:
+            scheduled = balance
+        post_sched = balance - scheduled
+        # SMMs lie in [0, 1], so the prepayment never exceeds the post-schedule balance.
+        prepay = post_sched * smm_terms[n]
+        begins[n] = balance
+        scheduleds[n] = scheduled
+        prepays[n] = prepay
+        balance = post_sched - prepay
+        n += 1
+
+    begins = begins[:n]
+    scheduleds = scheduleds[:n]
+    prepays = prepays[:n]
+    post_sched = begins - scheduleds
+    interests = begins * rate_per_period
+    totals = interests + scheduleds + prepays
+    ends = post_sched - prepays
+    prepaying = post_sched > 0.0
+    applied_cprs = np.where(prepaying, cprs[:n], 0.0)
+    smms = np.where(prepaying, period_smms[:n], 0.0)
+    t0s = np.arange(n) * dt
+    t1s = np.arange(1, n + 1) * dt
+    columns = [t0s, t1s, begins, interests, scheduleds, prepays, totals, ends, applied_cprs, smms]
+    if balance > 1e-8:
+        tail = (periods * dt, periods * dt, balance, 0.0, 0.0, 0.0, balance, 0.0, 0.0, 0.0)
+        columns = [np.append(column, value) for column, value in zip(columns, tail)]
+    return tuple(columns)
+
+
 @dataclass(frozen=True)
 class MortgageCashflowGenerator:
     config: MortgageConfig
     prepayment_model: PrepaymentModel | None = None
+    _months_per_period: int = field(init=False, repr=False, compare=False)
+    _dt: float = field(init=False, repr=False, compare=False)
+    _periods: int = field(init=False, repr=False, compare=False)
+    _io_periods: int = field(init=False, repr=False, compare=False)
+    _rate_per_period: float = field(init=False, repr=False, compare=False)
+    _annuity_payment_amount: float = field(init=False, repr=False, compare=False)
+    _const_principal: float = field(init=False, repr=False, compare=False)
+    _repayment_code: int = field(init=False, repr=False, compare=False)
+    _scheduled_fixed: np.ndarray = field(init=False, repr=False, compare=False)
+    _scheduled_slope: np.ndarray = field(init=False, repr=False, compare=False)
+    _period_starts: np.ndarray = field(init=False, repr=False, compare=False)
+    _month_indices: np.ndarray = field(init=False, repr=False, compare=False)
+    _maturity_ends: np.ndarray = field(init=False, repr=False, compare=False)
+    _static_columns: tuple[np.ndarray, ...] | None = field(init=False, repr=False, compare=False)
 
-    def generate(self, model: InterestRateModel) -> list[Cashflow]:
-        return [
-            Cashflow(time=row.t1, amount=row.total_cashflow)
-            for row in self.generate_schedule(model)
-        ]
-
-    def generate_schedule(self, model: InterestRateModel) -> list[MortgagePeriodBreakdown]:
+    def __post_init__(self) -> None:
+        # The config is frozen, so schedule constants are resolved once per generator.
         cfg = self.config
-        cfg.validate()
-        months_per_period = _FREQ_TO_MONTHS[cfg.payment_frequency]
-
+        repayment_code = cfg._repayment_code
+        months_per_period = cfg._months_per_period
         periods = int(round(cfg.maturity_years * 12 / months_per_period))
         dt = months_per_period / 12.0
-        interest_only_periods = int(round(cfg.interest_only_years * 12 / months_per_period))
-        rate_per_period = cfg.fixed_rate * self._day_count_factor(cfg.day_count, dt)
-
-        balance = cfg.notional
-        annuity_payment = self._annuity_payment(rate_per_period, periods, interest_only_periods)
+        io_periods = int(round(cfg.interest_only_years * 12 / months_per_period))
+        rate_per_period = cfg.fixed_rate * self._day_count_factor(cfg._accrual_scale, dt)
         const_principal = 0.0
-        if cfg.repayment_type == "constant_repayment":
-            const_principal = cfg.notional / max(1, periods - interest_only_periods)
-
-        rows: list[MortgagePeriodBreakdown] = []
-        for i in range(1, periods + 1):
-            if balance <= 1e-8:
-                break
-            t0 = (i - 1) * dt
-            t1 = i * dt
-            begin_balance = balance
-            interest_cf = balance * rate_per_period
-            scheduled = self._scheduled_principal(
-                repayment_type=cfg.repayment_type,
-                i=i,
-                periods=periods,
-                interest_only_periods=interest_only_periods,
-                annuity_payment=annuity_payment,
-                interest_cf=interest_cf,
-                const_principal=const_principal,
-                balance=balance,
+        if repayment_code == RepaymentType.CONSTANT_REPAYMENT:
+            const_principal = cfg.notional / max(1, periods - io_periods)
+
+        object.__setattr__(self, "_months_per_period", months_per_period)
+        object.__setattr__(self, "_dt", dt)
+        object.__setattr__(self, "_periods", periods)
+        object.__setattr__(self, "_io_periods", io_periods)
+        object.__setattr__(self, "_rate_per_period", rate_per_period)
+        object.__setattr__(self, "_annuity_payment_amount", self._annuity_payment(rate_per_period, periods, io_periods))
+        object.__setattr__(self, "_const_principal", const_principal)
+        object.__setattr__(self, "_repayment_code", repayment_code)
+        scheduled_fixed, scheduled_slope = _scheduled_principal_terms(
+            rate_per_period, periods, io_periods, repayment_code, const_principal, self._annuity_payment_amount
+        )
+        object.__setattr__(self, "_scheduled_fixed", scheduled_fixed)
+        object.__setattr__(self, "_scheduled_slope", scheduled_slope)
+
+        # Scenario-independent inputs, shared by every valuation of this generator.
+        period_starts = np.arange(periods) * dt
+        month_indices = (cfg.start_month - 1 + np.arange(periods)) % 12 + 1
+        maturity_ends = np.full(periods, cfg.maturity_years)
+        static_columns = None
+        if self.prepayment_model is None or type(self.prepayment_model) is ConstantCPRPrepayment:
+            # Without prepayment, or with a constant CPR that ignores the curve, the schedule is
+            # fixed at construction. It goes through the same recursion as prepaying loans so the
+            # residual-balance row appears under the same rule.
+            if self.prepayment_model is None:
+                cprs = smms = np.zeros(periods)
+            else:
+                cprs = np.full(periods, max(0.0, float(self.prepayment_model.cpr)))
+                smms = _period_smms(cprs, dt)
+            static_columns = _schedule_kernel(
+                cfg.notional,
+                rate_per_period,
+                dt,
+                periods,
+                scheduled_fixed,
+                scheduled_slope,
+                cprs,
+                smms,
             )
-            scheduled = min(balance, scheduled)
-            post_sched = balance - scheduled
-
-            prepay = 0.0
-            cpr = 0.0
-            smm = 0.0
-            if self.prepayment_model is not None and post_sched > 0.0:
-                remaining = max(1e-6, cfg.maturity_years - t0)
-                refinance = model.forward_rate(t0, min(cfg.maturity_years, t0 + remaining))
-                month = ((cfg.start_month - 1) + i - 1) % 12 + 1
-                cpr = self.prepayment_model.annual_cpr(
-                    fixed_rate=cfg.fixed_rate,
-                    refinance_rate=refinance,
-                    age_years=t0,
-                    maturity_years=cfg.maturity_years,
-                    month_index=month,
-                )
-                smm = 1.0 - (1.0 - max(0.0, cpr)) ** max(1e-8, dt)
-                prepay = min(post_sched, post_sched * smm)
-            end_balance = post_sched - prepay
-            total_cf = interest_cf + scheduled + prepay
-
-            rows.append(
-                MortgagePeriodBreakdown(
-                    period_index=i,
-                    t0=t0,
-                    t1=t1,
-                    begin_balance=begin_balance,
-                    interest_cashflow=interest_cf,
-                    scheduled_principal=scheduled,
-                    prepayment=prepay,
-                    total_cashflow=total_cf,
-                    end_balance=end_balance,
-                    annual_cpr=cpr,
-                    smm=smm,
-                )
+        for array in (period_starts, month_indices, maturity_ends, *(static_columns or ())):
+            array.flags.writeable = False
+        object.__setattr__(self, "_period_starts", period_starts)
+        object.__setattr__(self, "_month_indices", month_indices)
+        object.__setattr__(self, "_maturity_ends", maturity_ends)
+        object.__setattr__(self, "_static_columns", static_columns)
+
+    def generate(self, model: InterestRateModel) -> list[Cashflow]:
+        times, amounts = self._generate_totals_only(model)
+        return CashflowArray(times, amounts).as_cashflows()
+
+    def generate_schedule(self, model: InterestRateModel) -> list[MortgagePeriodBreakdown]:
+        columns = self._schedule_columns(model)
+        return [
+            MortgagePeriodBreakdown(
+                period_index=i,
+                t0=t0,
+                t1=t1,
+                begin_balance=begin,
+                interest_cashflow=interest,
+                scheduled_principal=scheduled,
+                prepayment=prepay,
+                total_cashflow=total,
+                end_balance=end_balance,
+                annual_cpr=cpr,
+                smm=smm,
             )
-            balance = end_balance
-
-        if balance > 1e-8:
-            rows.append(
-                MortgagePeriodBreakdown(
-                    period_index=periods + 1,
-                    t0=periods * dt,
-                    t1=periods * dt,
-                    begin_balance=balance,
-                    interest_cashflow=0.0,
-                    scheduled_principal=0.0,
-                    prepayment=0.0,
-                    total_cashflow=balance,
-                    end_balance=0.0,
-                    annual_cpr=0.0,
-                    smm=0.0,
-                )
+            for i, t0, t1, begin, interest, scheduled, prepay, total, end_balance, cpr, smm in zip(
+                range(1, len(columns[0]) + 1), *(column.tolist() for column in columns)
             )
-        return rows
+        ]
+
+    def generate_schedule_arrays(self, model: InterestRateModel) -> dict[str, np.ndarray]:
+        """Column-oriented schedule keyed by ``MortgagePeriodBreakdown`` field names."""
+        columns = self._schedule_columns(model)
+        return {
+            "period_index": np.arange(1, len(columns[0]) + 1),
+            # Copies, so callers cannot see or alter the cached no-prepayment schedule.
+            **{name: column.copy() for name, column in zip(_SCHEDULE_COLUMN_NAMES, columns)},
+        }
+
+    def _generate_totals_only(self, model: InterestRateModel) -> CashflowArray:
+        """Payment times and total cashflows, without building schedule rows."""
+        columns = self._schedule_columns(model)
+        return CashflowArray(columns[1], columns[6])
+
+    def _schedule_columns(self, model: InterestRateModel) -> tuple[np.ndarray, ...]:
+        if self._static_columns is not None:
+            # Without prepayment, or with a constant CPR, the schedule does not depend on the scenario.
+            return self._static_columns
+        cprs = self._annual_cprs(model)
+        return _schedule_kernel(
+            self.config.notional,
+            self._rate_per_period,
+            self._dt,
+            self._periods,
+            self._scheduled_fixed,
+            self._scheduled_slope,
+            cprs,
+            _period_smms(cprs, self._dt),
+        )
+
+    def _annual_cprs(self, model: InterestRateModel) -> np.ndarray:
+        """Per-period annual CPRs from the prepayment model."""
+        cfg = self.config
+        # Refinancing is priced over the remaining term; every period starts before maturity.
+        refinance_rates = model.forward_rates(self._period_starts, self._maturity_ends)
+        return self.prepayment_model.batch_annual_cpr(
+            fixed_rate=cfg.fixed_rate,
+            refinance_rates=refinance_rates,
+            age_years=self._period_starts,
+            maturity_years=cfg.maturity_years,
+            month_indices=self._month_indices,
+        )
 
     def _annuity_payment(self, rate_per_period: float, periods: int, io_periods: int) -> float:
-        n = periods - io_periods
-        if n <= 0:
-            return 0.0
-        if rate_per_period == 0.0:
-            return self.config.notional / n
-        return self.config.notional * rate_per_period / (1.0 - (1.0 + rate_per_period) ** (-n))
-
-    def _scheduled_principal(
-        self,
-        *,
-        repayment_type: str,
-        i: int,
-        periods: int,
-        interest_only_periods: int,
-        annuity_payment: float,
-        interest_cf: float,
-        const_principal: float,
-        balance: float,
-    ) -> float:
-        if i <= interest_only_periods:
-            return 0.0
-        if repayment_type == "annuity":
-            return max(0.0, annuity_payment - interest_cf)
-        if repayment_type == "constant_repayment":
-            return const_principal
-        if repayment_type == "interest_only_then_amortizing":
-            return balance / max(1, periods - i + 1)
-        raise ValueError("Unsupported repayment_type")
-
-    def _day_count_factor(self, day_count: str, dt: float) -> float:
-        dc = day_count.upper()
-        if dc in {"30/360", "ACT/365"}:
-            return dt
-        raise ValueError("day_count must be one of: 30/360, ACT/365")
+        return level_payment(self.config.notional, rate_per_period, periods - io_periods)
+
+    def _day_count_factor(self, accrual_scale: float, dt: float) -> float:
+        return dt * accrual_scale
+
+
+def portfolio_present_values(generators: list[MortgageCashflowGenerator], model: InterestRateModel) -> np.ndarray:
+    """Per-loan PVs with one ``discount_factors`` call over the pooled payment times."""
+    if not isinstance(model, InterestRateModel):
+        raise TypeError("model must implement InterestRateModel")
+    if not generators:
+        return np.zeros(0, dtype=float)
+    times_parts: list[np.ndarray] = []
+    amount_parts: list[np.ndarray] = []
+    owners: list[np.ndarray] = []
+    for idx, generator in enumerate(generators):
+        times, amounts = generator._generate_totals_only(model)
+        times_parts.append(times)
+        amount_parts.append(amounts)
+        owners.append(np.full(len(times), idx))
+    weighted = np.concatenate(amount_parts) * model.discount_factors(np.concatenate(times_parts))
+    return np.bincount(np.concatenate(owners), weights=weighted, minlength=len(generators))
 
 
 @dataclass(frozen=True)
@@ -300,11 +537,31 @@ class IntegratedMortgageLoan(Product):
             raise TypeError("scenario['model'] must implement InterestRateModel")
         return self.cashflow_generator.generate_schedule(model)
 
+    def detailed_schedule_arrays(
+        self,
+        scenario: dict,
+        as_of_date: str | None = None,
+    ) -> dict[str, np.ndarray]:
+        model = scenario.get("model")
+        if not isinstance(model, InterestRateModel):
+            raise TypeError("scenario['model'] must implement InterestRateModel")
+        return self.cashflow_generator.generate_schedule_arrays(model)
+
     def present_value(self, scenario: dict, as_of_date: str | None = None) -> float:
         model = scenario.get("model")
         if not isinstance(model, InterestRateModel):
             raise TypeError("scenario['model'] must implement InterestRateModel")
-        return sum(cf.amount * model.discount_factor(cf.time) for cf in self.cashflow_generator.generate(model))
+        times, amounts = self.cashflow_generator._generate_totals_only(model)
+        return float(np.dot(amounts, model.discount_factors(times)))
+
+    def get_cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        model = scenario.get("model")
+        if not isinstance(model, InterestRateModel):
+            raise TypeError("scenario['model'] must implement InterestRateModel")
+        return self.cashflow_generator._generate_totals_only(model)
+
+    def _cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        return self.get_cashflow_arrays(scenario, as_of_date)
 
 
 @dataclass(frozen=True)
@@ -321,7 +578,14 @@ class IntegratedGermanFixedRateMortgageLoan(Product):
     prepayment_model: PrepaymentModel | None = None
     start_month: int = 1
 
+    def __post_init__(self) -> None:
+        # Terms are immutable, so one generator serves every valuation call.
+        object.__setattr__(self, "_gen", self._build_generator())
+
     def _generator(self) -> MortgageCashflowGenerator:
+        return self._gen
+
+    def _build_generator(self) -> MortgageCashflowGenerator:
         return MortgageCashflowGenerator(
             config=MortgageConfig(
                 notional=self.notional,
@@ -352,8 +616,28 @@ class IntegratedGermanFixedRateMortgageLoan(Product):
             raise TypeError("scenario['model'] must implement InterestRateModel")
         return self._generator().generate_schedule(model)
 
+    def detailed_schedule_arrays(
+        self,
+        scenario: dict,
+        as_of_date: str | None = None,
+    ) -> dict[str, np.ndarray]:
+        model = scenario.get("model")
+        if not isinstance(model, InterestRateModel):
+            raise TypeError("scenario['model'] must implement InterestRateModel")
+        return self._generator().generate_schedule_arrays(model)
+
     def present_value(self, scenario: dict, as_of_date: str | None = None) -> float:
         model = scenario.get("model")
         if not isinstance(model, InterestRateModel):
             raise TypeError("scenario['model'] must implement InterestRateModel")
-        return sum(cf.amount * model.discount_factor(cf.time) for cf in self._generator().generate(model))
+        times, amounts = self._generator()._generate_totals_only(model)
+        return float(np.dot(amounts, model.discount_factors(times)))
+
+    def get_cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        model = scenario.get("model")
+        if not isinstance(model, InterestRateModel):
+            raise TypeError("scenario['model'] must implement InterestRateModel")
+        return self._generator()._generate_totals_only(model)
+
+    def _cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        return self.get_cashflow_arrays(scenario, as_of_date)
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
 from models.base import InterestRateModel
-from products.base import Cashflow, Product
+from products.base import Cashflow, CashflowArray, Product
 
 
 @dataclass(frozen=True)
@@ -24,35 +26,48 @@ class FixedFloatSwap(Product):
         return self.fixed_leg_cashflows() + self.float_leg_cashflows(model)
 
     def fixed_leg_cashflows(self) -> list[Cashflow]:
+        times, amounts = self._fixed_leg_columns()
+        return CashflowArray(times, amounts).as_cashflows()
+
+    def float_leg_cashflows(self, model: InterestRateModel) -> list[Cashflow]:
+        times, amounts = self._float_leg_columns(model)
+        return CashflowArray(times, amounts).as_cashflows()
+
+    def _fixed_leg_columns(self) -> CashflowArray:
         n_fixed = int(round(self.maturity_years * self.fixed_frequency))
         if n_fixed <= 0:
             raise ValueError("maturity_years and fixed_frequency imply zero periods")
         dt = 1.0 / self.fixed_frequency
-        coupon = self.notional * self.fixed_rate * dt
-        return [Cashflow(time=i * dt, amount=coupon) for i in range(1, n_fixed + 1)]
+        return CashflowArray(np.arange(1, n_fixed + 1) * dt, np.full(n_fixed, self.notional * self.fixed_rate * dt))
 
-    def float_leg_cashflows(self, model: InterestRateModel) -> list[Cashflow]:
+    def _float_leg_columns(self, model: InterestRateModel) -> CashflowArray:
         n_float = int(round(self.maturity_years * self.float_frequency))
         if n_float <= 0:
             raise ValueError("maturity_years and float_frequency imply zero periods")
         dt = 1.0 / self.float_frequency
-        cashflows: list[Cashflow] = []
-        for i in range(1, n_float + 1):
-            t0 = (i - 1) * dt
-            t1 = i * dt
-            fwd = model.forward_rate(t0, t1)
-            amount = self.notional * fwd * dt
-            cashflows.append(Cashflow(time=t1, amount=amount))
-        return cashflows
+        t0 = np.arange(n_float) * dt
+        t1 = np.arange(1, n_float + 1) * dt
+        return CashflowArray(t1, self.notional * model.forward_rates(t0, t1) * dt)
 
     def present_value(self, scenario: dict, as_of_date: str | None = None) -> float:
         model = scenario.get("model")
         if not isinstance(model, InterestRateModel):
             raise TypeError("scenario['model'] must implement InterestRateModel")
+        times, amounts = self._cashflow_arrays(scenario, as_of_date)
+        return float(np.dot(amounts, model.discount_factors(times)))
 
-        pv_fixed = sum(cf.amount * model.discount_factor(cf.time) for cf in self.fixed_leg_cashflows())
-        pv_float = sum(cf.amount * model.discount_factor(cf.time) for cf in self.float_leg_cashflows(model))
-        return float(pv_float - pv_fixed if self.pay_fixed else pv_fixed - pv_float)
+    def _cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        # get_cashflows reports both legs unsigned; PV needs the pay/receive direction.
+        model = scenario.get("model")
+        if not isinstance(model, InterestRateModel):
+            raise TypeError("scenario['model'] must implement InterestRateModel")
+        fixed_times, fixed_amounts = self._fixed_leg_columns()
+        float_times, float_amounts = self._float_leg_columns(model)
+        fixed_sign = -1.0 if self.pay_fixed else 1.0
+        return CashflowArray(
+            np.concatenate((fixed_times, float_times)),
+            np.concatenate((fixed_sign * fixed_amounts, -fixed_sign * float_amounts)),
+        )
 
 
 @dataclass(frozen=True)
@@ -71,31 +86,44 @@ class FloatFloatSwap(Product):
         model = scenario.get("model")
         if not isinstance(model, InterestRateModel):
             raise TypeError("scenario['model'] must implement InterestRateModel")
-        return self._leg_cashflows(model, self.pay_leg_frequency, self.pay_spread, self.pay_leg_sign) + self._leg_cashflows(
-            model, self.receive_leg_frequency, self.receive_spread, -self.pay_leg_sign
-        )
+        return self._both_legs(model)
 
     def present_value(self, scenario: dict, as_of_date: str | None = None) -> float:
         model = scenario.get("model")
         if not isinstance(model, InterestRateModel):
             raise TypeError("scenario['model'] must implement InterestRateModel")
-        return sum(cf.amount * model.discount_factor(cf.time) for cf in self.get_cashflows(scenario, as_of_date))
+        times, amounts = self._both_leg_columns(model)
+        return float(np.dot(amounts, model.discount_factors(times)))
+
+    def _cashflow_arrays(self, scenario: dict, as_of_date: str | None = None) -> CashflowArray:
+        model = scenario.get("model")
+        if not isinstance(model, InterestRateModel):
+            raise TypeError("scenario['model'] must implement InterestRateModel")
+        return self._both_leg_columns(model)
+
+    def _both_legs(self, model: InterestRateModel) -> list[Cashflow]:
+        times, amounts = self._both_leg_columns(model)
+        return CashflowArray(times, amounts).as_cashflows()
+
+    def _both_leg_columns(self, model: InterestRateModel) -> CashflowArray:
+        pay_times, pay_amounts = self._leg_columns(model, self.pay_leg_frequency, self.pay_spread, self.pay_leg_sign)
+        receive_times, receive_amounts = self._leg_columns(
+            model, self.receive_leg_frequency, self.receive_spread, -self.pay_leg_sign
+        )
+        return CashflowArray(np.concatenate((pay_times, receive_times)), np.concatenate((pay_amounts, receive_amounts)))
 
-    def _leg_cashflows(
+    def _leg_columns(
         self,
         model: InterestRateModel,
         frequency: int,
         spread: float,
         sign: int,
-    ) -> list[Cashflow]:
+    ) -> CashflowArray:
         n = int(round(self.maturity_years * frequency))
         if n <= 0:
             raise ValueError("maturity_years and frequency imply zero periods")
         dt = 1.0 / frequency
-        cfs: list[Cashflow] = []
-        for i in range(1, n + 1):
-            t0 = (i - 1) * dt
-            t1 = i * dt
-            fwd = model.forward_rate(t0, t1) + spread
-            cfs.append(Cashflow(time=t1, amount=sign * self.notional * fwd * dt))
-        return cfs
+        t0 = np.arange(n) * dt
+        t1 = np.arange(1, n + 1) * dt
+        fwd = model.forward_rates(t0, t1) + spread
+        return CashflowArray(t1, sign * self.notional * fwd * dt)
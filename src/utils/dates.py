@@ -2,7 +2,39 @@ from __future__ import annotations
 
 from datetime import date
 
+import numpy as np
+
 
 def year_fraction(start: date, end: date) -> float:
     """ACT/365 year fraction."""
     return (end - start).days / 365.0
+
+
+def year_fractions(starts, ends, convention: str = "ACT/365") -> np.ndarray:
+    """Vectorized year fractions between matching date sequences.
+
+    Accepts ``datetime.date`` sequences or ``datetime64`` arrays. Supported conventions are
+    ACT/365, ACT/360 and 30/360 (bond basis).
+    """
+    start_days = np.asarray(starts, dtype="datetime64[D]")
+    end_days = np.asarray(ends, dtype="datetime64[D]")
+    key = convention.upper()
+    if key == "ACT/365":
+        return (end_days - start_days).astype(np.int64) / 365.0
+    if key == "ACT/360":
+        return (end_days - start_days).astype(np.int64) / 360.0
+    if key == "30/360":
+        y1, m1, d1 = _ymd(start_days)
+        y2, m2, d2 = _ymd(end_days)
+        d1 = np.minimum(d1, 30)
+        d2 = np.where(d1 == 30, np.minimum(d2, 30), d2)
+        return (360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)) / 360.0
+    raise ValueError("convention must be one of: ACT/365, ACT/360, 30/360")
+
+
+def _ymd(days: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    months = days.astype("datetime64[M]")
+    years = months.astype("datetime64[Y]")
+    day_of_month = (days - months).astype(np.int64) + 1
+    month_of_year = (months - years).astype(np.int64) + 1
+    return years.astype(np.int64) + 1970, month_of_year, day_of_month
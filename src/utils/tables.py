@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import csv
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+
+def read_csv_columns(path: str | Path) -> tuple[dict[str, Sequence[str]], int]:
+    """Parse a headed CSV into raw string columns and return them with the row count.
+
+    Rows are tokenized with ``csv.reader`` and, like ``csv.DictReader``, blank lines are
+    skipped, short rows are padded with empty cells and extra cells are dropped. Cells are
+    neither stripped nor converted here; the column helpers below do that for the columns a
+    loader actually uses.
+    """
+    with Path(path).open("r", encoding="utf-8", newline="") as f:
+        rows = [row for row in csv.reader(f) if row]
+    if not rows:
+        return {}, 0
+    header = [name.strip() for name in rows[0]]
+    width = len(header)
+    padding = [""] * width
+    body = [row if len(row) == width else (row + padding)[:width] for row in rows[1:]]
+    if not body:
+        return {name: () for name in header}, 0
+    return dict(zip(header, zip(*body))), len(body)
+
+
+def text_column(columns: dict[str, Sequence[str]], n_rows: int, key: str, default: str = "") -> list[str]:
+    """Stripped string column ``key``; missing columns and empty cells map to ``default``."""
+    values = columns.get(key)
+    if values is None:
+        return [default] * n_rows
+    return [value.strip() or default for value in values]
+
+
+def float_column(columns: dict[str, Sequence[str]], n_rows: int, key: str, default: float | None = None) -> np.ndarray:
+    """Float column ``key``; empty cells take ``default`` or raise when it is ``None``."""
+    return _numeric_column(columns, n_rows, key, default, "float")
+
+
+def int_column(columns: dict[str, Sequence[str]], n_rows: int, key: str, default: int | None = None) -> np.ndarray:
+    """Integer column ``key``; values are parsed as floats and truncated like ``int(float(x))``."""
+    return _numeric_column(columns, n_rows, key, default, "int").astype(np.int64)
+
+
+def _numeric_column(
+    columns: dict[str, Sequence[str]],
+    n_rows: int,
+    key: str,
+    default: float | None,
+    kind: str,
+) -> np.ndarray:
+    values = columns.get(key)
+    if values is not None:
+        try:
+            # numpy's string conversion ignores surrounding whitespace, so full columns need no strip.
+            return np.array(values, dtype=float)
+        except ValueError:
+            pass
+        cells = [value.strip() for value in values]
+    else:
+        cells = [""] * n_rows
+    if default is None and "" in cells:
+        raise ValueError(f"Missing required {kind} field: {key}")
+    fill = "" if default is None else repr(float(default))
+    return np.array([cell or fill for cell in cells], dtype=float)
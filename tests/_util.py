@@ -0,0 +1,6 @@
+import math
+
+
+def close(a: float, b: float, rel_tol: float = 1e-12) -> bool:
+    """Relative float comparison via the C-level math.isclose, without pytest.approx objects."""
+    return math.isclose(a, b, rel_tol=rel_tol)
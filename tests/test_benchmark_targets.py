@@ -13,28 +13,30 @@ from products.mortgage_integration import ConstantCPRPrepayment, IntegratedMortg
 from products.swap import FixedFloatSwap, FloatFloatSwap
 
 
-def _curve() -> DeterministicZeroCurve:
+@pytest.fixture(scope="module")
+def targets() -> dict[str, float]:
+    root = Path(__file__).resolve().parents[1]
+    return json.loads((root / "data" / "benchmarks" / "deterministic_valuation_targets.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def curve() -> DeterministicZeroCurve:
     return DeterministicZeroCurve(
         tenors=np.array([0.5, 1.0, 2.0, 5.0, 10.0]),
         zero_rates=np.array([0.02, 0.021, 0.022, 0.024, 0.025]),
     )
 
 
-def _hazard() -> DeterministicHazardCurve:
+@pytest.fixture(scope="module")
+def hazard() -> DeterministicHazardCurve:
     return DeterministicHazardCurve(
         tenors=np.array([1.0, 3.0, 5.0, 10.0]),
         hazard_rates=np.array([0.01, 0.012, 0.013, 0.015]),
     )
 
 
-def test_deterministic_benchmarks_match_targets():
-    root = Path(__file__).resolve().parents[1]
-    targets = json.loads((root / "data" / "benchmarks" / "deterministic_valuation_targets.json").read_text(encoding="utf-8"))
-
-    curve = _curve()
-    hazard = _hazard()
-
-    corporate = CorporateBond(
+def _corporate() -> CorporateBond:
+    return CorporateBond(
         notional=500_000.0,
         maturity_years=5.0,
         coupon_type="fixed",
@@ -43,7 +45,16 @@ def test_deterministic_benchmarks_match_targets():
         amortization_mode="linear",
         annual_cpr=0.03,
     )
-    mortgage = IntegratedMortgageLoan(
+
+
+def _cds() -> CreditDefaultSwap:
+    return CreditDefaultSwap(notional=1_000_000.0, spread_bps=150.0, maturity_years=5.0, payment_frequency=4, recovery_rate=0.4)
+
+
+# Target key -> product factory; products are only built by the cases that use them.
+_PRODUCTS = {
+    "corporate_bond_linear_cpr3": _corporate,
+    "integrated_mortgage_annuity_cpr1": lambda: IntegratedMortgageLoan(
         cashflow_generator=MortgageCashflowGenerator(
             MortgageConfig(
                 notional=280_000.0,
@@ -54,16 +65,16 @@ def test_deterministic_benchmarks_match_targets():
             ),
             prepayment_model=ConstantCPRPrepayment(cpr=0.01),
         )
-    )
-    fixed_swap = FixedFloatSwap(
+    ),
+    "fixed_float_swap": lambda: FixedFloatSwap(
         notional=2_000_000.0,
         fixed_rate=0.029,
         maturity_years=4.0,
         fixed_frequency=2,
         float_frequency=4,
         pay_fixed=True,
-    )
-    float_float = FloatFloatSwap(
+    ),
+    "float_float_swap": lambda: FloatFloatSwap(
         notional=1_000_000.0,
         maturity_years=4.0,
         pay_leg_frequency=4,
@@ -71,9 +82,9 @@ def test_deterministic_benchmarks_match_targets():
         pay_spread=0.001,
         receive_spread=0.0,
         pay_leg_sign=-1,
-    )
-    cds = CreditDefaultSwap(notional=1_000_000.0, spread_bps=150.0, maturity_years=5.0, payment_frequency=4, recovery_rate=0.4)
-    swaption_payer = EuropeanSwaption(
+    ),
+    "cds_ref": _cds,
+    "swaption_payer_ref": lambda: EuropeanSwaption(
         notional=2_000_000.0,
         strike=0.025,
         option_maturity_years=1.0,
@@ -81,8 +92,8 @@ def test_deterministic_benchmarks_match_targets():
         fixed_leg_frequency=1,
         volatility=0.20,
         is_payer=True,
-    )
-    swaption_receiver = EuropeanSwaption(
+    ),
+    "swaption_receiver_ref": lambda: EuropeanSwaption(
         notional=2_000_000.0,
         strike=0.025,
         option_maturity_years=1.0,
@@ -90,24 +101,11 @@ def test_deterministic_benchmarks_match_targets():
         fixed_leg_frequency=1,
         volatility=0.20,
         is_payer=False,
-    )
-    cap = InterestRateCapFloor(notional=1_000_000.0, strike=0.025, maturity_years=3.0, payment_frequency=4, volatility=0.2, is_cap=True)
-
-    assert corporate.present_value({"model": curve}) == pytest.approx(targets["corporate_bond_linear_cpr3"], rel=1e-10)
-    ytm = corporate.yield_to_maturity(targets["corporate_bond_linear_cpr3"], {"model": curve}, compounding="continuous")
-    assert ytm == pytest.approx(targets["corporate_bond_linear_cpr3_ytm_cont"], rel=1e-10)
-    assert mortgage.present_value({"model": curve}) == pytest.approx(targets["integrated_mortgage_annuity_cpr1"], rel=1e-10)
-    assert fixed_swap.present_value({"model": curve}) == pytest.approx(targets["fixed_float_swap"], rel=1e-10)
-    assert float_float.present_value({"model": curve}) == pytest.approx(targets["float_float_swap"], rel=1e-10)
-    legs = cds.leg_present_values({"model": curve, "hazard_curve": hazard})
-    assert cds.present_value({"model": curve, "hazard_curve": hazard}) == pytest.approx(targets["cds_ref"], rel=1e-10)
-    assert legs["premium_leg_pv"] == pytest.approx(targets["cds_premium_leg_ref"], rel=1e-10)
-    assert legs["protection_leg_pv"] == pytest.approx(targets["cds_protection_leg_ref"], rel=1e-10)
-    assert swaption_payer.present_value({"model": curve}) == pytest.approx(targets["swaption_payer_ref"], rel=1e-10)
-    assert swaption_receiver.present_value({"model": curve}) == pytest.approx(targets["swaption_receiver_ref"], rel=1e-10)
-    assert cap.present_value({"model": curve}) == pytest.approx(targets["cap"], rel=1e-10)
-
-    german_loan = GermanFixedRateMortgageLoan(
+    ),
+    "cap": lambda: InterestRateCapFloor(
+        notional=1_000_000.0, strike=0.025, maturity_years=3.0, payment_frequency=4, volatility=0.2, is_cap=True
+    ),
+    "german_mortgage_annuity_behavioural": lambda: GermanFixedRateMortgageLoan(
         notional=350_000.0,
         fixed_rate=0.037,
         maturity_years=15.0,
@@ -127,10 +125,8 @@ def test_deterministic_benchmarks_match_targets():
             max_cpr=0.30,
         ),
         start_month=1,
-    )
-    assert german_loan.present_value({"model": curve}) == pytest.approx(targets["german_mortgage_annuity_behavioural"], rel=1e-10)
-
-    german_const = GermanFixedRateMortgageLoan(
+    ),
+    "german_mortgage_constant_repayment": lambda: GermanFixedRateMortgageLoan(
         notional=250_000.0,
         fixed_rate=0.033,
         maturity_years=8.0,
@@ -139,8 +135,8 @@ def test_deterministic_benchmarks_match_targets():
         interest_only_years=0.0,
         day_count="30/360",
         prepayment_model=None,
-    )
-    german_io = GermanFixedRateMortgageLoan(
+    ),
+    "german_mortgage_interest_only_then_amortizing": lambda: GermanFixedRateMortgageLoan(
         notional=250_000.0,
         fixed_rate=0.033,
         maturity_years=8.0,
@@ -149,8 +145,23 @@ def test_deterministic_benchmarks_match_targets():
         interest_only_years=1.0,
         day_count="30/360",
         prepayment_model=None,
-    )
-    assert german_const.present_value({"model": curve}) == pytest.approx(targets["german_mortgage_constant_repayment"], rel=1e-10)
-    assert german_io.present_value({"model": curve}) == pytest.approx(
-        targets["german_mortgage_interest_only_then_amortizing"], rel=1e-10
-    )
+    ),
+}
+
+
+@pytest.mark.parametrize("target_key", list(_PRODUCTS))
+def test_deterministic_benchmark_pv_matches_target(target_key, targets, curve, hazard):
+    product = _PRODUCTS[target_key]()
+    scenario = {"model": curve, "hazard_curve": hazard}
+    assert product.present_value(scenario) == pytest.approx(targets[target_key], rel=1e-10)
+
+
+def test_corporate_bond_benchmark_yield_matches_target(targets, curve):
+    ytm = _corporate().yield_to_maturity(targets["corporate_bond_linear_cpr3"], {"model": curve}, compounding="continuous")
+    assert ytm == pytest.approx(targets["corporate_bond_linear_cpr3_ytm_cont"], rel=1e-10)
+
+
+def test_cds_benchmark_legs_match_targets(targets, curve, hazard):
+    legs = _cds().leg_present_values({"model": curve, "hazard_curve": hazard})
+    assert legs["premium_leg_pv"] == pytest.approx(targets["cds_premium_leg_ref"], rel=1e-10)
+    assert legs["protection_leg_pv"] == pytest.approx(targets["cds_protection_leg_ref"], rel=1e-10)
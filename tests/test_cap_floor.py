@@ -1,14 +1,18 @@
+import functools
+
 import numpy as np
 
 from models.curve import DeterministicZeroCurve
 from products.derivatives import InterestRateCapFloor
 
 
+_TENORS = np.array([0.5, 1.0, 2.0, 5.0])
+_TENORS.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=64)
 def _curve(rate: float) -> DeterministicZeroCurve:
-    return DeterministicZeroCurve(
-        tenors=np.array([0.5, 1.0, 2.0, 5.0]),
-        zero_rates=np.array([rate, rate, rate, rate]),
-    )
+    return DeterministicZeroCurve(tenors=_TENORS, zero_rates=np.full_like(_TENORS, rate))
 
 
 def test_cap_has_positive_value_when_strike_below_forward():
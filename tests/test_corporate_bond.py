@@ -1,14 +1,18 @@
+import functools
+
 import numpy as np
 
 from models.curve import DeterministicZeroCurve
 from products.corporate_bond import CorporateBond
 
 
+_TENORS = np.array([0.5, 1.0, 2.0, 5.0, 10.0])
+_TENORS.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=64)
 def _flat_curve(rate: float) -> DeterministicZeroCurve:
-    return DeterministicZeroCurve(
-        tenors=np.array([0.5, 1.0, 2.0, 5.0, 10.0]),
-        zero_rates=np.array([rate, rate, rate, rate, rate]),
-    )
+    return DeterministicZeroCurve(tenors=_TENORS, zero_rates=np.full_like(_TENORS, rate))
 
 
 def test_bullet_bond_has_principal_at_maturity():
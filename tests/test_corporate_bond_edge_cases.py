@@ -1,14 +1,19 @@
+import functools
+
 import numpy as np
+import pytest
 
 from models.curve import DeterministicZeroCurve
 from products.corporate_bond import CorporateBond
 
 
+_TENORS = np.array([0.25, 0.5, 1.0, 2.0])
+_TENORS.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=64)
 def _curve(rate: float) -> DeterministicZeroCurve:
-    return DeterministicZeroCurve(
-        tenors=np.array([0.25, 0.5, 1.0, 2.0]),
-        zero_rates=np.array([rate, rate, rate, rate]),
-    )
+    return DeterministicZeroCurve(tenors=_TENORS, zero_rates=np.full_like(_TENORS, rate))
 
 
 def test_zero_coupon_zero_prepayment_bullet_matches_principal_discounted():
@@ -57,3 +62,15 @@ def test_custom_amortization_schedule_applied():
     cfs = bond.get_cashflows({"model": curve})
     principals = [cf.amount for cf in cfs]
     assert principals == list(custom)
+
+
+def test_invalid_interest_only_periods_rejected_at_construction():
+    with pytest.raises(ValueError, match="interest_only_periods"):
+        CorporateBond(
+            notional=100_000.0,
+            maturity_years=1.0,
+            coupon_type="fixed",
+            fixed_rate=0.03,
+            frequency="quarterly",
+            interest_only_periods=4,
+        )
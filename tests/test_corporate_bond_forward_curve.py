@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 
 from models.curve import DeterministicZeroCurve
@@ -5,11 +7,13 @@ from models.market import DeterministicForwardCurve
 from products.corporate_bond import CorporateBond
 
 
+_TENORS = np.array([0.5, 1.0, 2.0, 5.0])
+_TENORS.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=64)
 def _discount_curve(rate: float) -> DeterministicZeroCurve:
-    return DeterministicZeroCurve(
-        tenors=np.array([0.5, 1.0, 2.0, 5.0]),
-        zero_rates=np.array([rate, rate, rate, rate]),
-    )
+    return DeterministicZeroCurve(tenors=_TENORS, zero_rates=np.full_like(_TENORS, rate))
 
 
 def test_floating_corporate_bond_can_use_separate_forward_curve():
@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 import pytest
 
@@ -5,11 +7,13 @@ from models.curve import DeterministicZeroCurve
 from products.corporate_bond import CorporateBond
 
 
+_TENORS = np.array([0.5, 1.0, 2.0, 5.0, 10.0])
+_TENORS.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=64)
 def _curve(rate: float = 0.03) -> DeterministicZeroCurve:
-    return DeterministicZeroCurve(
-        tenors=np.array([0.5, 1.0, 2.0, 5.0, 10.0]),
-        zero_rates=np.array([rate, rate, rate, rate, rate]),
-    )
+    return DeterministicZeroCurve(tenors=_TENORS, zero_rates=np.full_like(_TENORS, rate))
 
 
 def test_ytm_round_trip_from_price_continuous():
@@ -42,3 +46,20 @@ def test_price_decreases_with_higher_yield():
     low_y = bond.price_from_yield(0.01, {"model": curve})
     high_y = bond.price_from_yield(0.06, {"model": curve})
     assert high_y < low_y
+
+
+@pytest.mark.parametrize("compounding", ["continuous", "annual"])
+def test_ytm_round_trip_for_amortizing_bond(compounding: str):
+    curve = _curve(0.03)
+    bond = CorporateBond(
+        notional=500_000.0,
+        maturity_years=5.0,
+        coupon_type="fixed",
+        fixed_rate=0.045,
+        frequency="semi_annual",
+        amortization_mode="linear",
+        annual_cpr=0.03,
+    )
+    for target_price in (0.6 * bond.notional, bond.present_value({"model": curve}), 1.05 * bond.notional):
+        ytm = bond.yield_to_maturity(target_price, {"model": curve}, compounding=compounding)
+        assert bond.price_from_yield(ytm, {"model": curve}, compounding=compounding) == pytest.approx(target_price, rel=1e-12)
@@ -1,16 +1,22 @@
+import functools
+
 import numpy as np
+import pytest
 
 from engine.collateral import CSAConfig, CSADiscountingEngine
 from engine.scenario import Scenario
 from models.curve import DeterministicZeroCurve
+from products.bond import FixedRateBond
 from products.swap import FixedFloatSwap
 
 
+_TENORS = np.array([0.5, 1.0, 2.0, 5.0])
+_TENORS.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=64)
 def _curve(rate: float) -> DeterministicZeroCurve:
-    return DeterministicZeroCurve(
-        tenors=np.array([0.5, 1.0, 2.0, 5.0]),
-        zero_rates=np.array([rate, rate, rate, rate]),
-    )
+    return DeterministicZeroCurve(tenors=_TENORS, zero_rates=np.full_like(_TENORS, rate))
 
 
 def test_csa_engine_reports_unsecured_and_secured_values():
@@ -47,3 +53,26 @@ def test_csa_summary_contains_collateral_impact():
     )
     summary = engine.summarize(results)
     assert set(summary) == {"mean_unsecured_pv", "mean_secured_pv", "mean_collateral_impact"}
+
+
+def test_csa_engine_matches_per_product_repricing():
+    products = [
+        FixedFloatSwap(notional=1_000_000.0, fixed_rate=0.03, maturity_years=3.0, fixed_frequency=2, float_frequency=4),
+        FixedRateBond(notional=500_000.0, coupon_rate=0.04, maturity_years=4.0, coupon_frequency=2),
+        FixedFloatSwap(notional=800_000.0, fixed_rate=0.025, maturity_years=2.0, pay_fixed=False),
+    ]
+    scenario_curve = _curve(0.03)
+    csa_curves = {"ns_a": _curve(0.01), "ns_b": _curve(0.015)}
+    engine = CSADiscountingEngine(products)
+    result = engine.value(
+        scenarios=[Scenario(name="base", model=scenario_curve)],
+        product_to_netting_set={0: "ns_a", 2: "ns_b"},
+        csa_configs={ns: CSAConfig(netting_set_id=ns, discount_model=curve) for ns, curve in csa_curves.items()},
+    )["base"]
+
+    unsecured = [p.present_value({"model": scenario_curve}) for p in products]
+    secured_a = products[0].present_value({"model": csa_curves["ns_a"]})
+    secured_b = products[2].present_value({"model": csa_curves["ns_b"]})
+    assert result.unsecured_pv == pytest.approx(sum(unsecured), rel=1e-12)
+    assert result.secured_pv == pytest.approx(secured_a + unsecured[1] + secured_b, rel=1e-12)
+    assert result.netting_set_secured_pv == pytest.approx({"ns_a": secured_a, "ns_b": secured_b}, rel=1e-12)
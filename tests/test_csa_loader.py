@@ -1,17 +1,23 @@
+import csv
+import functools
 from pathlib import Path
+import timeit
 
 import numpy as np
 import pytest
 
+from engine.collateral import CSAConfig
 from io_layer.loaders import load_csa_configs_csv, load_product_netting_set_map_csv
 from models.curve import DeterministicZeroCurve
 
 
+_TENORS = np.array([0.5, 1.0, 2.0, 5.0])
+_TENORS.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=64)
 def _curve(rate: float) -> DeterministicZeroCurve:
-    return DeterministicZeroCurve(
-        tenors=np.array([0.5, 1.0, 2.0, 5.0]),
-        zero_rates=np.array([rate, rate, rate, rate]),
-    )
+    return DeterministicZeroCurve(tenors=_TENORS, zero_rates=np.full_like(_TENORS, rate))
 
 
 def test_load_product_netting_set_map_csv(tmp_path: Path):
@@ -23,6 +29,13 @@ def test_load_product_netting_set_map_csv(tmp_path: Path):
     assert mapping == {0: "ns_usd", 1: "ns_eur"}
 
 
+def test_load_product_netting_set_map_csv_skips_blank_lines_and_pads_short_rows(tmp_path: Path):
+    path = tmp_path / "product_netting_map.csv"
+    path.write_text("product_index,netting_set_id,comment\n0,ns_usd\n\n1,ns_eur,x\n", encoding="utf-8")
+
+    assert load_product_netting_set_map_csv(path) == {0: "ns_usd", 1: "ns_eur"}
+
+
 def test_load_csa_configs_csv_with_discount_model_lookup(tmp_path: Path):
     csv_content = (
         "netting_set_id,discount_model_key,collateral_rate,threshold,minimum_transfer_amount\n"
@@ -47,3 +60,43 @@ def test_load_csa_configs_csv_rejects_unknown_model_key(tmp_path: Path):
 
     with pytest.raises(ValueError, match="Unknown discount_model_key"):
         load_csa_configs_csv(path, {})
+
+
+def test_csa_loaders_handle_optional_columns_and_header_only_files(tmp_path: Path):
+    path = tmp_path / "csa_configs.csv"
+    path.write_text('netting_set_id,discount_model_key,threshold\n"ns_usd", ois_usd ,\n', encoding="utf-8")
+    cfg = load_csa_configs_csv(path, {"ois_usd": _curve(0.01)})["ns_usd"]
+    assert (cfg.collateral_rate, cfg.threshold, cfg.minimum_transfer_amount) == (0.0, 0.0, 0.0)
+
+    empty = tmp_path / "product_netting_map.csv"
+    empty.write_text("product_index,netting_set_id\n", encoding="utf-8")
+    assert load_product_netting_set_map_csv(empty) == {}
+
+
+def _dict_reader_csa_configs(path: Path, discount_models: dict) -> dict[str, CSAConfig]:
+    """Row-by-row csv.DictReader loader that the column-wise loader replaced."""
+    configs: dict[str, CSAConfig] = {}
+    with path.open("r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            netting_set_id = row["netting_set_id"].strip()
+            configs[netting_set_id] = CSAConfig(
+                netting_set_id=netting_set_id,
+                discount_model=discount_models[row["discount_model_key"].strip()],
+                collateral_rate=float(row["collateral_rate"].strip() or 0.0),
+                threshold=float(row["threshold"].strip() or 0.0),
+                minimum_transfer_amount=float(row["minimum_transfer_amount"].strip() or 0.0),
+            )
+    return configs
+
+
+def test_column_wise_csa_loader_is_faster_than_dict_reader(tmp_path: Path):
+    path = tmp_path / "csa_large.csv"
+    lines = ["netting_set_id,discount_model_key,collateral_rate,threshold,minimum_transfer_amount"]
+    lines += [f"ns_{i},ois,0.0{i % 9},{i * 10}.5,1000" for i in range(20_000)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    models = {"ois": _curve(0.02)}
+
+    assert load_csa_configs_csv(path, models) == _dict_reader_csa_configs(path, models)
+    column_wise = min(timeit.repeat(lambda: load_csa_configs_csv(path, models), number=1, repeat=5))
+    dict_reader = min(timeit.repeat(lambda: _dict_reader_csa_configs(path, models), number=1, repeat=5))
+    assert column_wise < dict_reader
@@ -1,7 +1,9 @@
 import numpy as np
 import pytest
 
+from engine.scenario import curve_cache
 from models.curve import DeterministicZeroCurve
+from products.base import CachedModel
 
 
 def test_discount_factor_is_one_at_zero():
@@ -18,3 +20,70 @@ def test_discount_factor_decreases_with_time_for_positive_rates():
         zero_rates=np.array([0.02, 0.03]),
     )
     assert curve.discount_factor(5.0) < curve.discount_factor(1.0)
+
+
+def test_vectorized_discount_factors_match_scalar():
+    curve = DeterministicZeroCurve(
+        tenors=np.array([1.0, 5.0]),
+        zero_rates=np.array([0.02, 0.03]),
+    )
+    times = np.array([0.0, 0.5, 1.0, 2.5, 5.0, 7.0])
+    expected = [curve.discount_factor(t) for t in times]
+    assert curve.discount_factors(times).tolist() == pytest.approx(expected, rel=1e-15)
+
+
+def test_vectorized_forward_rates_match_scalar():
+    curve = DeterministicZeroCurve(
+        tenors=np.array([1.0, 5.0]),
+        zero_rates=np.array([0.02, 0.03]),
+    )
+    t0 = np.array([0.0, 0.5, 2.0, 4.5])
+    t1 = np.array([0.5, 1.0, 5.0, 6.0])
+    expected = [curve.forward_rate(a, b) for a, b in zip(t0, t1)]
+    assert curve.forward_rates(t0, t1).tolist() == pytest.approx(expected, rel=1e-14)
+
+
+def test_cached_model_reuses_discount_factors():
+    curve = DeterministicZeroCurve(
+        tenors=np.array([1.0, 5.0]),
+        zero_rates=np.array([0.02, 0.03]),
+    )
+    cached = CachedModel(curve)
+    assert cached.discount_factor(2.5) == curve.discount_factor(2.5)
+    assert cached.forward_rate(1.0, 2.5) == curve.forward_rate(1.0, 2.5)
+    assert sorted(cached._dfs) == [1.0, 2.5]
+
+
+def test_scalar_zero_rate_table_matches_np_interp():
+    tenors = np.array([0.25, 1.0, 3.0, 7.0, 30.0])
+    zero_rates = np.array([0.015, 0.02, 0.018, 0.027, 0.031])
+    curve = DeterministicZeroCurve(tenors=tenors, zero_rates=zero_rates)
+    times = np.concatenate([np.linspace(0.0, 35.0, 141), tenors])
+    assert [curve.short_rate(t) for t in times.tolist()] == np.interp(times, tenors, zero_rates).tolist()
+
+
+def test_curve_cache_shares_discount_factor_arrays_within_block():
+    curve = DeterministicZeroCurve(
+        tenors=np.array([1.0, 5.0]),
+        zero_rates=np.array([0.02, 0.03]),
+    )
+    times = np.array([0.5, 1.0, 2.0])
+    with curve_cache({"model": curve, "name": "base"}) as data:
+        cached = data["model"]
+        first = cached.discount_factors(times)
+        assert cached.discount_factors(times.copy()) is first
+        assert not first.flags.writeable
+        np.testing.assert_array_equal(first, curve.discount_factors(times))
+    assert cached._df_arrays == {}
+
+
+def test_curve_is_immutable_and_hashable():
+    tenors = np.array([1.0, 2.0, 5.0])
+    curve = DeterministicZeroCurve(tenors=tenors, zero_rates=np.array([0.01, 0.02, 0.03]))
+    tenors[0] = 0.5
+    assert curve.tenors[0] == 1.0
+    with pytest.raises(ValueError):
+        curve.zero_rates[0] = 0.0
+    twin = DeterministicZeroCurve(tenors=np.array([1.0, 2.0, 5.0]), zero_rates=np.array([0.01, 0.02, 0.03]))
+    assert curve == twin and hash(curve) == hash(twin)
+    assert len({curve, twin, DeterministicZeroCurve(tenors=twin.tenors, zero_rates=twin.zero_rates + 0.01)}) == 2
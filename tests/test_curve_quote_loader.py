@@ -23,6 +23,20 @@ def test_load_curve_quotes_csv_and_bootstrap(tmp_path: Path):
     assert diag.max_abs_fit_error < 1e-3
 
 
+def test_load_curve_quotes_csv_accepts_short_rows_and_blank_lines(tmp_path: Path):
+    p = tmp_path / "quotes.csv"
+    p.write_text(
+        "instrument_type,tenor_years,rate,fixed_frequency\n"
+        "deposit,1.0,0.02\n"
+        "\n"
+        "swap,2.0,0.021,2,extra\n",
+        encoding="utf-8",
+    )
+    deposits, swaps = load_curve_quotes_csv(p)
+    assert [(q.tenor_years, q.simple_rate) for q in deposits] == [(1.0, 0.02)]
+    assert [(q.maturity_years, q.par_rate, q.fixed_frequency) for q in swaps] == [(2.0, 0.021, 2)]
+
+
 def test_load_curve_quotes_csv_rejects_unknown_instrument(tmp_path: Path):
     p = tmp_path / "bad.csv"
     p.write_text(
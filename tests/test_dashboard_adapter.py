@@ -13,6 +13,8 @@ from analytics.dashboard import (
     maturity_bucket,
 )
 from io_layer.loaders import load_zero_curve_csv
+from products.amortization import level_payment
+from products.mortgage import BehaviouralPrepaymentModel, GermanFixedRateMortgageLoan
 from products.mortgage_integration import (
     CleanRoomBehaviouralPrepayment,
     IntegratedGermanFixedRateMortgageLoan,
@@ -37,7 +39,7 @@ def test_dashboard_portfolio_loader_returns_ids_and_metadata():
 def test_instrument_cashflow_drilldown_contains_components():
     curve, instruments = _load_inputs()
     scenario = make_parallel_shift_scenario(curve, 0.0)
-    mort = next(i for i in instruments if i.instrument_id == "MORT-DE-001")
+    mort = instruments.by_id["MORT-DE-001"]
     rows = instrument_cashflow_rows(mort, scenario)
     assert len(rows) > 0
     assert set(rows[0].keys()) == {
@@ -119,3 +121,62 @@ def test_dashboard_drilldown_supports_integrated_german_cleanroom_mortgage():
     assert len(rows) > 0
     assert rows[0]["scheduled_amortization"] >= 0.0
     assert rows[0]["prepayment"] >= 0.0
+
+
+class _AnnualCPROnly:
+    """Prepayment model exposing only the scalar ``annual_cpr`` hook."""
+
+    def __init__(self, model: BehaviouralPrepaymentModel) -> None:
+        self._model = model
+
+    def annual_cpr(self, fixed_rate, refinance_rate, age_years, maturity_years, month_index):
+        return self._model.cpr(fixed_rate, refinance_rate, age_years, maturity_years, month_index)
+
+
+def _behavioural_item(prepayment_model) -> DashboardInstrument:
+    loan = GermanFixedRateMortgageLoan(
+        notional=250_000.0,
+        fixed_rate=0.04,
+        maturity_years=5.0,
+        repayment_type="annuity",
+        payment_frequency="monthly",
+        prepayment_model=prepayment_model,
+        start_month=4,
+    )
+    return DashboardInstrument(instrument_id="MORT-BEH-001", product_type="german_fixed_rate_mortgage", product=loan)
+
+
+def test_behavioural_mortgage_drilldown_matches_per_period_scalar_cprs():
+    curve, _ = _load_inputs()
+    scenario = make_parallel_shift_scenario(curve, 0.0)
+    prepayment = BehaviouralPrepaymentModel()
+    rows = instrument_cashflow_rows(_behavioural_item(prepayment), scenario)
+
+    dt = 1.0 / 12.0
+    rate = 0.04 * dt
+    payment = level_payment(250_000.0, rate, 60)
+    balance = 250_000.0
+    for i, row in enumerate(rows):
+        age = i * dt
+        month = (3 + i) % 12 + 1
+        cpr = prepayment.cpr(0.04, scenario["model"].forward_rate(age, 5.0), age, 5.0, month)
+        smm = 1.0 - (1.0 - max(0.0, cpr)) ** dt
+        interest = balance * rate
+        scheduled = min(balance, max(0.0, payment - interest))
+        prepay = (balance - scheduled) * smm
+        balance = balance - scheduled - prepay
+        assert row["interest"] == pytest.approx(interest, rel=1e-12)
+        assert row["scheduled_amortization"] == pytest.approx(scheduled, rel=1e-12)
+        assert row["prepayment"] == pytest.approx(prepay, rel=1e-12)
+        assert row["outstanding_balance"] == pytest.approx(balance, rel=1e-12, abs=1e-6)
+
+
+def test_drilldown_falls_back_to_scalar_annual_cpr_models():
+    curve, _ = _load_inputs()
+    scenario = make_parallel_shift_scenario(curve, 0.0)
+    prepayment = BehaviouralPrepaymentModel()
+    vectorized = instrument_cashflow_rows(_behavioural_item(prepayment), scenario)
+    scalar = instrument_cashflow_rows(_behavioural_item(_AnnualCPROnly(prepayment)), scenario)
+    assert len(scalar) == len(vectorized)
+    for got, expected in zip(scalar, vectorized):
+        assert got == pytest.approx(expected, rel=1e-12, abs=1e-9)
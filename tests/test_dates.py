@@ -0,0 +1,22 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from utils.dates import year_fraction, year_fractions
+
+
+def test_year_fractions_match_scalar_act_365():
+    starts = [date(2024, 1, 1), date(2024, 2, 29), date(2023, 12, 31)]
+    ends = [date(2024, 7, 1), date(2025, 2, 28), date(2026, 6, 30)]
+    expected = [year_fraction(s, e) for s, e in zip(starts, ends)]
+    assert year_fractions(starts, ends).tolist() == pytest.approx(expected, rel=1e-15)
+
+
+def test_year_fractions_act_360_and_30_360():
+    starts = np.array(["2024-01-31", "2024-02-15"], dtype="datetime64[D]")
+    ends = np.array(["2024-03-31", "2024-08-15"], dtype="datetime64[D]")
+    assert year_fractions(starts, ends, "ACT/360").tolist() == pytest.approx([60 / 360, 182 / 360])
+    assert year_fractions(starts, ends, "30/360").tolist() == pytest.approx([60 / 360, 180 / 360])
+    with pytest.raises(ValueError, match="convention"):
+        year_fractions(starts, ends, "ACT/ACT")
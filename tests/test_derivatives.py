@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 import pytest
 
@@ -6,11 +8,13 @@ from models.market import DeterministicFXCurve, DeterministicHazardCurve
 from products.derivatives import CreditDefaultSwap, EuropeanSwaption, FXForward, FXSwap
 
 
+_TENORS = np.array([0.5, 1.0, 2.0, 5.0, 10.0])
+_TENORS.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=64)
 def _curve(rate: float = 0.02) -> DeterministicZeroCurve:
-    return DeterministicZeroCurve(
-        tenors=np.array([0.5, 1.0, 2.0, 5.0, 10.0]),
-        zero_rates=np.array([rate, rate, rate, rate, rate]),
-    )
+    return DeterministicZeroCurve(tenors=_TENORS, zero_rates=np.full_like(_TENORS, rate))
 
 
 def test_fx_forward_positive_when_forward_above_strike():
@@ -1,15 +1,20 @@
+import functools
+
 import numpy as np
 import pytest
 
 from models.curve import DeterministicZeroCurve
-from products.derivatives import FXSwap
+from products.base import portfolio_pv
+from products.derivatives import FXSwap, FXSwapBatch
+
 
+_TENORS = np.array([0.5, 1.0, 2.0, 5.0])
+_TENORS.setflags(write=False)
 
+
+@functools.lru_cache(maxsize=64)
 def _curve(rate: float) -> DeterministicZeroCurve:
-    return DeterministicZeroCurve(
-        tenors=np.array([0.5, 1.0, 2.0, 5.0]),
-        zero_rates=np.array([rate, rate, rate, rate]),
-    )
+    return DeterministicZeroCurve(tenors=_TENORS, zero_rates=np.full_like(_TENORS, rate))
 
 
 def test_fx_swap_implied_far_rate_matches_interest_parity_formula():
@@ -64,3 +69,18 @@ def test_fx_swap_implied_far_rate_supports_broken_dates():
         domestic.discount_factor(far) / domestic.discount_factor(near)
     )
     assert implied_far == pytest.approx(expected_far, rel=1e-12)
+
+
+def test_fx_swap_batch_matches_single_trade_valuation():
+    scenario = {"model": _curve(0.03), "foreign_model": _curve(0.01)}
+    swaps = (
+        FXSwap(notional_foreign=1_000_000.0, near_rate=1.10, far_rate=None, near_maturity_years=0.25, far_maturity_years=1.3),
+        FXSwap(notional_foreign=500_000.0, near_rate=1.08, far_rate=1.09, near_maturity_years=0.0, far_maturity_years=0.5),
+        FXSwap(notional_foreign=2_000_000.0, near_rate=1.12, far_rate=None, near_maturity_years=0.5, far_maturity_years=2.0, pay_foreign_receive_domestic=False),
+    )
+    batch = FXSwapBatch(swaps)
+    expected = [swap.present_value(scenario) for swap in swaps]
+    assert batch.present_values(scenario) == pytest.approx(expected, rel=1e-14)
+    assert batch.present_value(scenario) == pytest.approx(sum(expected), rel=1e-14)
+    assert batch.far_rates(scenario)[1] == 1.09
+    assert portfolio_pv(list(swaps), scenario) == pytest.approx(expected, rel=1e-14)
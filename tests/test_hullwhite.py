@@ -26,3 +26,28 @@ def test_hull_white_zcb_price_at_maturity_is_one():
     )
     model = HullWhiteModel(a=0.1, sigma=0.01, initial_curve=curve)
     assert model.zcb_price(2.0, 2.0) == pytest.approx(1.0)
+
+
+def test_hull_white_simulation_draws_from_pinned_pcg64dxsm_stream():
+    curve = DeterministicZeroCurve(
+        tenors=np.array([0.5, 1.0, 2.0, 5.0]),
+        zero_rates=np.array([0.02, 0.021, 0.022, 0.024]),
+    )
+    model = HullWhiteModel(a=0.1, sigma=0.01, initial_curve=curve)
+    paths = model.simulate_short_rate_paths(horizon_years=1.0, n_steps=12, n_paths=5, seed=7)
+    z = np.random.Generator(np.random.PCG64DXSM(7)).standard_normal((12, 5))
+    drift = (model._theta(0.0) - model.a * model.short_rate(0.0)) / 12.0
+    assert np.allclose(paths[:, 1] - paths[:, 0], drift + 0.01 * np.sqrt(1.0 / 12.0) * z[0], rtol=0.0, atol=1e-15)
+
+
+def test_hull_white_antithetic_paths_mirror_shocks():
+    curve = DeterministicZeroCurve(
+        tenors=np.array([0.5, 1.0, 2.0, 5.0]),
+        zero_rates=np.array([0.02, 0.021, 0.022, 0.024]),
+    )
+    model = HullWhiteModel(a=0.1, sigma=0.01, initial_curve=curve)
+    paths = model.simulate_short_rate_paths(horizon_years=1.0, n_steps=12, n_paths=6, seed=3, antithetic=True)
+    drift = (model._theta(0.0) - model.a * model.short_rate(0.0)) / 12.0
+    first_steps = paths[:, 1] - paths[:, 0] - drift
+    assert paths.shape == (6, 13)
+    assert np.allclose(first_steps[:3], -first_steps[3:], rtol=0.0, atol=1e-15)
@@ -1,12 +1,14 @@
 from pathlib import Path
 
 import numpy as np
+import pytest
 
 from engine.scenario import Scenario
 from engine.valuation import ValuationEngine
-from io_layer.loaders import load_mixed_portfolio_csv
+from io_layer.loaders import load_fixed_bond_portfolio_csv, load_mixed_portfolio_csv
 from models.curve import DeterministicZeroCurve
 from models.market import DeterministicFXCurve
+from products.bond import FixedRateBond
 from products.derivatives import FXForward
 
 
@@ -33,6 +35,32 @@ def test_loader_supports_integrated_german_mortgage(tmp_path: Path):
     assert portfolio[0].__class__.__name__ == "IntegratedGermanFixedRateMortgageLoan"
 
 
+def test_loader_skips_blank_rows_and_rejects_unknown_product_type(tmp_path: Path):
+    path = tmp_path / "portfolio.csv"
+    path.write_text(
+        "product_type,notional,coupon_or_fixed_rate,maturity_years\n"
+        ",100000,0.03,2\n"
+        "\n"
+        "Fixed_Bond,100000,0.03,2,ignored\n",
+        encoding="utf-8",
+    )
+    portfolio = load_mixed_portfolio_csv(path)
+    assert [p.__class__.__name__ for p in portfolio] == ["FixedRateBond"]
+
+    path.write_text("product_type,notional\nbarrier_option,100000\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Unsupported product_type: barrier_option"):
+        load_mixed_portfolio_csv(path)
+
+
+def test_fixed_bond_loader_reads_typed_columns(tmp_path: Path):
+    path = tmp_path / "bonds.csv"
+    path.write_text("id,notional,coupon_rate,maturity_years,coupon_frequency\nB1,1000000,0.03,3,2\nB2,750000,0.028,5,1\n", encoding="utf-8")
+    assert load_fixed_bond_portfolio_csv(path) == [
+        FixedRateBond(notional=1_000_000.0, coupon_rate=0.03, maturity_years=3.0, coupon_frequency=2),
+        FixedRateBond(notional=750_000.0, coupon_rate=0.028, maturity_years=5.0, coupon_frequency=1),
+    ]
+
+
 def test_engine_supports_scenario_extra_data_for_fx_products():
     curve = DeterministicZeroCurve(
         tenors=np.array([0.5, 1.0, 2.0]),
@@ -0,0 +1,59 @@
+import functools
+
+import numpy as np
+import pytest
+
+from models.curve import DeterministicZeroCurve
+from models.market import DeterministicForwardCurve, DeterministicFXCurve, DeterministicHazardCurve
+
+
+@functools.lru_cache(maxsize=1)
+def _fx_curve() -> DeterministicFXCurve:
+    return DeterministicFXCurve(
+        tenors=np.array([0.5, 1.0, 2.0, 5.0]),
+        fx_forwards=np.array([1.10, 1.11, 1.13, 1.20]),
+    )
+
+
+def test_fx_forward_interpolates_linearly_and_extrapolates_flat():
+    fx = _fx_curve()
+    assert fx.fx_forward(0.0) == pytest.approx(1.10)
+    assert fx.fx_forward(0.25) == pytest.approx(1.10)
+    assert fx.fx_forward(1.0) == pytest.approx(1.11)
+    assert fx.fx_forward(1.5) == pytest.approx(1.12)
+    assert fx.fx_forward(10.0) == pytest.approx(1.20)
+
+
+def test_fx_forwards_vec_matches_scalar_lookup():
+    fx = _fx_curve()
+    ts = np.array([0.0, 0.3, 0.5, 0.75, 1.0, 3.3, 5.0, 7.0])
+    expected = np.array([fx.fx_forward(float(t)) for t in ts])
+    assert np.allclose(fx.fx_forwards_vec(ts), expected, rtol=1e-14, atol=0.0)
+
+
+def test_market_curves_store_contiguous_read_only_node_copies():
+    grid = np.array([0.5, 0.0, 1.0, 0.0, 2.0, 0.0, 5.0])
+    tenors = grid[::2]
+    assert not tenors.flags.c_contiguous
+    hazard = DeterministicHazardCurve(tenors=tenors, hazard_rates=np.array([1, 2, 2, 3]))
+    assert hazard.tenors.flags.c_contiguous and not hazard.tenors.flags.writeable
+    assert hazard.hazard_rates.dtype == np.float64
+    grid[0] = 0.25
+    assert hazard.tenors[0] == 0.5
+
+
+def test_curve_queries_accept_time_arrays():
+    times = np.array([0.0, 0.25, 0.75, 1.5, 3.0, 7.0])
+    hazard = DeterministicHazardCurve(tenors=np.array([0.5, 1.0, 2.0, 5.0]), hazard_rates=np.array([0.01, 0.012, 0.013, 0.015]))
+    fx = _fx_curve()
+    zero = DeterministicZeroCurve(tenors=np.array([0.5, 1.0, 2.0, 5.0]), zero_rates=np.array([0.02, 0.021, 0.022, 0.024]))
+    forward = DeterministicForwardCurve(tenors=np.array([0.5, 1.0, 2.0, 5.0]), forward_rates=np.array([0.02, 0.022, 0.025, 0.03]))
+    for query in (
+        hazard.hazard_rate,
+        hazard.survival_probability,
+        fx.fx_forward,
+        zero.short_rate,
+        zero.discount_factor,
+        forward.forward_rate,
+    ):
+        assert query(times) == pytest.approx([query(float(t)) for t in times], rel=1e-14)
@@ -1,15 +1,20 @@
+import functools
+
 import numpy as np
 import pytest
 
 from models.curve import DeterministicZeroCurve
+from products.amortization import level_payment
 from products.mortgage import BehaviouralPrepaymentModel, GermanFixedRateMortgageLoan
 
 
+_TENORS = np.array([1.0, 5.0, 10.0, 20.0, 30.0])
+_TENORS.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=64)
 def _flat_curve(rate: float = 0.02) -> DeterministicZeroCurve:
-    return DeterministicZeroCurve(
-        tenors=np.array([1.0, 5.0, 10.0, 20.0, 30.0]),
-        zero_rates=np.array([rate, rate, rate, rate, rate]),
-    )
+    return DeterministicZeroCurve(tenors=_TENORS, zero_rates=np.full_like(_TENORS, rate))
 
 
 def test_annuity_cashflows_decline_with_amortization():
@@ -118,3 +123,50 @@ def test_prepayments_reduce_total_pv_for_lender():
     )
     curve = _flat_curve(0.02)
     assert with_prepay.present_value({"model": curve}) < no_prepay.present_value({"model": curve})
+
+
+def test_vectorized_cpr_matches_scalar_cpr():
+    model = BehaviouralPrepaymentModel(base_cpr=0.02)
+    refinance = np.array([0.01, 0.025, 0.03, 0.06])
+    ages = np.array([0.0, 1.5, 4.0, 12.0])
+    months = np.array([1, 6, 11, 12])
+    vec = model.cpr_vec(
+        fixed_rate=0.035,
+        refinance_rates=refinance,
+        age_years=ages,
+        maturity_years=10.0,
+        month_indices=months,
+    )
+    expected = [
+        model.cpr(fixed_rate=0.035, refinance_rate=r, age_years=a, maturity_years=10.0, month_index=int(m))
+        for r, a, m in zip(refinance, ages, months)
+    ]
+    assert np.allclose(vec, expected, rtol=1e-14, atol=0.0)
+
+
+def test_invalid_conventions_rejected_at_construction():
+    with pytest.raises(ValueError, match="payment_frequency"):
+        GermanFixedRateMortgageLoan(notional=100.0, fixed_rate=0.03, maturity_years=5.0, payment_frequency="weekly")
+    with pytest.raises(ValueError, match="day_count"):
+        GermanFixedRateMortgageLoan(notional=100.0, fixed_rate=0.03, maturity_years=5.0, day_count="ACT/360")
+    with pytest.raises(ValueError, match="repayment_type"):
+        GermanFixedRateMortgageLoan(notional=100.0, fixed_rate=0.03, maturity_years=5.0, repayment_type="balloon")
+
+
+@pytest.mark.parametrize("month_index", [0, 13])
+def test_behavioural_cpr_rejects_month_outside_calendar(month_index: int):
+    model = BehaviouralPrepaymentModel()
+    with pytest.raises(ValueError, match="month_index"):
+        model.cpr(0.03, 0.02, 1.0, 10.0, month_index)
+    with pytest.raises(ValueError, match="month_index"):
+        model.cpr_vec(0.03, np.array([0.02]), np.array([1.0]), 10.0, np.array([month_index]))
+
+
+def test_level_payment_amortizes_notional_exactly():
+    payment = level_payment(100_000.0, 0.003, 120)
+    balance = 100_000.0
+    for _ in range(120):
+        balance = balance * 1.003 - payment
+    assert balance == pytest.approx(0.0, abs=1e-6)
+    assert level_payment(1_200.0, 0.0, 12) == 100.0
+    assert level_payment(1_200.0, 0.01, 0) == 0.0
@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 import pytest
 
@@ -10,14 +12,17 @@ from products.mortgage_integration import (
     IntegratedMortgageLoan,
     MortgageCashflowGenerator,
     MortgageConfig,
+    portfolio_present_values,
 )
 
 
+_TENORS = np.array([1.0, 5.0, 10.0, 20.0])
+_TENORS.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=64)
 def _curve(rate: float = 0.02) -> DeterministicZeroCurve:
-    return DeterministicZeroCurve(
-        tenors=np.array([1.0, 5.0, 10.0, 20.0]),
-        zero_rates=np.array([rate, rate, rate, rate]),
-    )
+    return DeterministicZeroCurve(tenors=_TENORS, zero_rates=np.full_like(_TENORS, rate))
 
 
 def test_integrated_mortgage_matches_existing_annuity_without_prepayment():
@@ -86,6 +91,79 @@ def test_integrated_mortgage_cashflow_parity_across_repayment_types(repayment_ty
     assert integrated.present_value({"model": curve}) == pytest.approx(existing.present_value({"model": curve}), rel=1e-8)
 
 
+@pytest.mark.parametrize(
+    ("notional", "fixed_rate", "maturity_years", "repayment_type", "payment_frequency", "interest_only_years"),
+    [
+        (1_000_000.0, 0.011, 10.0, "annuity", "monthly", 0.0),
+        (250_000.0, 0.033, 8.0, "annuity", "quarterly", 1.0),
+        (3_300_000.0, 0.07, 25.0, "constant_repayment", "monthly", 2.0),
+        (100_000.0, 0.0, 5.0, "interest_only_then_amortizing", "annual", 1.0),
+    ],
+)
+def test_no_prepayment_schedule_ends_like_zero_cpr_and_existing_loan(
+    notional: float,
+    fixed_rate: float,
+    maturity_years: float,
+    repayment_type: str,
+    payment_frequency: str,
+    interest_only_years: float,
+):
+    scenario = {"model": _curve(0.02)}
+    terms = dict(
+        notional=notional,
+        fixed_rate=fixed_rate,
+        maturity_years=maturity_years,
+        repayment_type=repayment_type,
+        payment_frequency=payment_frequency,
+        interest_only_years=interest_only_years,
+    )
+    without_model = IntegratedGermanFixedRateMortgageLoan(**terms).get_cashflows(scenario)
+    zero_cpr = IntegratedGermanFixedRateMortgageLoan(**terms, prepayment_model=ConstantCPRPrepayment(0.0)).get_cashflows(scenario)
+    existing = GermanFixedRateMortgageLoan(**terms).get_cashflows(scenario)
+    assert without_model == zero_cpr
+    assert len(without_model) == len(existing)
+    for got, expected in zip(without_model, existing):
+        assert got.time == expected.time
+        assert got.amount == pytest.approx(expected.amount, rel=1e-10, abs=1e-10)
+
+
+@pytest.mark.parametrize(
+    ("repayment_type", "interest_only_years"),
+    [
+        ("annuity", 0.0),
+        ("constant_repayment", 0.0),
+        ("interest_only_then_amortizing", 1.0),
+    ],
+)
+def test_integrated_mortgage_without_prepayment_model_matches_existing(repayment_type: str, interest_only_years: float):
+    curve = _curve(0.02)
+    existing = GermanFixedRateMortgageLoan(
+        notional=250000.0,
+        fixed_rate=0.033,
+        maturity_years=8.0,
+        repayment_type=repayment_type,
+        payment_frequency="monthly",
+        interest_only_years=interest_only_years,
+        prepayment_model=None,
+    )
+    integrated = IntegratedMortgageLoan(
+        cashflow_generator=MortgageCashflowGenerator(
+            MortgageConfig(
+                notional=250000.0,
+                fixed_rate=0.033,
+                maturity_years=8.0,
+                repayment_type=repayment_type,
+                payment_frequency="monthly",
+                interest_only_years=interest_only_years,
+            ),
+            prepayment_model=None,
+        )
+    )
+    assert integrated.present_value({"model": curve}) == pytest.approx(existing.present_value({"model": curve}), rel=1e-8)
+    schedule = integrated.detailed_schedule({"model": curve})
+    assert sum(row.scheduled_principal for row in schedule) == pytest.approx(250000.0, rel=1e-10)
+
+
 def test_integrated_cleanroom_behavioural_prepayment_matches_german_model():
     curve = _curve(0.02)
     params = dict(
@@ -209,3 +287,113 @@ def test_integrated_wrapper_exposes_detailed_schedule():
     assert len(schedule) > 0
     assert schedule[0].period_index == 1
     assert schedule[0].begin_balance == pytest.approx(180_000.0, rel=1e-12)
+
+
+def test_detailed_schedule_arrays_match_schedule_rows():
+    curve = _curve(0.02)
+    loan = IntegratedGermanFixedRateMortgageLoan(
+        notional=150_000.0,
+        fixed_rate=0.036,
+        maturity_years=4.0,
+        prepayment_model=CleanRoomBehaviouralPrepayment(base_cpr=0.02),
+        start_month=7,
+    )
+    rows = loan.detailed_schedule({"model": curve})
+    arrays = loan.detailed_schedule_arrays({"model": curve})
+
+    assert len(arrays["t1"]) == len(rows)
+    for name, column in arrays.items():
+        assert column.tolist() == [getattr(row, name) for row in rows]
+
+
+def test_batch_annual_cpr_matches_scalar_annual_cpr():
+    model = CleanRoomBehaviouralPrepayment(base_cpr=0.02)
+    refinance = np.array([0.01, 0.025, 0.03, 0.06])
+    ages = np.array([0.0, 1.5, 4.0, 12.0])
+    months = np.array([1, 6, 11, 12])
+    batch = model.batch_annual_cpr(
+        fixed_rate=0.035,
+        refinance_rates=refinance,
+        age_years=ages,
+        maturity_years=10.0,
+        month_indices=months,
+    )
+    expected = [
+        model.annual_cpr(fixed_rate=0.035, refinance_rate=r, age_years=a, maturity_years=10.0, month_index=int(m))
+        for r, a, m in zip(refinance, ages, months)
+    ]
+    assert np.allclose(batch, expected, rtol=1e-14, atol=0.0)
+
+
+def test_mortgage_config_validates_on_construction():
+    with pytest.raises(ValueError, match="payment_frequency"):
+        MortgageConfig(notional=100.0, fixed_rate=0.03, maturity_years=5.0, payment_frequency="weekly")
+    with pytest.raises(ValueError, match="day_count"):
+        MortgageConfig(notional=100.0, fixed_rate=0.03, maturity_years=5.0, day_count="ACT/360")
+    with pytest.raises(ValueError, match="repayment_type"):
+        MortgageConfig(notional=100.0, fixed_rate=0.03, maturity_years=5.0, repayment_type="balloon")
+    assert MortgageConfig(notional=100.0, fixed_rate=0.03, maturity_years=5.0, day_count="act/365")._day_count_key == "ACT/365"
+
+
+def test_full_prepayment_terminates_schedule_after_first_period():
+    generator = MortgageCashflowGenerator(
+        MortgageConfig(notional=100_000.0, fixed_rate=0.03, maturity_years=5.0),
+        prepayment_model=ConstantCPRPrepayment(cpr=1.0),
+    )
+    schedule = generator.generate_schedule(_curve())
+    assert len(schedule) == 1
+    assert schedule[0].scheduled_principal + schedule[0].prepayment == pytest.approx(100_000.0, rel=1e-12)
+    assert schedule[0].end_balance == 0.0
+
+
+def test_portfolio_present_values_match_per_loan_pvs():
+    curve = _curve(0.025)
+    generators = [
+        MortgageCashflowGenerator(MortgageConfig(notional=100_000.0, fixed_rate=0.03, maturity_years=5.0)),
+        MortgageCashflowGenerator(
+            MortgageConfig(notional=200_000.0, fixed_rate=0.032, maturity_years=6.0, repayment_type="constant_repayment"),
+            prepayment_model=ConstantCPRPrepayment(cpr=0.05),
+        ),
+        MortgageCashflowGenerator(
+            MortgageConfig(notional=300_000.0, fixed_rate=0.034, maturity_years=7.0, payment_frequency="quarterly"),
+            prepayment_model=CleanRoomBehaviouralPrepayment(),
+        ),
+    ]
+    pvs = portfolio_present_values(generators, curve)
+    expected = [IntegratedMortgageLoan(cashflow_generator=g).present_value({"model": curve}) for g in generators]
+    assert pvs.tolist() == pytest.approx(expected, rel=1e-12)
+    assert portfolio_present_values([], curve).shape == (0,)
+
+
+def test_no_prepayment_schedule_is_shared_across_scenarios():
+    generator = MortgageCashflowGenerator(MortgageConfig(notional=100_000.0, fixed_rate=0.03, maturity_years=5.0))
+    low = generator.generate_schedule_arrays(_curve(0.01))
+    high = generator.generate_schedule_arrays(_curve(0.05))
+    for name in ("t1", "total_cashflow", "end_balance"):
+        np.testing.assert_array_equal(low[name], high[name])
+    low["total_cashflow"][0] = 0.0
+    assert high["total_cashflow"][0] > 0.0
+
+
+def test_constant_cpr_schedule_is_resolved_at_construction():
+    class _CurveAwareConstantCPR(ConstantCPRPrepayment):
+        """Subclass, so the generator takes the per-scenario path."""
+
+    config = MortgageConfig(notional=150_000.0, fixed_rate=0.03, maturity_years=8.0, interest_only_years=1.0)
+    for cpr in (0.0, 0.04):
+        fast = MortgageCashflowGenerator(config, prepayment_model=ConstantCPRPrepayment(cpr=cpr))
+        slow = MortgageCashflowGenerator(config, prepayment_model=_CurveAwareConstantCPR(cpr=cpr))
+        for rate in (0.01, 0.05):
+            expected = slow.generate_schedule_arrays(_curve(rate))
+            actual = fast.generate_schedule_arrays(_curve(rate))
+            assert all(np.array_equal(actual[key], expected[key]) for key in expected)
+
+
+def test_behavioural_models_share_one_seasonality_array():
+    german = BehaviouralPrepaymentModel()
+    clean_room = CleanRoomBehaviouralPrepayment()
+    assert german._season_offsets is clean_room._seasonality_excess
+    assert not clean_room._seasonality_excess.flags.writeable
+    cpr = german.cpr(0.03, 0.02, 1.0, 10.0, 11)
+    assert type(cpr) is float
+    assert cpr == clean_room.annual_cpr(fixed_rate=0.03, refinance_rate=0.02, age_years=1.0, maturity_years=10.0, month_index=11)
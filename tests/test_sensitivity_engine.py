@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 
 from engine.sensitivity import DeterministicSensitivityEngine
@@ -7,11 +9,13 @@ from products.bond import FixedRateBond
 from products.derivatives import CreditDefaultSwap, FXForward
 
 
+_TENORS = np.array([0.5, 1.0, 2.0, 5.0])
+_TENORS.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=64)
 def _curve(rate: float) -> DeterministicZeroCurve:
-    return DeterministicZeroCurve(
-        tenors=np.array([0.5, 1.0, 2.0, 5.0]),
-        zero_rates=np.array([rate, rate, rate, rate]),
-    )
+    return DeterministicZeroCurve(tenors=_TENORS, zero_rates=np.full_like(_TENORS, rate))
 
 
 def test_dv01_for_fixed_rate_bond_is_negative():
@@ -1,16 +1,33 @@
+import functools
+
 import numpy as np
+import pytest
 
 from engine.scenario import Scenario
-from engine.valuation import ValuationEngine
+from engine.valuation import ValuationEngine, ValuationResult
 from models.curve import DeterministicZeroCurve
+from models.market import DeterministicFXCurve, DeterministicHazardCurve
+from products.base import CashflowArray, CashflowTimeGrid, portfolio_pv
 from products.bond import FixedRateBond
+from products.callable_bond import CallableFixedRateBond
+from products.derivatives import (
+    CreditDefaultSwap,
+    CrossCurrencySwap,
+    EuropeanSwaption,
+    FXForward,
+    FXSwap,
+    InterestRateCapFloor,
+)
+from products.swap import FixedFloatSwap
+
+
+_TENORS = np.array([1.0, 3.0, 5.0])
+_TENORS.setflags(write=False)
 
 
+@functools.lru_cache(maxsize=64)
 def _curve(rate: float) -> DeterministicZeroCurve:
-    return DeterministicZeroCurve(
-        tenors=np.array([1.0, 3.0, 5.0]),
-        zero_rates=np.array([rate, rate, rate]),
-    )
+    return DeterministicZeroCurve(tenors=_TENORS, zero_rates=np.full_like(_TENORS, rate))
 
 
 def test_expected_shortfall_is_at_least_var():
@@ -26,6 +43,16 @@ def test_expected_shortfall_is_at_least_var():
     assert es >= var
 
 
+def test_risk_measures_match_unsorted_quantile_definitions():
+    pvs = np.random.default_rng(7).normal(100.0, 5.0, 257).round(1)
+    result = ValuationResult(scenario_pv={"parallel_shift_+0bps": 101.0}, portfolio_pv_distribution=pvs)
+    for confidence in (0.5, 0.9, 0.99):
+        losses = 101.0 - pvs
+        var = np.quantile(losses, confidence)
+        assert result.pvat_risk(confidence) == 101.0 - np.quantile(pvs, 1.0 - confidence)
+        assert result.expected_shortfall(confidence) == pytest.approx(np.mean(losses[losses >= var]), rel=1e-14)
+
+
 def test_value_with_contributions_sums_to_total():
     products = [
         FixedRateBond(notional=800_000.0, coupon_rate=0.03, maturity_years=3.0, coupon_frequency=2),
@@ -61,3 +88,80 @@ def test_risk_profile_contains_requested_confidences():
     assert "0.9500" in profile
     assert "0.9900" in profile
     assert profile["0.9900"]["expected_shortfall"] >= profile["0.9900"]["pvat_risk"]
+
+
+def test_portfolio_pv_matches_product_present_values():
+    curve = _curve(0.02)
+    products = [
+        FixedRateBond(notional=1_000_000.0, coupon_rate=0.03, maturity_years=3.0, coupon_frequency=2),
+        FixedFloatSwap(notional=500_000.0, fixed_rate=0.025, maturity_years=4.0, pay_fixed=True),
+        FixedFloatSwap(notional=500_000.0, fixed_rate=0.025, maturity_years=4.0, pay_fixed=False),
+        InterestRateCapFloor(notional=250_000.0, strike=0.02, maturity_years=2.0),
+    ]
+    scenario = {"model": curve}
+    pvs = portfolio_pv(products, scenario)
+    expected = [p.present_value(scenario) for p in products]
+    assert pvs.tolist() == pytest.approx(expected, rel=1e-12, abs=1e-8)
+
+
+def test_portfolio_pv_batches_only_discounted_sum_products():
+    scenario = {
+        "model": _curve(0.02),
+        "foreign_model": _curve(0.01),
+        "fx_curve": DeterministicFXCurve(tenors=np.array([0.5, 1.0, 3.0]), fx_forwards=np.array([1.10, 1.11, 1.13])),
+        "hazard_curve": DeterministicHazardCurve(tenors=np.array([1.0, 5.0]), hazard_rates=np.array([0.01, 0.015])),
+    }
+    batched = [
+        FXForward(notional_foreign=1_000_000.0, strike=1.08, maturity_years=1.0),
+        FXSwap(notional_foreign=500_000.0, near_rate=1.10, far_rate=None, near_maturity_years=0.5, far_maturity_years=1.0),
+        CreditDefaultSwap(notional=2_000_000.0, spread_bps=120.0, maturity_years=3.0),
+        CrossCurrencySwap(domestic_notional=1_100_000.0, foreign_notional=1_000_000.0, maturity_years=3.0),
+    ]
+    priced = [
+        EuropeanSwaption(notional=1_000_000.0, strike=0.02, option_maturity_years=1.0, swap_tenor_years=3.0),
+        InterestRateCapFloor(notional=250_000.0, strike=0.02, maturity_years=2.0),
+        CallableFixedRateBond(notional=100.0, coupon_rate=0.04, maturity_years=3.0, call_schedule=((2.0, 100.0),)),
+    ]
+    assert all(p._cashflow_arrays(scenario) is not None for p in batched)
+    assert all(p._cashflow_arrays(scenario) is None for p in priced)
+    products = batched + priced
+    pvs = portfolio_pv(products, scenario)
+    expected = [p.present_value(scenario) for p in products]
+    assert pvs.tolist() == pytest.approx(expected, rel=1e-12, abs=1e-8)
+
+
+def test_cashflow_array_round_trips_cashflow_lists():
+    bond = FixedRateBond(notional=100.0, coupon_rate=0.05, maturity_years=3.0, coupon_frequency=2)
+    cashflows = bond.get_cashflows({})
+    arrays = CashflowArray.from_cashflows(cashflows)
+    assert arrays.as_cashflows() == cashflows
+    assert arrays == CashflowArray(arrays.times.copy(), arrays.amounts.copy())
+    assert arrays != CashflowArray(arrays.times, arrays.amounts * 2.0)
+    times, amounts = arrays
+    assert times.shape == amounts.shape == (6,)
+
+
+def test_get_cashflow_arrays_matches_get_cashflows():
+    scenario = {"model": _curve(0.02)}
+    products = [
+        FixedRateBond(notional=1_000_000.0, coupon_rate=0.03, maturity_years=3.0, coupon_frequency=2),
+        FixedFloatSwap(notional=500_000.0, fixed_rate=0.025, maturity_years=4.0, pay_fixed=True),
+        InterestRateCapFloor(notional=250_000.0, strike=0.02, maturity_years=2.0),
+    ]
+    for product in products:
+        assert product.get_cashflow_arrays(scenario) == CashflowArray.from_cashflows(product.get_cashflows(scenario))
+
+
+def test_cashflow_time_grid_reuses_unique_times_across_scenarios():
+    products = [
+        FixedRateBond(notional=1_000_000.0, coupon_rate=0.03, maturity_years=3.0, coupon_frequency=2),
+        FixedRateBond(notional=400_000.0, coupon_rate=0.04, maturity_years=2.0, coupon_frequency=2),
+        FixedFloatSwap(notional=500_000.0, fixed_rate=0.025, maturity_years=4.0, pay_fixed=True),
+    ]
+    grid = CashflowTimeGrid()
+    for rate in (0.01, 0.02, 0.03):
+        scenario = {"model": _curve(rate)}
+        assert portfolio_pv(products, scenario, time_grid=grid).tolist() == pytest.approx(
+            portfolio_pv(products, scenario).tolist(), rel=1e-14
+        )
+    assert grid._nodes is not None and len(grid._nodes) < len(grid._times)